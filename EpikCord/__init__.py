@@ -24,10 +24,12 @@ from .application import *
 from .auto_moderation import *
 from .channels import *
 from .client import *
+from .cluster import *
 from .close_event_codes import *
 from .colour import *
 from .commands import *
 from .components import *
+from .converters import *
 from .exceptions import *
 from .flags import *
 from .guild import *
@@ -39,6 +41,7 @@ from .message import *
 from .opcodes import *
 from .options import *
 from .partials import *
+from .permissions import *
 from .presence import *
 from .rtp_handler import *
 from .sharding import *
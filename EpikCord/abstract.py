@@ -6,7 +6,7 @@ import struct
 from abc import abstractmethod
 from importlib.util import find_spec
 from logging import getLogger
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar, Union
 
 from aiohttp import ClientWebSocketResponse
 
@@ -21,6 +21,7 @@ from .opcodes import GatewayOpcode, VoiceOpcode
 from .type_enums import AllowedMentionTypes
 
 logger = getLogger("EpikCord.channels")
+T = TypeVar("T")
 
 _NACL = find_spec("nacl")
 
@@ -51,12 +52,84 @@ if TYPE_CHECKING:
         MessagePayload,
         Modal,
         Overwrite,
+        User,
         VoiceChannel,
     )
 
     from .components import *
 
 
+def raw_payload(client: Client, data: T) -> Optional[T]:
+    """What a model should keep as its ``data``, the payload it was built
+    from unless the client was made with ``keep_payloads=False``."""
+    return data if getattr(client, "keep_payloads", True) else None
+
+
+class lazy_field:
+    """A model field that's decoded from its part of the payload the first
+    time it's read, for fields that are costly to build and seldom read.
+
+    The model keeps the raw parts in a ``_pending`` dict, keyed by field
+    name, and declares a ``_<name>`` slot for the decoded value. Assigning
+    to the field stores the value as it is.
+    """
+
+    __slots__ = ("decode", "name", "slot")
+
+    def __init__(self, decode: Callable[[Any, Any], Any]):
+        self.decode: Callable[[Any, Any], Any] = decode
+        self.name: str = decode.__name__
+        self.slot: str = f"_{decode.__name__}"
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+        self.slot = f"_{name}"
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            pass
+
+        value = self.decode(obj, obj._pending.get(self.name))
+        setattr(obj, self.slot, value)
+        obj._pending.pop(self.name, None)
+        return value
+
+    def __set__(self, obj: Any, value: Any):
+        setattr(obj, self.slot, value)
+        obj._pending.pop(self.name, None)
+
+    def defer(self, obj: Any, raw: Any):
+        """Replace the field's value with ``raw``, to decode on the next read."""
+        obj._pending[self.name] = raw
+        try:
+            delattr(obj, self.slot)
+        except AttributeError:
+            pass
+
+
+class LazyFields:
+    # Empty so models can mix this in, they declare ``_pending`` and a slot
+    # for each of their lazy fields.
+    __slots__ = ()
+
+    def __copy__(self):
+        # A copy sharing ``_pending`` would decode fields out from under us.
+        cls = type(self)
+        copied = cls.__new__(cls)
+        for klass in cls.__mro__:
+            for key in getattr(klass, "__slots__", ()):
+                try:
+                    setattr(copied, key, getattr(self, key))
+                except AttributeError:
+                    pass  # Not decoded yet.
+        copied._pending = dict(self._pending)
+        return copied
+
+
 class TypingContextManager:
     def __init__(self, client: Client, channel_id):
         self.typing: Optional[asyncio.Task] = None
@@ -76,6 +149,9 @@ class TypingContextManager:
 
 
 class Messageable:
+    # Empty so channels can mix this in, subclasses declare ``id`` and ``client``.
+    __slots__ = ()
+
     def __init__(self, client: Client, channel_id: int):
         self.id: int = int(channel_id)
         self.client = client
@@ -86,7 +162,7 @@ class Messageable:
         response = await self.client.http.get(
             f"/channels/{self.id}/pins", channel_id=self.id
         )
-        data = await response.json()
+        data = response.data
         return [Message(self.client, message) for message in data]
 
     async def fetch_messages(
@@ -103,7 +179,7 @@ class Messageable:
             f"channels/{self.id}/messages",
             params={"around": around, "before": before, "after": after, "limit": limit},
         )
-        data = await response.json()
+        data = response.data
         return [Message(self.client, message) for message in data]
 
     async def fetch_message(self, *, message_id: str) -> Message:
@@ -112,7 +188,7 @@ class Messageable:
         response = await self.client.http.get(
             f"channels/{self.id}/messages/{message_id}"
         )
-        data = await response.json()
+        data = response.data
         return Message(self.client, data)
 
     async def send(
@@ -149,7 +225,7 @@ class Messageable:
         response = await self.client.http.post(
             f"channels/{self.id}/messages", json=payload
         )
-        data = await response.json()
+        data = response.data
         return Message(self.client, data)
 
     async def typing(self) -> TypingContextManager:
@@ -176,17 +252,27 @@ class BaseCommand:
 
 
 class BaseChannel:
+    __slots__ = ("id", "client", "type", "data", "last_message_id")
+
     def __init__(self, client: Client, data: discord_typings.ChannelData):
         self.id: int = int(data["id"])
         self.client = client
         self.type: int = data["type"]
-        self.data: discord_typings.ChannelData = data
+        self.data: Optional[discord_typings.ChannelData] = raw_payload(client, data)
         self.last_message_id: Optional[int] = (
             int(data["last_message_id"]) if data["last_message_id"] else None
         )
 
+    def _update(self, data: discord_typings.ChannelData):
+        """Update this channel in place from a CHANNEL_UPDATE. Those carry the
+        whole channel, so it's read again, but the object itself is kept."""
+        self.__init__(self.client, data)  # type: ignore
+
 
 class Connectable:
+    # Empty so voice channels can mix this in, they declare the connection state.
+    __slots__ = ()
+
     def __init__(
         self,
         client: Client,
@@ -394,10 +480,10 @@ class BaseComponent:
 
 class BaseInteraction:
     def __init__(self, client: Client, data):
-        from EpikCord import GuildMember, User
+        from EpikCord import GuildMember
 
         self.id: int = int(data["id"])
-        self.data: discord_typings.InteractionData = data
+        self.data: Optional[discord_typings.InteractionData] = raw_payload(client, data)
         self.client = client
         self.type: int = data["type"]
         self.application_id: int = int(data["application_id"])
@@ -409,7 +495,7 @@ class BaseInteraction:
         self.author: Optional[Union[User, GuildMember]] = (
             GuildMember(client, data.get("member"))
             if data.get("member")
-            else User(client, data.get("user"))
+            else client.users.store(data["user"])
             if data.get("user")
             else None
         )
@@ -501,10 +587,10 @@ class BaseInteraction:
         if not skip_cache and self.original_response:
             return self.original_response
 
-        message_data = await self.client.http.get(
+        response = await self.client.http.get(
             f"/webhooks/{self.application_id}/{self.token}/messages/@original"
         )
-        self.original_response = Message(self.client, message_data)
+        self.original_response = Message(self.client, response.data)
         return self.original_response
 
     async def edit_original_response(
@@ -542,11 +628,11 @@ class BaseInteraction:
                 attachment.to_dict() for attachment in attachments
             ]
 
-        new_message_data = await self.client.http.patch(
+        response = await self.client.http.patch(
             f"/webhooks/{self.application_id}/{self.token}/messages/@original",
             json=message_data,
         )
-        self.original_response = Message(self.client, new_message_data)
+        self.original_response = Message(self.client, response.data)
         return self.original_response
 
     async def delete_original_response(self):
@@ -592,7 +678,7 @@ class BaseInteraction:
         response = await self.client.http.post(
             f"/webhooks/{self.application_id}/{self.token}", json=message_data
         )
-        new_message_data = await response.json()
+        new_message_data = response.data
         self.followup_response = Message(self.client, new_message_data)
         return self.followup_response
 
@@ -41,10 +41,9 @@ class ApplicationCommand:
             if data.get("options")
             else None
         )
+        permissions = data.get("default_member_permissions")
         self.default_member_permissions: Optional[Permissions] = (
-            Permissions(int(data["default_member_permissions"]))  # type: ignore
-            if data.get("default_member_permissions")
-            else None
+            Permissions.from_value(int(permissions)) if permissions else None
         )
         self.version: int = int(data["version"])
         self.name_localizations: Optional[List[Localization]] = [Localization(Locale(k), v) for (k, v) in data["name_localizations"].items()] if data.get("name_localizations") else None  # type: ignore
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 
 
 class Overwrite:
+    __slots__ = ("id", "type", "allow", "deny")
+
     def __init__(self, data: discord_typings.PermissionOverwriteData):
         self.id: int = int(data["id"])
         self.type: int = data["type"]
@@ -29,6 +31,15 @@ class Overwrite:
 
 
 class BaseGuildChannel(BaseChannel):
+    __slots__ = (
+        "guild_id",
+        "guild",
+        "position",
+        "permission_overwrites",
+        "name",
+        "nsfw",
+    )
+
     def __init__(
         self,
         client: Client,
@@ -58,13 +69,13 @@ class BaseGuildChannel(BaseChannel):
         response = await self.client.http.delete(
             f"/channels/{self.id}", channel_id=self.id, reason=reason
         )
-        return await response.json()
+        return response.data
 
     async def fetch_invites(self):
         response = await self.client.http.get(
             f"/channels/{self.id}/invites", channel_id=self.id
         )
-        return await response.json()
+        return response.data
 
     async def create_invite(
         self,
@@ -97,10 +108,13 @@ class BaseGuildChannel(BaseChannel):
         response = await self.client.http.delete(
             f"/channels/{self.id}/permissions/{overwrites.id}", channel_id=self.id
         )
-        return await response.json()
+        return response.data
 
 
 class CommonFieldsTextAndNews(Messageable):
+    # Empty so it can be mixed in, GuildTextChannel and NewsChannel declare its fields.
+    __slots__ = ()
+
     def __init__(
         self,
         client: Client,
@@ -115,10 +129,19 @@ class CommonFieldsTextAndNews(Messageable):
         self.default_auto_archive_duration: Optional[int] = data.get(
             "default_auto_archive_duration"
         )
-        self.flags: ChannelFlags = ChannelFlags(data["flags"])
+        self.flags: ChannelFlags = ChannelFlags.from_value(data["flags"])
 
 
 class GuildTextChannel(BaseGuildChannel, CommonFieldsTextAndNews):
+    __slots__ = (
+        "topic",
+        "parent_id",
+        "last_pin_timestamp",
+        "default_auto_archive_duration",
+        "flags",
+        "rate_limit_per_user",
+    )
+
     def __init__(self, client: Client, data: discord_typings.TextChannelData):
         super().__init__(client, data)
         CommonFieldsTextAndNews.__init__(self, client, data)
@@ -126,6 +149,14 @@ class GuildTextChannel(BaseGuildChannel, CommonFieldsTextAndNews):
 
 
 class NewsChannel(BaseGuildChannel, CommonFieldsTextAndNews):
+    __slots__ = (
+        "topic",
+        "parent_id",
+        "last_pin_timestamp",
+        "default_auto_archive_duration",
+        "flags",
+    )
+
     def __init__(self, client: Client, data: discord_typings.NewsChannelData):
         super().__init__(client, data)
         CommonFieldsTextAndNews.__init__(self, client, data)
@@ -135,16 +166,30 @@ GuildAnnouncementChannel = NewsChannel
 
 
 class DMChannel(Messageable):
+    __slots__ = ("id", "client", "recipients", "last_pin_timestamp", "flags")
+
     def __init__(self, client: Client, data: discord_typings.DMChannelData):
         super().__init__(client, int(data["id"]))
         self.recipients: List[User] = [
             User(client, user) for user in data["recipients"]
         ]
         self.last_pin_timestamp: Optional[datetime.datetime] = datetime.datetime.fromisoformat(data["last_pin_timestamp"]) if data.get("last_pin_timestamp") else None  # type: ignore
-        self.flags: ChannelFlags = ChannelFlags(data["flags"])
+        self.flags: ChannelFlags = ChannelFlags.from_value(data["flags"])
 
 
 class GroupDMChannel(Messageable):
+    __slots__ = (
+        "id",
+        "client",
+        "name",
+        "recipients",
+        "icon",
+        "owner_id",
+        "application_id",
+        "last_pin_timestamp",
+        "flags",
+    )
+
     def __init__(self, client: Client, data: discord_typings.GroupDMChannelData):
         super().__init__(client, int(data["id"]))
         self.name: str = data["name"]
@@ -157,13 +202,41 @@ class GroupDMChannel(Messageable):
             int(data["application_id"]) if data["application_id"] else None
         )
         self.last_pin_timestamp: Optional[datetime.datetime] = datetime.datetime.fromisoformat(data["last_pin_timestamp"]) if data.get("last_pin_timestamp") else None  # type: ignore
-        self.flags: ChannelFlags = ChannelFlags(data["flags"])
+        self.flags: ChannelFlags = ChannelFlags.from_value(data["flags"])
 
 
 class VoiceChannel(BaseGuildChannel, Connectable):
+    __slots__ = (
+        "bitrate",
+        "user_limit",
+        "parent_id",
+        "last_pin_timestamp",
+        "rtc_region",
+        "video_quality_mode",
+        "flags",
+        # Connectable
+        "channel_id",
+        "_closed",
+        "token",
+        "session_id",
+        "endpoint",
+        "socket",
+        "ws",
+        "heartbeat_interval",
+        "server_ip",
+        "server_port",
+        "ssrc",
+        "mode",
+        "secret_key",
+        "ip",
+        "port",
+    )
+
     def __init__(self, client: Client, data: discord_typings.VoiceChannelData):
         super().__init__(client, data)
-        Connectable.__init__(self, client, channel=self)
+        # Updating in place mustn't drop a voice connection.
+        if not hasattr(self, "_closed"):
+            Connectable.__init__(self, client, channel=self)
         self.bitrate: int = data["bitrate"]
         self.user_limit: int = data["user_limit"]
         self.parent_id: Optional[int] = (
@@ -172,15 +245,28 @@ class VoiceChannel(BaseGuildChannel, Connectable):
         self.last_pin_timestamp: Optional[datetime.datetime] = datetime.datetime.fromisoformat(data["last_pin_timestamp"]) if data.get("last_pin_timestamp") else None  # type: ignore
         self.rtc_region: Optional[str] = data["rtc_region"]
         self.video_quality_mode: Optional[int] = data.get("video_quality_mode")
-        self.flags: ChannelFlags = ChannelFlags(data["flags"])
+        self.flags: ChannelFlags = ChannelFlags.from_value(data["flags"])
 
 
 class CategoryChannel(BaseGuildChannel):
+    __slots__ = ("flags",)
+
     def __init__(self, client: Client, data: discord_typings.CategoryChannelData):
-        self.flags: ChannelFlags = ChannelFlags(data["flags"])
+        super().__init__(client, data)
+        self.flags: ChannelFlags = ChannelFlags.from_value(data["flags"])
 
 
 class ForumChannel(BaseGuildChannel):
+    __slots__ = (
+        "topic",
+        "rate_limit_per_user",
+        "default_auto_archive_duration",
+        "flags",
+        "default_reaction_emoji",
+        "default_thread_rate_limit_per_user",
+        "default_sort_order",
+    )
+
     def __init__(self, client: Client, data: discord_typings.ForumChannelData):
         super().__init__(client, data)
         self.topic: Optional[str] = data["topic"]
@@ -188,7 +274,7 @@ class ForumChannel(BaseGuildChannel):
         self.default_auto_archive_duration: Optional[int] = data.get(
             "default_auto_archive_duration"
         )
-        self.flags: ChannelFlags = ChannelFlags(data["flags"])
+        self.flags: ChannelFlags = ChannelFlags.from_value(data["flags"])
         self.default_reaction_emoji: Optional[
             discord_typings.DefaultReactionData
         ] = data.get("default_reaction_emoji")
@@ -201,6 +287,31 @@ class ForumChannel(BaseGuildChannel):
 
 
 class GuildStageChannel(BaseGuildChannel, Connectable):
+    __slots__ = (
+        "bitrate",
+        "user_limit",
+        "parent_id",
+        "last_pin_timestamp",
+        "rtc_region",
+        "video_quality_mode",
+        # Connectable
+        "channel_id",
+        "_closed",
+        "token",
+        "session_id",
+        "endpoint",
+        "socket",
+        "ws",
+        "heartbeat_interval",
+        "server_ip",
+        "server_port",
+        "ssrc",
+        "mode",
+        "secret_key",
+        "ip",
+        "port",
+    )
+
     def __init__(
         self,
         client: Client,
@@ -209,7 +320,9 @@ class GuildStageChannel(BaseGuildChannel, Connectable):
         ],
     ):
         super().__init__(client, data)
-        Connectable.__init__(self, client, channel=self)
+        # Updating in place mustn't drop a voice connection.
+        if not hasattr(self, "_closed"):
+            Connectable.__init__(self, client, channel=self)
         self.bitrate: int = data["bitrate"]
         self.user_limit: int = data["user_limit"]
         self.parent_id: Optional[int] = (
@@ -1,8 +1,14 @@
+from .cache_snapshot import *
 from .client import *
 from .client_application import *
 from .client_user import *
 from .command_handler import *
+from .command_sync import *
+from .compression import *
+from .dispatcher import *
+from .etf import *
 from .http_client import *
 from .sections import *
+from .session_store import *
 from .user_client import *
 from .websocket_client import *
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+from logging import getLogger
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+
+from .http_client import json
+
+if TYPE_CHECKING:
+    from .websocket_client import WebsocketClient
+
+logger = getLogger(__name__)
+
+MAGIC = b"EPCS\x01"
+_LENGTH = struct.Struct(">I")
+
+
+def _dumps(value: Any) -> bytes:
+    data = json.dumps(value)
+    return data if isinstance(data, bytes) else data.encode()
+
+
+class CacheSnapshot:
+    """Saves a client's guild and channel caches to disk and loads them back
+    on startup, so a restarted client can answer from cache straight away
+    instead of waiting for every GUILD_CREATE.
+
+    Guilds are saved as :meth:`Guild.to_dict` gives them, with their roles
+    and members as they are now, and channels as their payloads. Nothing is
+    saved for a client made with ``keep_payloads=False``.
+    A snapshot is written every ``interval`` seconds and on closing, to one
+    file per shard in ``directory``. Each file is :data:`MAGIC`, then
+    records of a 4 byte big endian length and a JSON document. The first
+    record is a header, the rest are ``[kind, payload]`` pairs.
+
+    The client still resumes from its session's sequence, events the
+    snapshot missed before the session was saved aren't replayed, so they
+    aren't dispatched twice. The default ``interval`` is well within
+    :attr:`SessionStore.max_age`, any session that can still be resumed was
+    saved at most that long after the snapshot.
+
+    Parameters
+    ----------
+    directory : Union[str, os.PathLike]
+        Where to keep the snapshots, created when first needed.
+    interval : float
+        How often, in seconds, to save a snapshot while connected. Keep it
+        below :attr:`SessionStore.max_age`.
+    max_age : Optional[float]
+        Ignore snapshots older than this many seconds.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike] = ".cache",
+        *,
+        interval: float = 60.0,
+        max_age: Optional[float] = None,
+    ):
+        self.directory: Path = Path(directory)
+        self.interval: float = interval
+        self.max_age: Optional[float] = max_age
+
+    def _path(self, client: WebsocketClient) -> Path:
+        return self.directory / f"{client.session_key}.cache"
+
+    @staticmethod
+    def _records(client: WebsocketClient) -> Iterator[List[Any]]:
+        from EpikCord import Guild
+
+        # Guilds first, channels look their guild up when they're built.
+        for guild in client.guilds.values():
+            if isinstance(guild.data, dict):
+                # The guild as it is now, events since its GUILD_CREATE
+                # aren't replayed on resuming.
+                yield [
+                    "guild",
+                    guild.to_dict() if isinstance(guild, Guild) else guild.data,
+                ]
+        for channel in client.channels.values():
+            if isinstance(channel.data, dict):
+                yield ["channel", channel.data]
+
+    def dump(self, client: WebsocketClient) -> bytes:
+        header = {
+            "session_id": client.session_id,
+            "sequence": client.sequence,
+            "saved_at": time(),
+        }
+        out = bytearray(MAGIC)
+
+        for record in (header, *self._records(client)):
+            try:
+                encoded = _dumps(record)
+            except TypeError:
+                logger.debug(f"Couldn't snapshot {record!r:.100}.")
+                continue
+            out += _LENGTH.pack(len(encoded))
+            out += encoded
+
+        return bytes(out)
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+
+    async def save(self, client: WebsocketClient):
+        # Serialise here, the models must not change under us, then write
+        # on a thread so a big snapshot doesn't block the event loop.
+        data = self.dump(client)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, self._path(client), data
+        )
+        logger.info(f"Saved a {len(data)} byte cache snapshot.")
+
+    @staticmethod
+    def parse(data: bytes) -> Iterator[Any]:
+        """Yields each record of a snapshot, stopping at the first broken one."""
+        if not data.startswith(MAGIC):
+            return
+
+        view = memoryview(data)
+        offset = len(MAGIC)
+        while offset + _LENGTH.size <= len(view):
+            (length,) = _LENGTH.unpack_from(view, offset)
+            start = offset + _LENGTH.size
+            offset = start + length
+            if offset > len(view):
+                logger.warning("Cache snapshot is truncated, ignoring the rest.")
+                return
+            yield json.loads(bytes(view[start:offset]))
+
+    def restore(self, client: WebsocketClient, data: bytes) -> int:
+        """Fill ``client``'s caches from a snapshot, returns how many objects."""
+        from EpikCord import Guild, UnavailableGuild
+
+        records = self.parse(data)
+        header: Optional[Dict[str, Any]] = next(records, None)
+        if not header:
+            return 0
+
+        if self.max_age is not None and time() - header["saved_at"] > self.max_age:
+            return 0
+
+        restored = 0
+        for kind, payload in records:
+            try:
+                if kind == "guild":
+                    guild = (
+                        UnavailableGuild(payload)
+                        if payload.get("unavailable")
+                        else Guild(client, payload)
+                    )
+                    client.guilds.add_to_cache(guild.id, guild)
+                elif kind == "channel":
+                    channel = client.utils.channel_from_type(payload)
+                    client.channels.add_to_cache(channel.id, channel)
+                else:
+                    continue
+            except Exception:
+                logger.exception(f"Couldn't restore a {kind} from the cache snapshot.")
+                continue
+            restored += 1
+
+        return restored
+
+    async def load(self, client: WebsocketClient) -> int:
+        """Fill ``client``'s caches from its snapshot on disk, if there's one."""
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(
+                None, self._path(client).read_bytes
+            )
+        except OSError:
+            return 0
+
+        restored = self.restore(client, data)
+        logger.info(f"Restored {restored} objects from the cache snapshot.")
+        return restored
+
+    async def run(self, client: WebsocketClient):
+        """Save a snapshot every ``interval`` seconds until ``client`` is closed."""
+        while True:
+            await asyncio.sleep(self.interval)
+            if client._closed:
+                return
+            try:
+                await self.save(client)
+            except Exception:
+                logger.exception("Couldn't save the cache snapshot.")
+
+
+__all__ = ("CacheSnapshot",)
@@ -15,13 +15,16 @@ from typing import (
 
 from ..flags import Intents
 from ..sticker import Sticker, StickerPack
+from .cache_snapshot import CacheSnapshot
 from .command_handler import CommandHandler
+from .dispatcher import EventDispatcher
+from .session_store import SessionStore
 from .websocket_client import WebsocketClient
 
 if TYPE_CHECKING:
     import discord_typings
 
-    from EpikCord import Presence, Section
+    from EpikCord import CachePolicy, Presence, Section
 
 logger = getLogger(__name__)
 
@@ -36,8 +39,29 @@ class Client(WebsocketClient, CommandHandler):
         *,
         discord_endpoint: str = "https://discord.com/api/v10",
         presence: Optional[Presence] = None,
+        cache_policies: Optional[Dict[str, CachePolicy]] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        encoding: str = "json",
+        compression: Optional[str] = "zlib-stream",
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: Optional[CacheSnapshot] = None,
+        keep_payloads: bool = True,
+        messages_per_channel: int = 100,
     ):
-        super().__init__(token, intents, presence, discord_endpoint=discord_endpoint)
+        super().__init__(
+            token,
+            intents,
+            presence,
+            discord_endpoint=discord_endpoint,
+            cache_policies=cache_policies,
+            dispatcher=dispatcher,
+            encoding=encoding,
+            compression=compression,
+            session_store=session_store,
+            cache_snapshot=cache_snapshot,
+            keep_payloads=keep_payloads,
+            messages_per_channel=messages_per_channel,
+        )
         CommandHandler.__init__(self)
         from EpikCord import Utils
 
@@ -53,23 +77,28 @@ class Client(WebsocketClient, CommandHandler):
             self.events[event.name] = event.callback
 
         for command in section._commands.values():
-
-            self.commands[command.name] = command
+            self.add_command(command)
 
     async def fetch_sticker(self, sticker_id: str) -> Sticker:
-        response = await self.http.get(f"/stickers/{sticker_id}")
-        json = await response.json()
-        return Sticker(self, json)  # TODO: Possibly cache this?
+        sticker = await self.stickers.fetch(sticker_id)
+        self.stickers.add_to_cache(sticker.id, sticker)
+        return sticker
 
     async def list_nitro_sticker_packs(self) -> List[StickerPack]:
         response = await self.http.get("/sticker-packs")
-        json = await response.json()
+        json = response.data
         return [StickerPack(self, pack) for pack in json["sticker_packs"]]
 
     async def _interaction_create(self, data: discord_typings.InteractionCreateData):
-        await super()._interaction_create(data)
+        # Commands and components always need the interaction, so this doesn't
+        # check for listeners, but does share one object with them.
         interaction = self.utils.interaction_from_type(data)
-        await self.handle_interaction(interaction)
+        await self.dispatch("interaction_create", interaction)
+        await self.dispatcher.submit(
+            self.handle_interaction,
+            interaction,
+            key=self.dispatcher.key_for((interaction,)),
+        )
 
     def component(self, custom_id: str):
         def wrapper(func):
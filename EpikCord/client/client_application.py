@@ -33,7 +33,7 @@ class ClientApplication(Application):
 
     async def fetch(self):
         response = await self.client.http.get("oauth2/applications/@me")
-        data: dict = await response.json()
+        data: dict = response.data
         return Application(data)
 
     async def fetch_global_application_commands(
@@ -43,7 +43,7 @@ class ClientApplication(Application):
         response = await self.client.http.get(
             f"/applications/{self.id}/commands?with_localizations={with_localisation}"
         )
-        payload = [ApplicationCommand(command) for command in await response.json()]
+        payload = [ApplicationCommand(command) for command in response.data]
         self.commands = payload
         return payload
 
@@ -102,13 +102,13 @@ class ClientApplication(Application):
         response = await self.client.http.post(
             f"/applications/{self.id}/commands", json=payload
         )
-        return ApplicationCommand(await response.json())
+        return ApplicationCommand(response.data)
 
     async def fetch_application_command(self, command_id: str):
         response = await self.client.http.get(
             f"/applications/{self.id}/commands/{command_id}"
         )
-        return ApplicationCommand(await response.json())
+        return ApplicationCommand(response.data)
 
     async def edit_global_application_command(
         self,
@@ -151,7 +151,7 @@ class ClientApplication(Application):
         response = await self.client.http.get(
             f"/applications/{self.id}/guilds/{guild_id}/commands"
         )
-        return [ApplicationCommand(command) for command in await response.json()]
+        return [ApplicationCommand(command) for command in response.data]
 
     async def create_guild_application_command(
         self,
@@ -210,13 +210,13 @@ class ClientApplication(Application):
         response = await self.client.http.post(
             f"/applications/{self.id}/guilds/{guild_id}/commands", json=payload
         )
-        return ApplicationCommand(await response.json())
+        return ApplicationCommand(response.data)
 
     async def fetch_guild_application_command(self, guild_id: str, command_id: str):
         response = await self.client.http.get(
             f"/applications/{self.id}/guilds/{guild_id}/commands/{command_id}"
         )
-        return ApplicationCommand(await response.json())
+        return ApplicationCommand(response.data)
 
     async def edit_guild_application_command(
         self,
@@ -270,10 +270,7 @@ class ClientApplication(Application):
         response = await self.client.http.get(
             f"/applications/{self.id}/guilds/{guild_id}/commands/{command_id}/permissions"
         )
-        return [
-            GuildApplicationCommandPermission(command)
-            for command in await response.json()
-        ]
+        return [GuildApplicationCommandPermission(command) for command in response.data]
 
     async def edit_application_command_permissions(
         self,
@@ -23,7 +23,7 @@ class ClientUser(User):
 
     async def fetch(self):
         response = await self.client.http.get("users/@me")
-        data = await response.json()
+        data = response.data
         return ClientUser(self.client, data)
         # Reinitialize the class with the new data.
 
@@ -36,7 +36,7 @@ class ClientUser(User):
         if avatar:
             payload["avatar"] = self.client.utils.bytes_to_base64_data(avatar)
         response = await self.client.http.patch("users/@me", json=payload)
-        data: discord_typings.UserData = await response.json()
+        data: discord_typings.UserData = response.data
         return ClientUser(self.client, data)
 
 
@@ -2,25 +2,152 @@ from __future__ import annotations
 
 from inspect import iscoroutinefunction
 from logging import getLogger
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..application import ApplicationCommand
+from ..converters import OptionBinder
 from ..localizations import *
 from ..options import AnyOption, ReceivedOption
 
 if TYPE_CHECKING:
-    from .. import Check
+    from .. import (
+        Check,
+        ClientMessageCommand,
+        ClientSlashCommand,
+        ClientUserCommand,
+        Subcommand,
+    )
+    from ..commands import Callback
+
+    AnyCommand = Union[ClientSlashCommand, ClientUserCommand, ClientMessageCommand]
 
 logger = getLogger(__name__)
 
+# Command type, name, subcommand group and subcommand.
+RouteKey = Tuple[int, str, Optional[str], Optional[str]]
+
+
+class CommandRoute:
+    """Where an interaction for one command, or one of its subcommands, goes.
+
+    Built when the command is registered, so handling an interaction is one
+    lookup in :attr:`CommandHandler._routes` and a call.
+    """
+
+    __slots__ = ("command", "subcommand", "depth", "binder")
+
+    def __init__(
+        self, command: AnyCommand, subcommand: Optional[Subcommand], depth: int
+    ):
+        self.command = command
+        self.subcommand = subcommand
+        # How many levels of subcommand (group) options wrap the real options.
+        self.depth: int = depth
+        # For the command's own callback. Subcommands with a callback of their
+        # own bind it themselves, see ClientSlashCommand.subcommand.
+        self.binder: Optional[OptionBinder] = None
+        if not depth:
+            self.binder = OptionBinder(
+                command.callback,
+                getattr(command, "options", []),
+                target=None if command.type == 1 else command.type,
+            )
+
+    def options(self, interaction) -> List[ReceivedOption]:
+        options = interaction.options or []
+        for _ in range(self.depth):
+            options = options[0].options or []
+        return options
+
+    def resolve(self, interaction) -> Tuple[Callback, List[Any], Dict[str, Any]]:
+        """The callback to call, and the arguments and keyword arguments to
+        call it with after the interaction."""
+        subcommand = self.subcommand
+        if subcommand is not None and subcommand.callback is not None:
+            return (
+                subcommand.callback,
+                *subcommand.binder.bind(interaction, self.options(interaction)),
+            )
+
+        if self.binder is None:
+            # The command's own callback handling a subcommand. Only bound once
+            # it's used, as it usually isn't when subcommands have callbacks.
+            self.binder = OptionBinder(self.command.callback, subcommand.options)
+        return (
+            self.command.callback,
+            *self.binder.bind(interaction, self.options(interaction)),
+        )
+
+
+def route_key(interaction) -> RouteKey:
+    """The key an application command or autocomplete interaction is routed by."""
+    options = interaction.options
+    if options:
+        first = options[0]
+        if first.type == 2:
+            return (
+                interaction.command_type,
+                interaction.command_name,
+                first.name,
+                first.options[0].name,
+            )
+        if first.type == 1:
+            return (
+                interaction.command_type,
+                interaction.command_name,
+                None,
+                first.name,
+            )
+    return (interaction.command_type, interaction.command_name, None, None)
+
 
 class CommandHandler:
     def __init__(self):
-        from EpikCord import ClientMessageCommand, ClientSlashCommand, ClientUserCommand
+        # Name -> the command last registered with that name.
+        self.commands: Dict[str, AnyCommand] = {}
+        # (command type, name) -> command, as Discord allows a slash command
+        # and a user or message command to share a name.
+        self._commands: Dict[Tuple[int, str], AnyCommand] = {}
+        self._routes: Dict[RouteKey, CommandRoute] = {}
+
+    @property
+    def all_commands(self) -> List[AnyCommand]:
+        """Every registered command, including those that share their name
+        with a command of another type and so aren't all in :attr:`commands`."""
+        return list(self._commands.values())
+
+    def add_command(self, command: AnyCommand):
+        """Register a command and compile the routes to it and its subcommands,
+        replacing any command with the same type and name."""
+        key = (command.type, command.name)
+        if key in self._commands:
+            for stale in [k for k in self._routes if k[:2] == key]:
+                del self._routes[stale]
+
+        self.commands[command.name] = self._commands[key] = command
+        self._routes.update(self._compile(command))
+
+    @staticmethod
+    def _compile(command: AnyCommand) -> Iterator[Tuple[RouteKey, CommandRoute]]:
+        name = command.name
+        if command.type != 1:
+            yield (command.type, name, None, None), CommandRoute(command, None, 0)
+            return
+
+        nested = False
+        for option in command.options:
+            if option.type == 1:
+                nested = True
+                yield (1, name, None, option.name), CommandRoute(command, option, 1)
+            elif option.type == 2:
+                nested = True
+                for subcommand in option.options:
+                    yield (1, name, option.name, subcommand.name), CommandRoute(
+                        command, subcommand, 2
+                    )
 
-        self.commands: Dict[
-            str, Union[ClientSlashCommand, ClientUserCommand, ClientMessageCommand]
-        ] = {}
+        if not nested:
+            yield (1, name, None, None), CommandRoute(command, None, 0)
 
     def command(
         self,
@@ -36,49 +163,52 @@ class CommandHandler:
         name_localizations: List[Localization] = localized_names or []
         description_localization: List[Localization] = localized_descriptions or []
 
-        for name_localisation in localized_names:
+        for name_localisation in name_localizations:
             if len(name_localisation.value) > 32:
                 raise TypeError(
                     f"Command with name {name} has too long of a name for locale {name_localisation.locale}. Must be less than 32 characters. It is {len(name_localisation.value)}/32."
                 )
 
-        for description_localisation in localized_descriptions:
+        for description_localisation in description_localization:
             if len(description_localisation.value) > 100:
                 raise TypeError(f"Command with name {name} has too long of a length")
 
         def register_slash_command(func):
             from EpikCord import ClientSlashCommand
 
-            name = name.lower() or func.__name__.lower()
+            command_name = (name or func.__name__).lower()
             desc = description or func.__doc__
 
-            if len(name) > 32:
+            if len(command_name) > 32:
                 raise TypeError(
-                    f"Command with name {name} has too long of a name. Must be less than 32 characters. It is {len(name)}/32."
+                    f"Command with name {command_name} has too long of a name. "
+                    f"Must be less than 32 characters. It is {len(command_name)}/32."
                 )
 
             if not desc:
                 raise TypeError(
-                    f"Command with name {name} has no description. This is required."
+                    f"Command with name {command_name} has no description. "
+                    "This is required."
                 )
 
             if len(desc) > 100:
                 raise TypeError(
-                    f"Command with name {name} has too large of a description. It must be 100 or less characters. It is {len(desc)}/100"
+                    f"Command with name {command_name} has too large of a description. "
+                    f"It must be 100 or less characters. It is {len(desc)}/100"
                 )
 
             command = ClientSlashCommand(
-                name=name,
+                name=command_name,
                 description=desc,
                 guild_ids=guild_ids or [],
                 options=options or [],
                 callback=func,
-                name_localizations=localized_names,
-                description_localizations=localized_descriptions,
+                name_localization=name_localizations,
+                description_localization=description_localization,
                 checks=checks or [],
             )
 
-            self.commands[command.name] = command
+            self.add_command(command)
             return command
 
         return register_slash_command
@@ -93,7 +223,7 @@ class CommandHandler:
                 callback=func, name=name or func.__name__, checks=checks or []
             )
 
-            self.commands[name] = results
+            self.add_command(results)
             return results
 
         return register_slash_command
@@ -108,7 +238,7 @@ class CommandHandler:
                 callback=func, name=name or func.__name__, checks=checks or []
             )
 
-            self.commands[name] = results
+            self.add_command(results)
             return results
 
         return register_slash_command
@@ -130,36 +260,28 @@ class CommandHandler:
             )
 
         elif interaction.is_application_command:
-            command = self.commands.get(interaction.command_name)
+            route = self._routes.get(route_key(interaction))
 
-            if not command:
+            if not route:
                 logger.warning(
                     f"Command {interaction.command_name} is not registered in "
                     f"this code, but is registered with Discord. "
                 )
                 return  # TODO Possibly add an error which people can handle?
 
-            options = []
-
-            if command.is_user_command() or command.is_message_command():
-                options.append(interaction.target_id)
-
-            if command.is_slash_command():
-                for check in command.checks:
-                    if iscoroutinefunction(check.callback):
-                        if not await check.callback(interaction):
-                            return await check.failure_callback(interaction)
-
-                    elif not check.callback(interaction):
-                        await check.failure_callback(interaction)
-                    await check.success_callback(interaction)
+            for check in route.command.checks:
+                if iscoroutinefunction(check.callback):
+                    passed = await check.callback(interaction)
+                else:
+                    passed = check.callback(interaction)
 
-                options.extend(ReceivedOption(option) for option in interaction.options)
+                if not passed:
+                    return await check.failure_callback(interaction)
+                await check.success_callback(interaction)
 
             try:
-                return await command.callback(
-                    interaction, *[option.value for option in options]
-                )
+                callback, args, kwargs = route.resolve(interaction)
+                return await callback(interaction, *args, **kwargs)
             except Exception as e:
                 await self.command_error(interaction, e)
 
@@ -207,19 +329,22 @@ class CommandHandler:
                 )
 
         if interaction.is_autocomplete:
-            command = self.commands.get(interaction.command_name)
-            if not command:
+            route = self._routes.get(route_key(interaction))
+            if not route:
                 return
-            try:
-                option = list(
-                    filter(lambda option: option.focused == True, interaction.options)
-                )[0]
-            except IndexError:
+            option = next(
+                (option for option in route.options(interaction) if option.focused),
+                None,
+            )
+            if option is None:
                 logger.warning(
                     f"No option was focused for {interaction.command_name} but we still received an autocomplete interaction."
                 )
-            if auto_complete_callback := command.autocomplete_options.get(option):
-                await auto_complete_callback(interaction, ReceivedOption(option))
+                return
+            if auto_complete_callback := route.command.autocomplete_options.get(
+                option.name
+            ):
+                await auto_complete_callback(interaction, option)
 
         if interaction.is_modal_submit:
             action_rows = interaction._components
@@ -233,5 +358,13 @@ class CommandHandler:
                 interaction, *component_object_list
             )
 
+    async def command_error(self, interaction, error: Exception):
+        """Called when a command's callback raises. Logs the error by default,
+        override it to handle errors yourself."""
+        logger.error(
+            f"Command {interaction.command_name} raised an exception.",
+            exc_info=error,
+        )
+
 
 __all__ = ("CommandHandler",)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import defaultdict
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:
+    from .command_handler import AnyCommand
+    from .http_client import HTTPClient
+
+logger = getLogger(__name__)
+
+# What's compared between commands in code and on Discord. Anything else
+# Discord sends back, like IDs and versions, doesn't say what changed.
+_COMMAND_KEYS = (
+    "name",
+    "type",
+    "description",
+    "options",
+    "name_localizations",
+    "description_localizations",
+    "default_member_permissions",
+    "dm_permission",
+    "nsfw",
+)
+_OPTION_KEYS = (
+    "type",
+    "name",
+    "description",
+    "required",
+    "choices",
+    "options",
+    "channel_types",
+    "min_value",
+    "max_value",
+    "min_length",
+    "max_length",
+    "autocomplete",
+    "name_localizations",
+    "description_localizations",
+)
+_CHOICE_KEYS = ("name", "value", "name_localizations")
+# Left out when they're the default, as Discord may or may not send them.
+_DEFAULTS = {
+    "required": False,
+    "autocomplete": False,
+    "dm_permission": True,
+    "nsfw": False,
+}
+
+# "global" or a guild ID -> "type:name" -> the command's ID and hash.
+SyncState = Dict[str, Dict[str, Dict[str, str]]]
+
+
+def _canonical(payload: Dict[str, Any], keys) -> Dict[str, Any]:
+    canonical = {}
+    for key in keys:
+        value = payload.get(key)
+        if value in (None, "", [], {}) or _DEFAULTS.get(key, ...) == value:
+            continue
+        if key == "options":
+            value = [_canonical(option, _OPTION_KEYS) for option in value]
+        elif key == "choices":
+            value = [_canonical(choice, _CHOICE_KEYS) for choice in value]
+        canonical[key] = value
+    return canonical
+
+
+def command_hash(payload: Dict[str, Any]) -> str:
+    """A hash of what a command payload defines, the same for a command in
+    code and as Discord returns it, and between runs."""
+    canonical = json.dumps(
+        _canonical(payload, _COMMAND_KEYS), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _key(payload: Dict[str, Any]) -> str:
+    return f"{payload.get('type', 1)}:{payload['name']}"
+
+
+class CommandSync:
+    """Brings the application commands registered with Discord in line with
+    the ones in code, sending only the creates, edits and deletes needed
+    rather than overwriting every command.
+
+    Commands are compared by a hash of their payload. With ``state_path``,
+    the hashes and IDs from the last sync are kept there, and guilds, or the
+    global commands, whose commands haven't changed since aren't requested
+    at all. Otherwise, or when they have, the registered commands are
+    fetched to compare against. Guilds are synced concurrently, the rate
+    limiter keeps the requests within Discord's limits.
+
+    Parameters
+    ----------
+    state_path : Optional[Union[str, os.PathLike]]
+        A JSON file to keep what was last synced in.
+    concurrency : int
+        How many guilds to sync at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        state_path: Optional[Union[str, os.PathLike]] = None,
+        concurrency: int = 5,
+    ):
+        self.state_path: Optional[Path] = Path(state_path) if state_path else None
+        self.concurrency: int = concurrency
+
+    def load_state(self) -> SyncState:
+        if not self.state_path:
+            return {}
+        try:
+            return json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self, state: SyncState):
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.state_path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(state))
+        # Replacing is atomic, a crash mid-write can't leave a broken file.
+        os.replace(temporary, self.state_path)
+
+    async def sync(
+        self, http: HTTPClient, application_id: int, commands: Iterable[AnyCommand]
+    ) -> int:
+        """Sync ``commands`` for the application, returning how many
+        creates, edits and deletes were sent."""
+        scopes: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for command in commands:
+            payload = command.to_dict()
+            for guild_id in getattr(command, "guild_ids", None) or ("global",):
+                scopes[str(guild_id)].append(payload)
+
+        state = self.load_state()
+        # Guilds that had commands last time but have none now are emptied.
+        for scope in state:
+            scopes.setdefault(scope, [])
+        scopes.setdefault("global", [])
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def sync_scope(scope: str, payloads: List[Dict[str, Any]]):
+            async with semaphore:
+                try:
+                    return await self._sync_scope(
+                        http, application_id, scope, payloads, state
+                    )
+                except Exception:
+                    # Say, missing access to a guild. The other scopes still
+                    # sync, and this one is retried next time.
+                    logger.exception(f"Couldn't sync the commands for {scope}.")
+                    state.pop(scope, None)
+                    return 0
+
+        results = await asyncio.gather(
+            *(sync_scope(scope, payloads) for scope, payloads in scopes.items())
+        )
+        self.save_state(
+            {
+                scope: known
+                for scope, known in state.items()
+                if known or scope == "global"
+            }
+        )
+        return sum(results)
+
+    async def _sync_scope(
+        self,
+        http: HTTPClient,
+        application_id: int,
+        scope: str,
+        payloads: List[Dict[str, Any]],
+        state: SyncState,
+    ) -> int:
+        local = {_key(payload): payload for payload in payloads}
+        hashes = {key: command_hash(payload) for key, payload in local.items()}
+
+        known = state.get(scope)
+        if known is not None and hashes == {
+            key: command["hash"] for key, command in known.items()
+        }:
+            return 0
+
+        route = (
+            f"/applications/{application_id}/commands"
+            if scope == "global"
+            else f"/applications/{application_id}/guilds/{scope}/commands"
+        )
+        # Without the localizations, localized commands never hash the same.
+        response = await http.get(route, params={"with_localizations": "true"})
+        remote = {
+            _key(command): {"id": command["id"], "hash": command_hash(command)}
+            for command in response.data
+        }
+
+        operations = 0
+        for key, payload in local.items():
+            if key not in remote:
+                response = await http.post(route, json=payload)
+                remote[key] = {"id": response.data["id"], "hash": hashes[key]}
+            elif remote[key]["hash"] != hashes[key]:
+                await http.patch(f"{route}/{remote[key]['id']}", json=payload)
+                remote[key]["hash"] = hashes[key]
+            else:
+                continue
+            operations += 1
+
+        for key in [key for key in remote if key not in local]:
+            await http.delete(f"{route}/{remote.pop(key)['id']}")
+            operations += 1
+
+        state[scope] = remote
+        if operations:
+            logger.info(f"Synced {operations} commands for {scope}.")
+        return operations
+
+
+__all__ = ("CommandSync",)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import zlib
+from importlib.util import find_spec
+from logging import getLogger
+from typing import Dict, Optional, Type
+
+from ..exceptions import InvalidArgumentType
+
+_ZSTANDARD = find_spec("zstandard")
+
+if _ZSTANDARD:
+    import zstandard
+
+logger = getLogger(__name__)
+
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+
+class Inflator:
+    """Decompresses the messages of a compressed gateway connection.
+
+    The compression is a single stream for the whole connection,
+    so each connection needs its own inflator.
+    """
+
+    __slots__ = ()
+
+    #: The value of the ``compress`` query parameter for this compression.
+    name: str = ""
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        """Returns the decompressed message once ``data`` completes one."""
+        raise NotImplementedError
+
+
+class ZlibStreamInflator(Inflator):
+    """Inflates a ``zlib-stream`` compressed gateway connection.
+
+    A message may be split across several websocket frames, only the last
+    of which ends with :data:`ZLIB_SUFFIX`. Messages that arrive in one frame,
+    which is nearly all of them, are inflated without being copied.
+    """
+
+    __slots__ = ("buffer", "decompressor")
+
+    name = "zlib-stream"
+
+    def __init__(self):
+        self.buffer: bytearray = bytearray()
+        self.decompressor = zlib.decompressobj()
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        if data[-4:] != ZLIB_SUFFIX:
+            self.buffer += data
+            return None
+
+        if not self.buffer:
+            return self.decompressor.decompress(data)
+
+        self.buffer += data
+        message = self.decompressor.decompress(self.buffer)
+        del self.buffer[:]
+        return message
+
+
+class ZstdStreamInflator(Inflator):
+    """Decompresses a ``zstd-stream`` compressed gateway connection.
+
+    Discord flushes the stream after every message and never splits one
+    across frames, so every frame decompresses to exactly one message.
+    Requires the ``zstandard`` package.
+    """
+
+    __slots__ = ("decompressor",)
+
+    name = "zstd-stream"
+
+    def __init__(self):
+        self.decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        return self.decompressor.decompress(data) or None
+
+
+INFLATORS: Dict[str, Type[Inflator]] = {
+    ZlibStreamInflator.name: ZlibStreamInflator,
+    ZstdStreamInflator.name: ZstdStreamInflator,
+}
+
+
+def resolve_compression(compression: Optional[str]) -> Optional[str]:
+    """Returns the compression a client asking for ``compression`` will use.
+
+    ``zstd-stream`` falls back to ``zlib-stream`` when ``zstandard``
+    isn't installed, ``None`` turns compression off.
+    """
+    if compression is None:
+        return None
+
+    if compression not in INFLATORS:
+        raise InvalidArgumentType(
+            f"compression must be one of {', '.join(INFLATORS)} or None, "
+            f"not {compression!r}."
+        )
+
+    if compression == ZstdStreamInflator.name and not _ZSTANDARD:
+        logger.warning(
+            "zstandard isn't installed, falling back to zlib-stream compression."
+        )
+        return ZlibStreamInflator.name
+
+    return compression
+
+
+def create_inflator(compression: Optional[str]) -> Optional[Inflator]:
+    return INFLATORS[compression]() if compression else None
+
+
+__all__ = ("Inflator", "ZlibStreamInflator", "ZstdStreamInflator")
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from logging import getLogger
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+logger = getLogger(__name__)
+
+Callback = Callable[..., Coroutine[Any, Any, Any]]
+_Job = Tuple[Callback, Tuple[Any, ...], Dict[str, Any]]
+
+
+class EventDispatcher:
+    """Runs event listeners on a bounded pool of worker tasks,
+    so the gateway never waits on user code.
+
+    Parameters
+    ----------
+    workers : int
+        How many listeners may run at the same time.
+    max_pending : int
+        How many listener calls may be queued or running before
+        :meth:`submit` starts waiting for room, which in turn slows down
+        how fast the gateway is read.
+    ordering : Optional[str]
+        ``"guild"`` or ``"channel"`` to run the listeners for events of the same
+        guild (or channel) one after the other, in the order they arrived.
+        Events from different guilds still run concurrently.
+        ``None`` runs everything concurrently.
+
+    Attributes
+    ----------
+    processed : int
+        How many listener calls have finished.
+    failed : int
+        How many listener calls have raised an exception.
+    max_queue_depth : int
+        The most listener calls that have been waiting at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 32,
+        max_pending: int = 1024,
+        ordering: Optional[str] = None,
+    ):
+        if ordering not in {None, "guild", "channel"}:
+            raise ValueError("ordering must be None, 'guild' or 'channel'.")
+
+        self.workers: int = workers
+        self.max_pending: int = max_pending
+        self.ordering: Optional[str] = ordering
+
+        self.processed: int = 0
+        self.failed: int = 0
+        self.running: int = 0
+        self.max_queue_depth: int = 0
+
+        self._pending: int = 0
+        self._room: Optional[asyncio.Semaphore] = None
+        self._ready: Optional[asyncio.Queue] = None
+        self._chains: Dict[Hashable, Deque[_Job]] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def queue_depth(self) -> int:
+        """How many listener calls are waiting to run."""
+        return self._pending - self.running
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self.running,
+            "processed": self.processed,
+            "failed": self.failed,
+            "ordered_keys": len(self._chains),
+        }
+
+    def key_for(self, args: Tuple[Any, ...]) -> Optional[Hashable]:
+        if not self.ordering:
+            return None
+
+        # Update events pass (before, after), and before is None when the
+        # object wasn't cached.
+        obj = next((arg for arg in args if arg is not None), None)
+        if obj is None:
+            return None
+
+        if self.ordering == "guild":
+            from EpikCord import Guild
+
+            return obj.id if isinstance(obj, Guild) else getattr(obj, "guild_id", None)
+
+        return getattr(obj, "channel_id", None)
+
+    def _start(self):
+        self._room = asyncio.Semaphore(self.max_pending)
+        self._ready = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def submit(
+        self,
+        callback: Callback,
+        *args: Any,
+        key: Optional[Hashable] = None,
+        **kwargs: Any,
+    ):
+        """Queue ``callback(*args, **kwargs)`` to run on the pool.
+
+        Calls that share a ``key`` run one at a time, in submission order.
+        This only waits if ``max_pending`` calls are already queued.
+        """
+        if not self._tasks:
+            self._start()
+
+        await self._room.acquire()  # type: ignore
+
+        self._pending += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        job: _Job = (callback, args, kwargs)
+
+        if key is None:
+            self._ready.put_nowait((None, job))  # type: ignore
+        elif key in self._chains:
+            self._chains[key].append(job)
+        else:
+            self._chains[key] = deque()
+            self._ready.put_nowait((key, job))  # type: ignore
+
+    async def _worker(self):
+        worker = asyncio.current_task()
+        while True:
+            key, (callback, args, kwargs) = await self._ready.get()  # type: ignore
+            self.running += 1
+
+            try:
+                await callback(*args, **kwargs)
+            except Exception:
+                self.failed += 1
+                logger.exception(f"Ignoring exception in {callback.__name__}")
+            finally:
+                if worker in self._tasks:
+                    self.running -= 1
+                    self._pending -= 1
+                    self.processed += 1
+                    self._room.release()  # type: ignore
+
+            if worker not in self._tasks:
+                # The listener closed the pool, which has forgotten this worker.
+                return
+
+            if key is not None:
+                chain = self._chains[key]
+                if chain:
+                    # Back of the line, so one busy key can't hog a worker.
+                    self._ready.put_nowait((key, chain.popleft()))  # type: ignore
+                else:
+                    del self._chains[key]
+
+    async def close(self):
+        """Stop the workers, dropping the listener calls still queued."""
+        # Closing from a listener mustn't wait on, or cancel, its own worker.
+        current = asyncio.current_task()
+        tasks = [task for task in self._tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._chains.clear()
+        self._pending = self.running = 0
+
+
+__all__ = ("EventDispatcher",)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from importlib.util import find_spec
+from typing import Any, Dict
+
+from ..exceptions import InvalidArgumentType, InvalidData
+
+_ERLPACK = find_spec("erlpack")
+
+if _ERLPACK:
+    import erlpack  # type: ignore
+
+FORMAT_VERSION = 131
+
+NEW_FLOAT_EXT = 70
+COMPRESSED = 80
+SMALL_INTEGER_EXT = 97
+INTEGER_EXT = 98
+FLOAT_EXT = 99
+ATOM_EXT = 100
+SMALL_TUPLE_EXT = 104
+LARGE_TUPLE_EXT = 105
+NIL_EXT = 106
+STRING_EXT = 107
+LIST_EXT = 108
+BINARY_EXT = 109
+SMALL_BIG_EXT = 110
+LARGE_BIG_EXT = 111
+SMALL_ATOM_EXT = 115
+MAP_EXT = 116
+ATOM_UTF8_EXT = 118
+SMALL_ATOM_UTF8_EXT = 119
+
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_I32 = struct.Struct(">i")
+_F64 = struct.Struct(">d")
+
+_ATOMS: Dict[str, Any] = {"nil": None, "true": True, "false": False}
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+# Over JSON, Discord sends snowflakes as strings but over ETF they're plain
+# integers, which are always too big for 32 bits. To hand out the same payloads
+# for both encodings, integers that don't fit in 32 bits become strings,
+# except for these keys, which hold millisecond timestamps in JSON too.
+_INTEGER_KEYS = frozenset({"start", "end", "created_at"})
+
+
+def _integer(value: int, key: Any) -> Any:
+    if _INT32_MIN <= value <= _INT32_MAX or key in _INTEGER_KEYS:
+        return value
+    return str(value)
+
+
+class _Decoder:
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def _take(self, size: int) -> memoryview:
+        start = self.offset
+        end = self.offset = start + size
+        if end > len(self.data):
+            raise InvalidData("Unexpected end of ETF data.")
+        return self.data[start:end]
+
+    def term(self, key: Any = None) -> Any:
+        tag = self._take(1)[0]
+
+        if tag == MAP_EXT:
+            (arity,) = _U32.unpack(self._take(4))
+            result = {}
+            for _ in range(arity):
+                map_key = self.term()
+                result[map_key] = self.term(map_key)
+            return result
+
+        if tag == BINARY_EXT:
+            (size,) = _U32.unpack(self._take(4))
+            return str(self._take(size), "utf-8")
+
+        if tag == SMALL_INTEGER_EXT:
+            return self._take(1)[0]
+
+        if tag == INTEGER_EXT:
+            return _integer(_I32.unpack(self._take(4))[0], key)
+
+        if tag in {SMALL_ATOM_UTF8_EXT, SMALL_ATOM_EXT}:
+            name = str(self._take(self._take(1)[0]), "utf-8")
+            return _ATOMS[name] if name in _ATOMS else name
+
+        if tag in {ATOM_UTF8_EXT, ATOM_EXT}:
+            (size,) = _U16.unpack(self._take(2))
+            name = str(self._take(size), "utf-8")
+            return _ATOMS[name] if name in _ATOMS else name
+
+        if tag == NIL_EXT:
+            return []
+
+        if tag == LIST_EXT:
+            (size,) = _U32.unpack(self._take(4))
+            items = [self.term(key) for _ in range(size)]
+            self.term()  # The tail, always NIL_EXT for proper lists.
+            return items
+
+        if tag in {SMALL_BIG_EXT, LARGE_BIG_EXT}:
+            if tag == SMALL_BIG_EXT:
+                size = self._take(1)[0]
+            else:
+                (size,) = _U32.unpack(self._take(4))
+            sign = self._take(1)[0]
+            value = int.from_bytes(self._take(size), "little")
+            return _integer(-value if sign else value, key)
+
+        if tag == NEW_FLOAT_EXT:
+            return _F64.unpack(self._take(8))[0]
+
+        if tag == STRING_EXT:
+            # Erlang's compact encoding of a list of small integers.
+            (size,) = _U16.unpack(self._take(2))
+            return list(self._take(size))
+
+        if tag in {SMALL_TUPLE_EXT, LARGE_TUPLE_EXT}:
+            if tag == SMALL_TUPLE_EXT:
+                size = self._take(1)[0]
+            else:
+                (size,) = _U32.unpack(self._take(4))
+            return [self.term(key) for _ in range(size)]
+
+        if tag == FLOAT_EXT:
+            return float(bytes(self._take(31)).rstrip(b"\x00"))
+
+        if tag == COMPRESSED:
+            self._take(4)  # The uncompressed size.
+            start = self.offset
+            inner = _Decoder(zlib.decompress(self.data[start:]))
+            self.offset = len(self.data)
+            return inner.term(key)
+
+        raise InvalidData(f"Unknown ETF tag {tag}.")
+
+
+def _normalize(value: Any, key: Any = None) -> Any:
+    """Makes erlpack's output look like :func:`etf_loads`' pure Python output."""
+    if isinstance(value, dict):
+        normalized = {}
+        for map_key, item in value.items():
+            map_key = _normalize(map_key)
+            normalized[map_key] = _normalize(item, map_key)
+        return normalized
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item, key) for item in value]
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    if isinstance(value, int) and not isinstance(value, bool):
+        return _integer(value, key)
+    if isinstance(value, str):
+        # Atoms come back as a str subclass, nil/true/false are already mapped.
+        return str(value)
+    return value
+
+
+def etf_loads(data: bytes) -> Any:
+    """Decodes an ETF payload from the gateway into the same shape
+    :func:`json.loads` gives for the JSON encoding.
+
+    Uses ``erlpack`` if it's installed.
+    """
+    if _ERLPACK:
+        return _normalize(erlpack.unpack(bytes(data)))
+
+    if not data or data[0] != FORMAT_VERSION:
+        raise InvalidData("ETF data must start with the format version.")
+
+    decoder = _Decoder(data)
+    decoder.offset = 1
+    return decoder.term()
+
+
+def _encode(value: Any, out: bytearray):
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        out.append(BINARY_EXT)
+        out += _U32.pack(len(encoded))
+        out += encoded
+
+    elif isinstance(value, dict):
+        out.append(MAP_EXT)
+        out += _U32.pack(len(value))
+        for map_key, item in value.items():
+            _encode(map_key, out)
+            _encode(item, out)
+
+    elif value is None or isinstance(value, bool):
+        name = b"nil" if value is None else b"true" if value else b"false"
+        out.append(SMALL_ATOM_UTF8_EXT)
+        out.append(len(name))
+        out += name
+
+    elif isinstance(value, int):
+        if 0 <= value <= 255:
+            out.append(SMALL_INTEGER_EXT)
+            out.append(value)
+        elif _INT32_MIN <= value <= _INT32_MAX:
+            out.append(INTEGER_EXT)
+            out += _I32.pack(value)
+        else:
+            magnitude = abs(value)
+            digits = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, "little")
+            if len(digits) > 255:
+                raise InvalidArgumentType("Integer is too big to encode as ETF.")
+            out.append(SMALL_BIG_EXT)
+            out.append(len(digits))
+            out.append(value < 0)
+            out += digits
+
+    elif isinstance(value, float):
+        out.append(NEW_FLOAT_EXT)
+        out += _F64.pack(value)
+
+    elif isinstance(value, (list, tuple)):
+        if value:
+            out.append(LIST_EXT)
+            out += _U32.pack(len(value))
+            for item in value:
+                _encode(item, out)
+        out.append(NIL_EXT)
+
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(BINARY_EXT)
+        out += _U32.pack(len(value))
+        out += value
+
+    else:
+        raise InvalidArgumentType(
+            f"Object of type {type(value).__name__} can't be encoded as ETF."
+        )
+
+
+def etf_dumps(value: Any) -> bytes:
+    """Encodes ``value`` as ETF for sending to the gateway.
+
+    Uses ``erlpack`` if it's installed.
+    """
+    if _ERLPACK:
+        return erlpack.pack(value)
+
+    out = bytearray((FORMAT_VERSION,))
+    _encode(value, out)
+    return bytes(out)
+
+
+__all__ = ("etf_dumps", "etf_loads")
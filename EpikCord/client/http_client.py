@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import zlib
+from collections import deque
 from functools import partialmethod
 from importlib.util import find_spec
-from logging import getLogger
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from logging import DEBUG, getLogger
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Deque, Dict, Mapping, Optional, Tuple, Union
 
-from aiohttp import ClientSession, ClientWebSocketResponse
+from aiohttp import ClientResponse, ClientSession, ClientWebSocketResponse
 
 from ..exceptions import (
     DiscordAPIError,
@@ -17,6 +17,8 @@ from ..exceptions import (
     NotFound404,
 )
 from ..status_code import HTTPCodes
+from .compression import Inflator, ZlibStreamInflator
+from .etf import etf_dumps, etf_loads
 
 logger = getLogger(__name__)
 
@@ -31,66 +33,293 @@ else:
 
 if TYPE_CHECKING:
     import discord_typings
+    from multidict import CIMultiDictProxy
+
+
+class Bucket:
+    """A Discord rate limit bucket.
+
+    Requests are released in FIFO order, only as many at a time as the bucket
+    has ``remaining`` slots for. Until Discord has told us the limits of a
+    bucket, it lets a single request through to learn them.
+    """
+
+    def __init__(self, key: str):
+        self.key: str = key
+        self.limit: int = 1
+        self.remaining: int = 1
+        self.reset_at: float = 0.0
+        self.known: bool = False
+        self.unlimited: bool = False
+        self.last_used: float = monotonic()
+        self.waiters: Deque[asyncio.Future] = deque()
+        self._reset_handle: Optional[asyncio.TimerHandle] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<Bucket key={self.key!r} remaining={self.remaining}/{self.limit} "
+            f"waiting={len(self.waiters)}>"
+        )
+
+    @property
+    def idle(self) -> bool:
+        self._refill()
+        return not self.waiters and (self.unlimited or self.remaining >= self.limit)
+
+    def _refill(self) -> bool:
+        if self.reset_at and monotonic() >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0.0
+            return True
+        return False
+
+    def _try_take(self) -> bool:
+        if self.unlimited:
+            return True
+
+        self._refill()
+        if self.remaining > 0:
+            self.remaining -= 1
+            return True
+        return False
+
+    async def acquire(self):
+        """Wait until this bucket has room for another request."""
+        self.last_used = monotonic()
+
+        if not self.waiters and self._try_take():
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.append(future)
+        self._schedule_release()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were handed a slot but won't use it, give it back.
+                self.remaining += 1
+                self._release()
+            raise
+
+    def update(self, headers: Optional[Mapping[str, str]]):
+        """Update the bucket from the headers of a response.
+
+        ``None`` means the request never got a response, so the slot it
+        took is handed back. So is it for a response without rate limit
+        headers on a bucket whose limits are known, like an error page from
+        Discord's proxy.
+        """
+        if headers is not None and "X-RateLimit-Limit" not in headers:
+            if not self.known:
+                self.unlimited = True
+                self._release()
+                return
+            headers = None
+
+        if headers is None:
+            # Discord never counted it, so the bucket has the slot again. Not
+            # giving it back would leave a known bucket empty with nothing
+            # scheduled to refill it, as reset_at is cleared on refilling.
+            self.remaining = min(self.remaining + 1, self.limit)
+            self._release()
+            return
+
+        remaining = int(headers["X-RateLimit-Remaining"])
+        self.limit = int(headers["X-RateLimit-Limit"])
+        self.remaining = remaining if not self.known else min(self.remaining, remaining)
+        self.reset_at = monotonic() + float(headers["X-RateLimit-Reset-After"])
+        self.known = True
+        self.unlimited = False
+
+        self._release()
+
+    def exhaust(self, retry_after: float):
+        """Mark the bucket as empty for ``retry_after`` seconds (after a 429)."""
+        self.remaining = 0
+        self.reset_at = monotonic() + retry_after
+        self._schedule_release()
+
+    def _release(self):
+        while self.waiters:
+            if self.waiters[0].done():
+                self.waiters.popleft()
+                continue
+
+            if not self._try_take():
+                break
+
+            self.waiters.popleft().set_result(None)
+
+        self._schedule_release()
+
+    def _schedule_release(self):
+        if not self.waiters or self._reset_handle or not self.reset_at:
+            return
+
+        def on_reset():
+            self._reset_handle = None
+            self._release()
+
+        self._reset_handle = asyncio.get_running_loop().call_later(
+            max(self.reset_at - monotonic(), 0), on_reset
+        )
+
+
+_MAJOR_PARAMETERS = ("channels", "guilds", "webhooks")
+_TOKEN_PARAMETERS = ("webhooks", "interactions")
 
 
-class _FakeTask:
-    def cancel(self):
-        return True
+def _route(method: str, path: str) -> Tuple[str, str]:
+    """Split a request into its route template and its major parameter.
 
+    ``channels/123/messages/456`` becomes ``("GET channels/{major}/messages/{id}",
+    "channels:123")``. Discord shares rate limits between routes with the same
+    template, and the major parameter splits them up further.
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    major = ""
+    template = []
 
-class UnknownBucket:
-    def __init__(self):
-        self.event = asyncio.Event()
-        self.event.set()
-        self.close_task: Union[_FakeTask, asyncio.Task] = _FakeTask()
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else ""
+        before_previous = segments[index - 2] if index > 1 else ""
 
+        if segment.isdigit():
+            if not major and previous in _MAJOR_PARAMETERS:
+                major = f"{previous}:{segment}"
+                template.append("{major}")
+                continue
+            template.append("{id}")
 
-class Bucket(UnknownBucket):
-    def __init__(self, *, discord_hash: str):
-        super().__init__()
-        self.bucket_hash = discord_hash
+        elif before_previous in _TOKEN_PARAMETERS and previous.isdigit():
+            if before_previous == "webhooks":
+                major = f"{major}:{segment}"
+            template.append("{token}")
 
-    def __eq__(self, other):
-        return self.bucket_hash == other.bucket_hash
+        elif previous == "reactions":
+            template.append("{emoji}")
 
-    def __hash__(self):
-        return id(self)
+        else:
+            template.append(segment)
+
+    return f"{method} {'/'.join(template)}", major
+
+
+class HTTPResponse:
+    """The result of a request to Discord.
+
+    The body is read and decoded exactly once, ``data`` holds the parsed JSON
+    (or the text, for responses that aren't JSON).
+
+    Attributes
+    ----------
+    status : int
+        The HTTP status code of the response.
+    headers : CIMultiDictProxy[str]
+        The headers Discord responded with.
+    data : Any
+        The decoded body. ``None`` if the body was empty.
+    method : str
+        The method used for the request.
+    url : str
+        The url the request was sent to.
+    """
+
+    __slots__ = ("status", "headers", "data", "method", "url")
+
+    def __init__(
+        self,
+        *,
+        status: int,
+        headers: CIMultiDictProxy[str],
+        data: Any,
+        method: str,
+        url: str,
+    ):
+        self.status: int = status
+        self.headers: CIMultiDictProxy[str] = headers
+        self.data: Any = data
+        self.method: str = method
+        self.url: str = url
+
+    def __repr__(self) -> str:
+        return (
+            f"<HTTPResponse method={self.method} url={self.url} status={self.status}>"
+        )
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @classmethod
+    async def from_client_response(cls, res: ClientResponse) -> HTTPResponse:
+        raw = await res.read()
+        data: Any = None
+
+        if raw:
+            if res.content_type == "application/json":
+                data = json.loads(raw)
+            else:
+                data = raw.decode(res.get_encoding() or "utf-8", "replace")
+
+        return cls(
+            status=res.status,
+            headers=res.headers,
+            data=data,
+            method=res.method,
+            url=str(res.url),
+        )
 
 
 class DiscordWSMessage:
-    def __init__(self, *, data, type, extra):
+    def __init__(self, *, data, type, extra, loads=json.loads):
         self.data = data
         self.type = type
         self.extra = extra
+        self.loads = loads
 
     def json(self) -> Any:
-        return json.loads(self.data)
+        # Decodes with the connection's encoding, which may be ETF.
+        # Both orjson and the stdlib take bytes, no need to decode first.
+        return self.loads(self.data)
 
 
 class GatewayWebsocket(ClientWebSocketResponse):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.buffer: bytearray = bytearray()
-        self.inflator = zlib.decompressobj()
-
-    async def receive(self, *args, **kwargs):
-        ws_message = await super().receive(*args, **kwargs)
-        message = ws_message.data
+        # Replaced by the client to match the compression it asked for.
+        self.inflator: Optional[Inflator] = ZlibStreamInflator()
+        self.encoding: str = "json"
 
-        if isinstance(message, bytes):
+    @property
+    def etf(self) -> bool:
+        return self.encoding == "etf"
 
-            self.buffer.extend(message)
+    async def send_payload(self, payload: Dict[str, Any]):
+        if self.etf:
+            await self.send_bytes(etf_dumps(payload))
+        else:
+            await self.send_json(payload)
 
-            if len(message) < 4 or message[-4:] != b"\x00\x00\xff\xff":
-                return
+    async def receive(self, *args, **kwargs):
+        while True:
+            ws_message = await super().receive(*args, **kwargs)
+            message = ws_message.data
 
-            message = self.inflator.decompress(self.buffer)
+            if not isinstance(message, bytes) or self.inflator is None:
+                break
 
-            message = message.decode("utf-8")
-            self.buffer: bytearray = bytearray()
+            message = self.inflator.feed(message)
+            if message is not None:
+                break
 
         return DiscordWSMessage(
-            data=message, type=ws_message.type, extra=ws_message.extra
+            data=message,
+            type=ws_message.type,
+            extra=ws_message.extra,
+            loads=etf_loads if self.etf else json.loads,
         )
 
 
@@ -125,134 +354,196 @@ class HTTPClient:
         self.global_ratelimit: asyncio.Event = asyncio.Event()
         self.global_ratelimit.set()
         self.buckets: Dict[str, Bucket] = {}
+        self.bucket_hashes: Dict[str, str] = {}
+        self._last_prune: float = monotonic()
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+    def get_bucket(self, route: str, major: str) -> Bucket:
+        discord_hash = self.bucket_hashes.get(route)
+        key = f"{discord_hash}:{major}" if discord_hash else f"{route}:{major}"
+
+        bucket = self.buckets.get(key)
+        if not bucket:
+            bucket = self.buckets[key] = Bucket(key)
+
+        return bucket
+
+    def _learn_bucket_hash(
+        self, route: str, major: str, bucket: Bucket, discord_hash: Optional[str]
+    ):
+        if not discord_hash or self.bucket_hashes.get(route) == discord_hash:
+            return
+
+        self.bucket_hashes[route] = discord_hash
+        # The bucket we used becomes the bucket for the hash, unless another
+        # route sharing the hash already made one, then we start using that.
+        self.buckets.setdefault(f"{discord_hash}:{major}", bucket)
+
+    def _prune_buckets(self):
+        now = monotonic()
+        if now - self._last_prune < 60:
+            return
+
+        self._last_prune = now
+        for key, bucket in list(self.buckets.items()):
+            if bucket.idle and now - bucket.last_used > 300:
+                del self.buckets[key]
 
     async def request(
         self,
         method,
         url,
         *args,
-        attempt: int = 1,
         to_discord=True,
-        guild_id: Union[str, int] = 0,
-        channel_id: Union[int, str] = 0,
-        reason: Optional[str] = None,
+        coalesce: Optional[bool] = None,
         **kwargs,
     ):
-        if attempt > 5:
-            logger.critical(f"Failed a {method} {url} 5 times.")
-            return
-
+        """Send a request to Discord.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method to use.
+        url : str
+            The route to request, relative to the API base url.
+        to_discord : bool
+            Whether the request is for Discord's API.
+            If not, it is sent as is and the raw response is returned.
+        coalesce : Optional[bool]
+            Whether identical requests that are in flight at the same time
+            should share a single request and its response.
+            Defaults to ``True`` for ``GET`` requests.
+            Callers sharing a response also share its ``data``,
+            so it should not be mutated.
+        """
         if url.startswith("ws") or not to_discord:
             return await self.session.request(method, url, *args, **kwargs)
 
-        if url.startswith("/"):
-            url = url[1:]
+        if coalesce is None:
+            coalesce = method == "GET"
 
-        if url.endswith("/"):
-            url = url[:-1]
+        if not coalesce or args or {"json", "data", "headers"} & kwargs.keys():
+            return await self._request(method, url, *args, **kwargs)
 
-        url = f"{self.base_uri}/{url}"
+        key = (
+            method,
+            url.strip("/"),
+            str(sorted((kwargs.get("params") or {}).items())),
+        )
 
-        headers = self.session.headers
-        headers.update(kwargs.pop("headers", {}))
+        if not (future := self._in_flight.get(key)):
+            future = self._in_flight[key] = asyncio.ensure_future(
+                self._request(method, url, **kwargs)
+            )
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
 
-        if reason:
-            headers["X-Audit-Log-Reason"] = reason
+        # Shielded so that one caller being cancelled doesn't cancel the
+        # request for everyone else waiting on it.
+        return await asyncio.shield(future)
 
-        bucket_hash = f"{guild_id}:{channel_id}:{url}"
-        bucket: Union[Bucket, UnknownBucket] = self.buckets.get(
-            bucket_hash, UnknownBucket()
-        )
+    async def _request(
+        self,
+        method,
+        url,
+        *args,
+        guild_id: Union[str, int] = 0,
+        channel_id: Union[int, str] = 0,
+        reason: Optional[str] = None,
+        **kwargs,
+    ):
+        url = url.strip("/")
+        route, major = _route(method, url)
 
-        await asyncio.gather(self.global_ratelimit.wait(), bucket.event.wait())
+        if not major and (guild_id or channel_id):
+            major = f"guilds:{guild_id}" if guild_id else f"channels:{channel_id}"
 
-        res = await self.session.request(method, url, *args, **kwargs)
+        url = f"{self.base_uri}/{url}"
 
-        await self.log_request(res, kwargs.get("json", kwargs.get("data", None)))
+        headers = dict(kwargs.pop("headers", {}))
 
-        if isinstance(bucket, UnknownBucket) and res.headers.get("X-RateLimit-Bucket"):
-            if guild_id or channel_id:
-                self.buckets[bucket_hash] = Bucket(
-                    discord_hash=res.headers["X-RateLimit-Bucket"]
-                )
+        if reason:
+            headers["X-Audit-Log-Reason"] = reason
 
-            else:
-                b = Bucket(discord_hash=res.headers["X-RateLimit-Bucket"])
-                if b in self.buckets.values():
-                    self.buckets[bucket_hash] = list(self.bucket.values())[
-                        list(self.bucket.values()).index(b)
-                    ]
-                else:
-                    self.buckets[bucket_hash] = b
+        for _ in range(5):
+            bucket = self.get_bucket(route, major)
 
-        body: Union[Dict, str] = {}
+            await self.global_ratelimit.wait()
+            await bucket.acquire()
 
-        if res.headers["Content-Type"] == "application/json":
-            body = await res.json()
-        else:
-            body = await res.text()
-
-        if (
-            int(res.headers.get("X-RateLimit-Remaining", 1)) == 0
-            and res.status != HTTPCodes.TOO_MANY_REQUESTS
-        ):
-            logger.critical(
-                f"Exhausted {res.headers['X-RateLimit-Bucket']} ({res.url}). "
-                f"Reset in {res.headers['X-RateLimit-Reset-After']} seconds"
-            )
+            try:
+                res = await self.session.request(
+                    method, url, *args, headers=headers, **kwargs
+                )
+            except BaseException:
+                bucket.update(None)
+                raise
+
+            if (
+                res.status == HTTPCodes.TOO_MANY_REQUESTS
+                and "X-RateLimit-Limit" not in res.headers
+            ):
+                bucket.update(None)  # A global limit, the bucket itself is fine
+            else:
+                bucket.update(res.headers)
 
-            await asyncio.sleep(float(res.headers["X-RateLimit-Reset-After"]))
-        if res.status == HTTPCodes.TOO_MANY_REQUESTS:
-            time_to_sleep: float = (
-                body["retry_after"]  # type: ignore
-                if body["retry_after"] > res.headers["X-RateLimit-Reset-After"]  # type: ignore
-                else res.headers["X-RateLimit-Reset-After"]
+            self._learn_bucket_hash(
+                route, major, bucket, res.headers.get("X-RateLimit-Bucket")
             )
 
-            logger.critical(f"Rate limited. Reset in {time_to_sleep} seconds")
-
-            if res.headers["X-RateLimit-Scope"] == "global":
-                self.global_ratelimit.clear()
-
-            await bucket.event.clear()
+            response = await HTTPResponse.from_client_response(res)
+            body = response.data if response.data is not None else {}
 
-            await asyncio.sleep(time_to_sleep)
+            if logger.isEnabledFor(DEBUG):
+                self.log_request(res, response, kwargs.get("json", kwargs.get("data")))
 
-            self.global_ratelimit.set()
-            bucket.event.set()
+            if res.status == HTTPCodes.TOO_MANY_REQUESTS:
+                retry_after: float = float(
+                    body.get("retry_after", 1)  # type: ignore
+                    if isinstance(body, dict)
+                    else res.headers.get("Retry-After", 1)
+                )
 
-            return await self.request(method, url, *args, **kwargs, attempt=attempt + 1)
+                scope = res.headers.get("X-RateLimit-Scope")
+                logger.critical(
+                    f"Rate limited on {route} ({scope}). "
+                    f"Retrying in {retry_after} seconds"
+                )
 
-        if res.status >= HTTPCodes.SERVER_ERROR:
-            raise DiscordServerError5xx(body)
+                if res.headers.get("X-RateLimit-Global"):
+                    self.global_ratelimit.clear()
+                    await asyncio.sleep(retry_after)
+                    self.global_ratelimit.set()
+                else:
+                    bucket.exhaust(retry_after)
 
-        elif res.status == HTTPCodes.NOT_FOUND:
-            raise NotFound404(body)
+                continue
 
-        elif res.status == HTTPCodes.FORBIDDEN:
-            raise Forbidden403(body)
+            if res.status >= HTTPCodes.SERVER_ERROR:
+                raise DiscordServerError5xx(body)
 
-        elif not 300 > res.status >= 200:
-            raise DiscordAPIError(body)
+            elif res.status == HTTPCodes.NOT_FOUND:
+                raise NotFound404(body)
 
-        async def dispose():
-            await asyncio.sleep(300)
+            elif res.status == HTTPCodes.FORBIDDEN:
+                raise Forbidden403(body)
 
-            with contextlib.suppress(KeyError):
-                del self.buckets[bucket_hash]
+            elif not 300 > res.status >= 200:
+                raise DiscordAPIError(body)
 
-        bucket.close_task.cancel()
+            self._prune_buckets()
 
-        bucket.close_task = asyncio.create_task(dispose())
+            return response
 
-        return res
+        logger.critical(f"Failed a {method} {url} 5 times.")
 
     @staticmethod
-    async def log_request(res, body: Optional[dict] = None):
+    def log_request(
+        res: ClientResponse, response: HTTPResponse, body: Optional[Any] = None
+    ):
         message = [
-            f"Sent a {res.request_info.method} to {res.url} "
-            f"and got a {res.status} response. ",
-            f"Content-Type: {res.headers['Content-Type']} ",
+            f"Sent a {response.method} to {response.url} "
+            f"and got a {response.status} response. ",
+            f"Content-Type: {response.headers.get('Content-Type')} ",
         ]
 
         if body:
@@ -261,14 +552,13 @@ class HTTPClient:
         if h := dict(res.request_info.headers):
             message.append(f"Sent headers: {h} ")
 
-        if h := dict(res.headers):
+        if h := dict(response.headers):
             message.append(f"Received headers: {h} ")
 
-        try:
-            message.append(f"Received body: {await res.json()} ")
+        if response.data is not None:
+            message.append(f"Received body: {response.data} ")
 
-        finally:
-            logger.debug("".join(message))
+        logger.debug("".join(message))
 
     def base(
         self,
@@ -295,7 +585,7 @@ class HTTPClient:
             :class:`GetGatewayData`
         """
         res = await self.get("/gateway")
-        return await res.json()
+        return res.data
 
     async def get_gateway_bot(self) -> discord_typings.GetGatewayBotData:
         """
@@ -306,7 +596,7 @@ class HTTPClient:
             :class:`GetGatewayBotData`
         """
         res = await self.get("/gateway/bot")
-        return await res.json()
+        return res.data
 
 
-__all__ = ("HTTPClient",)
+__all__ = ("HTTPClient", "HTTPResponse")
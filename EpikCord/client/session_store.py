@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import time
+from typing import Optional, Union
+
+
+@dataclass
+class SessionState:
+    """What a shard needs to resume its gateway session."""
+
+    session_id: str
+    sequence: Optional[int]
+    resume_gateway_url: Optional[str]
+    saved_at: float = field(default_factory=time)
+
+
+class SessionStore:
+    """Keeps gateway sessions between runs, so a restarted client
+    can RESUME instead of identifying again.
+
+    Sessions are keyed by shard, see :attr:`WebsocketClient.session_key`.
+    Subclass this to keep them somewhere other than the disk.
+    """
+
+    max_age: float = 180.0
+    """How old, in seconds, a saved session may be and still be resumed.
+    Discord only keeps a disconnected session around for a short while."""
+
+    async def load(self, key: str) -> Optional[SessionState]:
+        raise NotImplementedError
+
+    async def save(self, key: str, state: SessionState):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+
+class FileSessionStore(SessionStore):
+    """Keeps each shard's session in its own JSON file in ``directory``,
+    so processes running different shards can share the directory.
+
+    Parameters
+    ----------
+    directory : Union[str, os.PathLike]
+        Where to keep the session files, created when first needed.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike] = ".sessions"):
+        self.directory: Path = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    async def load(self, key: str) -> Optional[SessionState]:
+        try:
+            return SessionState(**json.loads(self._path(key).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    async def save(self, key: str, state: SessionState):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(asdict(state)))
+        # Replacing is atomic, a crash mid-write can't leave a broken file.
+        os.replace(temporary, path)
+
+    async def delete(self, key: str):
+        self._path(key).unlink(missing_ok=True)
+
+
+__all__ = ("FileSessionStore", "SessionState", "SessionStore")
@@ -72,19 +72,19 @@ class UserClient:
 
     async def fetch_application(self) -> Application:
         application = Application(
-            await (await self._http.get("/oauth2/applications/@me")).json()
+            (await self._http.get("/oauth2/applications/@me")).data
         )
         self.application = application
         return application
 
     async def fetch_authorization_information(self) -> AuthorizationInformation:
-        data = await (await self._http.get("/oauth2/@me")).json()
+        data = (await self._http.get("/oauth2/@me")).data
         if self.application:
             data["application"] = self.application.to_dict()
         return AuthorizationInformation(data)
 
     async def fetch_connections(self) -> List[Connection]:
-        data = await (await self._http.get("/users/@me/connections")).json()
+        data = (await self._http.get("/users/@me/connections")).data
         return [Connection(self, d) for d in data]
 
     async def fetch_guilds(
@@ -101,8 +101,8 @@ class UserClient:
         if after:
             params["after"] = after
 
-        data = await self._http.get("/users/@me/guilds", params=params)
-        guilds = await data.json()
+        response = await self._http.get("/users/@me/guilds", params=params)
+        guilds = response.data
 
         return [PartialGuild(d) for d in guilds]
 
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict, deque
-from logging import getLogger
+from copy import copy
+from logging import DEBUG, getLogger
 from sys import platform
-from time import perf_counter
+from time import perf_counter, time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,18 +19,29 @@ from typing import (
     Union,
 )
 
-from EpikCord.managers import ChannelManager, GuildManager
+from EpikCord.managers import (
+    CachePolicy,
+    ChannelManager,
+    GuildManager,
+    MessageManager,
+    StickerManager,
+    UserManager,
+)
 
 from ..close_event_codes import GatewayCECode
 from ..close_handler import CloseHandlerLog, CloseHandlerRaise, close_dispatcher
-from ..exceptions import ClosedWebSocketConnection
-from ..ext.tasks import Task, task
+from ..exceptions import ClosedWebSocketConnection, InvalidArgumentType
+from ..ext.tasks import task
 from ..flags import Intents
 from ..opcodes import GatewayOpcode
 from ..ws_events import setup_ws_event_handler
+from .cache_snapshot import CacheSnapshot
 from .client_application import ClientApplication
 from .client_user import ClientUser
+from .compression import create_inflator, resolve_compression
+from .dispatcher import EventDispatcher
 from .http_client import HTTPClient
+from .session_store import SessionState, SessionStore
 
 if TYPE_CHECKING:
     import discord_typings
@@ -78,8 +90,16 @@ class WebsocketClient:
         intents: Union[Intents, int],
         presence: Optional[Presence] = None,
         discord_endpoint: str = "https://discord.com/api/v10",
+        cache_policies: Optional[Dict[str, CachePolicy]] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        encoding: str = "json",
+        compression: Optional[str] = "zlib-stream",
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: Optional[CacheSnapshot] = None,
+        keep_payloads: bool = True,
+        messages_per_channel: int = 100,
     ):
-        from EpikCord import Intents, Utils
+        from EpikCord import Intents, PermissionResolver, Utils
 
         self.token = token
         if not token:
@@ -90,26 +110,47 @@ class WebsocketClient:
         elif isinstance(intents, Intents):
             self.intents = intents
 
+        if encoding not in {"json", "etf"}:
+            raise InvalidArgumentType("encoding must be 'json' or 'etf'.")
+
         self._closed = True
+        self._reconnecting = False
         self.presence = presence
+        self.encoding: str = encoding
+        self.compression: Optional[str] = resolve_compression(compression)
 
         self.http: HTTPClient = HTTPClient(token, discord_endpoint=discord_endpoint)
 
         self.events: DefaultDict[str, List[Callback]] = defaultdict(list)
         self.wait_for_events: DefaultDict[str, List] = defaultdict(list)
+        self.dispatcher: EventDispatcher = dispatcher or EventDispatcher()
 
         self.heartbeats: Deque = deque(maxlen=10)
         self.heartbeat_interval: Optional[float] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._heartbeat_sent_at: Optional[float] = None
         self.session_id: Optional[str] = None
         self.sequence: Optional[int] = None
         self.gateway_url: Optional[str] = None
         self.resume_gateway_url: Optional[str] = None
+        self.session_store: Optional[SessionStore] = session_store
+        self.cache_snapshot: Optional[CacheSnapshot] = cache_snapshot
+        self._snapshot_task: Optional[asyncio.Task] = None
         self.websocket: Optional[GatewayWebsocket] = None
 
         self.utils = Utils(self)
 
+        # Keyed by manager name (guilds, channels, members, roles, emojis,
+        # stickers, users, messages), each manager of that kind gets its own copy.
+        self.cache_policies: Dict[str, CachePolicy] = cache_policies or {}
+        # Whether models keep the payload they were built from as ``data``.
+        self.keep_payloads: bool = keep_payloads
         self.guilds: GuildManager = GuildManager(self)
         self.channels: ChannelManager = ChannelManager(self)
+        self.stickers: StickerManager = StickerManager(self)
+        self.users: UserManager = UserManager(self)
+        self.messages: MessageManager = MessageManager(self, messages_per_channel)
+        self.permissions: PermissionResolver = PermissionResolver(self)
 
         self.user: Optional[ClientUser] = None
         self.application: Optional[ClientApplication] = None
@@ -148,13 +189,23 @@ class WebsocketClient:
                 "d": self.sequence,
             }
         )
+        # The ACK arrives through the read loop, see ``heartbeat_ack``.
+        self._heartbeat_sent_at = perf_counter()
 
-        start = perf_counter()
-        async for event in self.websocket:
-            if event.json()["op"] == GatewayOpcode.HEARTBEAT_ACK:
-                end = perf_counter()
-                break
-        self.latencies.append(end - start)
+    def heartbeat_ack(self):
+        if self._heartbeat_sent_at is not None:
+            self.latencies.append(perf_counter() - self._heartbeat_sent_at)
+            self._heartbeat_sent_at = None
+
+    async def _heartbeat_loop(self):
+        while not self._closed:
+            await self.heartbeat()
+            await self.save_session()
+
+    def start_heartbeat(self):
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
     async def handle_ws_event(self, event_data):
         raw_op_code = event_data["op"]
@@ -168,34 +219,106 @@ class WebsocketClient:
         handler = self.wse_handler.get(op_code)
         await handler(event_data)
 
-    async def connect(self, reconnect: bool = False):
-        url = None
+    @property
+    def session_key(self) -> str:
+        """What this client's session is saved under in the session store."""
+        return "0-1"
+
+    @property
+    def can_resume(self) -> bool:
+        return self.session_id is not None and self.sequence is not None
+
+    async def load_session(self):
+        """Pick up a session saved by a previous run, if it may still be resumed."""
+        if not self.session_store:
+            return
+
+        state = await self.session_store.load(self.session_key)
+        if not state:
+            return
+
+        if time() - state.saved_at > self.session_store.max_age:
+            await self.session_store.delete(self.session_key)
+            return
+
+        self.session_id = state.session_id
+        self.sequence = state.sequence
+        self.resume_gateway_url = state.resume_gateway_url
+        logger.info(f"Loaded session {self.session_id}, will try to resume it.")
 
-        if reconnect:
+    async def save_session(self):
+        if self.session_store and self.session_id:
+            await self.session_store.save(
+                self.session_key,
+                SessionState(self.session_id, self.sequence, self.resume_gateway_url),
+            )
+
+    async def invalidate_session(self):
+        """Forget the current session, so the next connection identifies."""
+        self.session_id = self.sequence = self.resume_gateway_url = None
+        if self.session_store:
+            await self.session_store.delete(self.session_key)
+
+    async def connect(self):
+        """Connect to the gateway, and keep reconnecting until :meth:`close`.
+        Reconnections resume the session when Discord allows it."""
+        if not self.session_id:
+            await self.load_session()
+            if self.cache_snapshot:
+                await self.cache_snapshot.load(self)
+
+        self._closed = False
+
+        if self.cache_snapshot and not self._snapshot_task:
+            self._snapshot_task = asyncio.create_task(self.cache_snapshot.run(self))
+
+        while not self._closed:
+            await self._connect()
+
+            if self._heartbeat_task:
+                self._heartbeat_task.cancel()
+
+            if self._closed:
+                break
+
+            if self._reconnecting:
+                self._reconnecting = False
+            else:
+                await self.handle_close()
+
+    async def _connect(self):
+        if self.can_resume and self.resume_gateway_url:
             url = self.resume_gateway_url
         else:
             if not self.gateway_url:
-                self.gateway_url = url = (await self.http.get_gateway())["url"]
+                self.gateway_url = (await self.http.get_gateway())["url"]
+            url = self.gateway_url
 
         logger.info("Connecting to gateway...")
-        self.websocket = await self.http.ws_connect(  # type: ignore
-            f"{url}?v=10&encoding=json&compress=zlib-stream"
-        )
+        url = f"{url}?v=10&encoding={self.encoding}"
+        if self.compression:
+            url += f"&compress={self.compression}"
+
+        self.websocket = await self.http.ws_connect(url)  # type: ignore
+        self.websocket.encoding = self.encoding  # type: ignore
+        self.websocket.inflator = create_inflator(self.compression)  # type: ignore
         logger.info("Connected to gateway! Listening to events!")
         self.websocket_ratelimiter = GatewayRateLimiter()
-        self._closed = False
 
         async for event in self.websocket:  # type: ignore
             event_data = event.json()
-            logger.debug(
-                f"Received {event_data} from the Websocket Connection to Discord."
-            )
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(
+                    f"Received {event_data} from the Websocket Connection to Discord."
+                )
             await self.handle_ws_event(event_data)
-        await self.handle_close()
 
     async def reconnect(self):
-        await self.close()
-        await self.connect()
+        """Drop the connection, :meth:`connect` then opens a new one."""
+        self._reconnecting = True
+        if self.websocket is not None and not self.websocket.closed:
+            # Anything but 1000 and 1001 keeps the session resumable.
+            await self.websocket.close(code=4000)
 
     async def resume(self):
         await self.send_json(
@@ -213,7 +336,12 @@ class WebsocketClient:
         if hasattr(self, f"_{event_name}"):
             await getattr(self, f"_{event_name}")(data)
 
-        for wait_for_callback in self.wait_for_events[event_name]:
+        # A copy, as waiters are removed from the list along the way.
+        for wait_for_callback in list(self.wait_for_events[event_name]):
+            if wait_for_callback[0].done():
+                # Timed out or cancelled, nothing is waiting on it anymore.
+                self.wait_for_events[event_name].remove(wait_for_callback)
+                continue
 
             try:
                 check_results = await wait_for_callback[1](data)
@@ -224,12 +352,31 @@ class WebsocketClient:
                 wait_for_callback[0].set_result(data)
                 self.wait_for_events[event_name].remove(wait_for_callback)
 
+    def has_listeners(self, event_name: str) -> bool:
+        """Whether anything is listening for ``event_name``.
+
+        Event handlers use this to skip building models nobody will see,
+        ``wait_for`` doesn't count as it gets the raw payload.
+        """
+        return bool(self.events.get(event_name))
+
+    def _snapshot(self, event_name: str, obj: Any) -> Any:
+        """A shallow copy of ``obj`` before an update is applied to it in place,
+        to dispatch as ``before``. Only made when something listens for
+        ``event_name``. Managers, like a guild's roles, are shared with ``obj``."""
+        if obj is None or not self.has_listeners(event_name):
+            return None
+        return copy(obj)
+
     async def dispatch(self, event_name: str, *args: Any, **kwargs: Any):
-        for callback in self.events[event_name]:
-            await callback(*args, **kwargs)
-        logger.info(
-            f"Dispatched {event_name} to {len(self.events[event_name])} listeners."
-        )
+        callbacks = self.events.get(event_name)
+        if not callbacks:
+            return
+
+        key = self.dispatcher.key_for(args)
+        for callback in callbacks:
+            await self.dispatcher.submit(callback, *args, key=key, **kwargs)
+        logger.info(f"Dispatched {event_name} to {len(callbacks)} listeners.")
 
     def wait_for(
         self,
@@ -260,7 +407,7 @@ class WebsocketClient:
                 return True
 
         self.wait_for_events[event_name.lower()].append((future, check))
-        return asyncio.wait_for(future, timeout=timeout)
+        return asyncio.wait_for(future, timeout=timeout or None)
 
     def event(self, event_name: Optional[str] = None):
         def register_event(func):
@@ -294,8 +441,8 @@ class WebsocketClient:
             report_msg = "\n\nReport this immediately" * ch_ins.need_report
             logger.critical(ch_ins.message + report_msg)
 
-        if ch_ins.resumable:
-            await self.resume()
+        if not ch_ins.resumable:
+            await self.invalidate_session()
 
     async def send_json(self, json: dict):
 
@@ -307,7 +454,7 @@ class WebsocketClient:
             self.websocket_ratelimiter = GatewayRateLimiter()
 
         await self.websocket_ratelimiter.tick()
-        await self.websocket.send_json(json)
+        await self.websocket.send_payload(json)
 
         logger.debug(f"Sent {json} to the Websocket Connection to Discord.")
 
@@ -315,11 +462,26 @@ class WebsocketClient:
         if self._closed:
             return
 
+        self._closed = True
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+
+        await self.save_session()
+
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+        if self.cache_snapshot:
+            await self.cache_snapshot.save(self)
+
         if self.websocket is not None and not self.websocket.closed:
-            await self.handle_close()
+            # 4000 rather than 1000, so the session can be resumed by the next run.
             await self.websocket.close(code=4000)
 
-        self._closed = True
+        await self._close_dispatcher()
+
+    async def _close_dispatcher(self):
+        await self.dispatcher.close()
 
     async def identify(self):
         await self.send_json(
@@ -337,9 +499,6 @@ class WebsocketClient:
             }
         )
 
-        heartbeat = Task(self.heartbeat, self.heartbeat_interval, -1)
-        heartbeat.run()
-
     def login(self):
         loop = asyncio.get_event_loop()
 
@@ -365,6 +524,9 @@ class WebsocketClient:
             self.utils.cleanup_loop(loop)
 
     async def _voice_server_update(self, data: discord_typings.VoiceServerUpdateData):
+        if not self.has_listeners("voice_server_update"):
+            return
+
         payload = {
             "token": data["token"],
             "endpoint": data["endpoint"],
@@ -379,34 +541,173 @@ class WebsocketClient:
     async def _voice_state_update(self, data: discord_typings.VoiceStateUpdateData):
         from EpikCord import VoiceState
 
+        guild = self.guilds.get(int(data["guild_id"])) if data.get("guild_id") else None
+        cached = guild and not guild.unavailable and guild.voice_states.enabled
+        if not cached and not self.has_listeners("voice_state_update"):
+            return
+
+        voice_state = VoiceState(self, data)
+        if cached:
+            if voice_state.channel_id:
+                guild.voice_states.add_to_cache(voice_state.user_id, voice_state)
+            else:
+                guild.voice_states.remove_from_cache(voice_state.user_id)
+
         await self.dispatch(
-            "voice_state_update", VoiceState(self, data)
+            "voice_state_update", voice_state
         )  # TODO: Make this return something like (VoiceState, Member) or make VoiceState get Member from member_id
 
+    def _forget_guild_channels(self, guild_id: int):
+        for channel in self.channels.guild_channels(guild_id):
+            self.channels.remove_from_cache(channel.id)
+            self.messages.forget_channel(channel.id)
+        for thread in self.channels.guild_threads(guild_id):
+            self.channels.remove_from_cache(thread.id)
+            self.messages.forget_channel(thread.id)
+
     async def _guild_delete(self, data: discord_typings.GuildDeleteData):
-        if guild := self.guilds.remove_from_cache(data["id"]):
+        guild_id = int(data["id"])
+        self._forget_guild_channels(guild_id)
+        self.permissions.invalidate_guild(guild_id)
+        if guild := self.guilds.remove_from_cache(guild_id):
             await self.dispatch("guild_delete", guild)
 
     async def _interaction_create(self, data: discord_typings.InteractionCreateData):
+        if not self.has_listeners("interaction_create"):
+            return
+
         interaction = self.utils.interaction_from_type(data)
         await self.dispatch("interaction_create", interaction)
 
     async def _channel_create(self, data: discord_typings.ChannelCreateData):
+        if not self.channels.enabled and not self.has_listeners("channel_create"):
+            return
+
         channel = self.utils.channel_from_type(data)
         self.channels.add_to_cache(channel.id, channel)
         await self.dispatch("channel_create", channel)
 
+    async def _channel_update(self, data: discord_typings.ChannelUpdateData):
+        from ..abstract import BaseChannel
+
+        if data.get("guild_id"):
+            self.permissions.invalidate_channel(data["guild_id"], data["id"])
+
+        channel = self.channels.get(int(data["id"]))
+        if isinstance(channel, BaseChannel) and channel.type == data["type"]:
+            before = self._snapshot("channel_update", channel)
+            channel._update(data)
+        elif self.channels.enabled or self.has_listeners("channel_update"):
+            before, channel = channel, self.utils.channel_from_type(data)
+        else:
+            return
+
+        if self.channels.enabled:
+            self.channels.add_to_cache(channel.id, channel)
+        await self.dispatch("channel_update", before, channel)
+
+    async def _channel_delete(self, data: discord_typings.ChannelDeleteData):
+        channel_id = int(data["id"])
+        channel = self.channels.remove_from_cache(channel_id)
+        self.messages.forget_channel(channel_id)
+        if data.get("guild_id"):
+            self.permissions.invalidate_channel(data["guild_id"], channel_id)
+        # Deleting a channel deletes its threads, without a THREAD_DELETE for each.
+        for thread in self.channels.threads_of(channel_id):
+            self.channels.remove_from_cache(thread.id)
+            self.messages.forget_channel(thread.id)
+
+        if self.has_listeners("channel_delete"):
+            await self.dispatch(
+                "channel_delete", channel or self.utils.channel_from_type(data)
+            )
+
+    async def _thread_create(self, data: discord_typings.ThreadCreateData):
+        from EpikCord import Thread
+
+        if not self.channels.enabled and not self.has_listeners("thread_create"):
+            return
+
+        thread = Thread(self, data)
+        self.channels.add_to_cache(thread.id, thread)
+        await self.dispatch("thread_create", thread)
+
+    async def _thread_update(self, data: discord_typings.ThreadUpdateData):
+        from EpikCord import Thread
+
+        thread = self.channels.get(int(data["id"]))
+        if isinstance(thread, Thread):
+            before = self._snapshot("thread_update", thread)
+            thread._update(data)
+        elif self.channels.enabled or self.has_listeners("thread_update"):
+            before, thread = None, Thread(self, data)
+        else:
+            return
+
+        if self.channels.enabled:
+            self.channels.add_to_cache(thread.id, thread)
+        await self.dispatch("thread_update", before, thread)
+
+    async def _thread_delete(self, data: discord_typings.ThreadDeleteData):
+        self.messages.forget_channel(data["id"])
+        if thread := self.channels.remove_from_cache(int(data["id"])):
+            await self.dispatch("thread_delete", thread)
+
     async def _message_create(self, data: discord_typings.MessageCreateData):
         """Event fired when messages are created"""
         from EpikCord import Message
 
+        if not self.messages.enabled and not self.has_listeners("message_create"):
+            return
+
         message: Message = Message(self, data)
+        if self.messages.enabled:
+            self.messages.add_to_cache(message.id, message)
+
+        if not self.has_listeners("message_create"):
+            return
+
         if not message.channel:
-            message.channel = await self.channels.fetch(data["channel_id"])
+            message.channel = await self.channels.get_or_fetch(data["channel_id"])
         await self.dispatch("message_create", message)
 
+    async def _message_update(self, data: discord_typings.MessageUpdateData):
+        """Dispatches ``message_update`` with the message as it was, if it was
+        cached, and as it is now."""
+        from EpikCord import Message
+
+        if (message := self.messages.get(int(data["id"]))) is not None:
+            before = self._snapshot("message_update", message)
+            message._update(data)
+        # Updates that only add embeds are partial, there's not enough to
+        # build a message we don't already have from.
+        elif "author" in data:
+            before, message = None, Message(self, data)  # type: ignore
+            if self.messages.enabled:
+                self.messages.add_to_cache(message.id, message)
+        else:
+            return
+
+        await self.dispatch("message_update", before, message)
+
+    async def _message_delete(self, data: discord_typings.MessageDeleteData):
+        """Dispatches ``message_delete`` with the deleted message, if it was cached."""
+        if message := self.messages.remove_from_cache(int(data["id"])):
+            await self.dispatch("message_delete", message)
+
+    async def _message_delete_bulk(self, data: discord_typings.MessageDeleteBulkData):
+        """Dispatches ``message_delete_bulk`` with the deleted messages
+        that were cached."""
+        messages = [
+            message
+            for message_id in data["ids"]
+            if (message := self.messages.remove_from_cache(int(message_id)))
+        ]
+        if messages:
+            await self.dispatch("message_delete_bulk", messages)
+
     async def _guild_create(self, data: discord_typings.GuildCreateData):
-        from EpikCord import Guild, Thread, UnavailableGuild
+        from EpikCord import Guild, UnavailableGuild
 
         if data.get("unavailable") is None:
             return  # TODO: Maybe a different event where the name says the Bot is removed on startup.
@@ -420,29 +721,132 @@ class WebsocketClient:
 
         self.guilds.add_to_cache(guild.id, guild)
 
-        for channel in data["channels"]:
-            self.channels.add_to_cache(
-                data["id"], self.utils.channel_from_type(channel)
-            )
-
-        for thread in data["threads"]:
-            self.channels.add_to_cache(data["id"], Thread(self, thread))
+        if self.channels.enabled and isinstance(guild, Guild):
+            # A guild can be created again after an outage, anything deleted
+            # meanwhile has to go.
+            self._forget_guild_channels(guild.id)
+            for channel in guild.channels:
+                self.channels.add_to_cache(channel.id, channel)
 
         await self.dispatch("guild_create", guild)
         # TODO: Add other attributes to cache
 
-    async def _guild_member_update(self, data: discord_typings.GuildMemberUpdateData):
+    async def _guild_member_add(self, data: discord_typings.GuildMemberAddData):
         from EpikCord import GuildMember
 
-        guild_member = GuildMember(self, data)  # type: ignore
-        guild = self.guilds.get(data["guild_id"])
-        if not guild:
-            guild = await self.guilds.fetch(int(data["guild_id"]))
-        if not guild:
-            logger.critical("Guild was not found in cache, and could not be fetched.")
+        guild = self.guilds.get(int(data["guild_id"]))
+        cached = guild and not guild.unavailable and guild.members.enabled
+        if not cached and not self.has_listeners("guild_member_add"):
+            return
+
+        member = GuildMember(self, data)  # type: ignore
+        if cached:
+            guild.members.add_to_cache(member.id, member)
+        await self.dispatch("guild_member_add", member)
+
+    async def _guild_member_remove(self, data: discord_typings.GuildMemberRemoveData):
+        self.permissions.invalidate_member(data["guild_id"], data["user"]["id"])
+        guild = self.guilds.get(int(data["guild_id"]))
+        member = None
+        if guild and not guild.unavailable:
+            member = guild.members.remove_from_cache(int(data["user"]["id"]))
+
+        if self.has_listeners("guild_member_remove"):
+            await self.dispatch(
+                "guild_member_remove", member or self.users.store(data["user"])
+            )
+
+    async def _guild_member_update(self, data: discord_typings.GuildMemberUpdateData):
+        from EpikCord import Guild, GuildMember
+
+        self.permissions.invalidate_member(data["guild_id"], data["user"]["id"])
+        guild = self.guilds.get(int(data["guild_id"]))
+        listening = self.has_listeners("guild_member_update") or self.has_listeners(
+            "guild_member_edit"
+        )
+        if not isinstance(guild, Guild):
+            if not listening:
+                return
+            guild = await self.guilds.get_or_fetch(data["guild_id"])
+            if not guild:
+                logger.critical(
+                    "Guild was not found in cache, and could not be fetched."
+                )
+                return
+
+        if (member := guild.members.get(int(data["user"]["id"]))) is not None:
+            before = self._snapshot("guild_member_edit", member)
+            member._update(data)
+        elif guild.members.enabled or listening:
+            before, member = None, GuildMember(self, data)  # type: ignore
+        else:
+            return
+
+        if guild.members.enabled:
+            # Again even when updated in place, to refile it by its new roles.
+            guild.members.add_to_cache(member.id, member)
+        # guild_member_update keeps taking just the member, as it always has.
+        # guild_member_edit is for listeners that want it before the update.
+        await self.dispatch("guild_member_update", member)
+        await self.dispatch("guild_member_edit", before, member)
+
+    async def _guild_update(self, data: discord_typings.GuildUpdateData):
+        from EpikCord import Guild
+
+        # The owner or roles may have changed.
+        self.permissions.invalidate_guild(data["id"])
+        guild = self.guilds.get(int(data["id"]))
+        if isinstance(guild, Guild):
+            before = self._snapshot("guild_update", guild)
+            guild._update(data)
+        elif self.guilds.enabled or self.has_listeners("guild_update"):
+            before, guild = None, Guild(self, data)
+            if self.guilds.enabled:
+                self.guilds.add_to_cache(guild.id, guild)
+        else:
+            return
+
+        await self.dispatch("guild_update", before, guild)
+
+    async def _guild_role_create(self, data: discord_typings.GuildRoleCreateData):
+        from EpikCord import Guild, Role
+
+        self.permissions.invalidate_guild(data["guild_id"])
+        guild = self.guilds.get(int(data["guild_id"]))
+        if not isinstance(guild, Guild):
+            return
+
+        role = Role(self, {**data["role"], "guild": guild})  # type: ignore
+        guild.roles.add_to_cache(role.id, role)
+        await self.dispatch("guild_role_create", role)
 
-        guild.members.cache[guild_member.id] = guild_member
-        await self.dispatch("guild_member_update", guild_member)
+    async def _guild_role_update(self, data: discord_typings.GuildRoleUpdateData):
+        from EpikCord import Guild, Role
+
+        self.permissions.invalidate_guild(data["guild_id"])
+        guild = self.guilds.get(int(data["guild_id"]))
+        if not isinstance(guild, Guild):
+            return
+
+        payload = {**data["role"], "guild": guild}
+        if (role := guild.roles.get(int(data["role"]["id"]))) is not None:
+            before = self._snapshot("guild_role_update", role)
+            role._update(payload)  # type: ignore
+        else:
+            before, role = None, Role(self, payload)  # type: ignore
+            guild.roles.add_to_cache(role.id, role)
+        await self.dispatch("guild_role_update", before, role)
+
+    async def _guild_role_delete(self, data: discord_typings.GuildRoleDeleteData):
+        from EpikCord import Guild
+
+        self.permissions.invalidate_guild(data["guild_id"])
+        guild = self.guilds.get(int(data["guild_id"]))
+        if not isinstance(guild, Guild):
+            return
+
+        if role := guild.roles.remove_from_cache(int(data["role_id"])):
+            await self.dispatch("guild_role_delete", role)
 
     async def _ready(self, data: discord_typings.ReadyData):
         from EpikCord import ClientApplication, ClientUser
@@ -451,11 +855,17 @@ class WebsocketClient:
         self.session_id = data["session_id"]
         self.resume_gateway_url = data["resume_gateway_url"]
         application_response = await self.http.get("/oauth2/applications/@me")
-        application_data = await application_response.json()
+        application_data = application_response.data
 
         self.application = ClientApplication(self, application_data)
+        await self.save_session()
 
         await self.dispatch("ready")
 
+    async def _resumed(self, data: Dict):
+        logger.info(f"Resumed session {self.session_id}.")
+        await self.save_session()
+        await self.dispatch("resumed")
+
 
 __all__ = ("WebsocketClient", "Event")
@@ -74,7 +74,11 @@ close_dispatcher: Dict[GatewayCECode, CloseHandler] = {
         "EpikCord.py tried to authenticate again.", need_report=True
     ),
     GatewayCECode.InvalidSequence: CloseHandlerLog(
-        "EpikCord.py sent an invalid sequence number.", need_report=True
+        "EpikCord.py sent an invalid sequence number.",
+        resumable=False,
+        need_report=True,
+    ),
+    GatewayCECode.SessionTimedOut: CloseHandlerLog(
+        "Session timed out.", resumable=False
     ),
-    GatewayCECode.SessionTimedOut: CloseHandlerLog("Session timed out."),
 }
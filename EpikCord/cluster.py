@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from inspect import isawaitable
+from itertools import count
+from logging import getLogger
+from multiprocessing.connection import Connection
+from os import cpu_count
+from pickle import PicklingError
+from threading import Thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .client import HTTPClient
+from .flags import Intents
+from .sharding import IdentifyScheduler, ShardManager
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+logger = getLogger(__name__)
+
+QueryHandler = Callable[..., Coroutine[Any, Any, Any]]
+
+# Messages on the bus are tuples, the first item is one of these.
+_DISPATCH = "dispatch"
+_QUERY = "query"
+_IDENTIFY = "identify"
+_REPLY = "reply"
+_RESULT = "result"
+
+
+def _read_in_background(connection: Connection) -> asyncio.Queue:
+    """Receive from ``connection`` on a daemon thread, since receiving blocks.
+    The queue gets ``None`` once the other end is closed."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def read():
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                message = None
+
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+            except RuntimeError:  # The loop is closed.
+                return
+
+            if message is None:
+                return
+
+    Thread(target=read, daemon=True).start()
+    return queue
+
+
+def split_shards(shards: int, clusters: int) -> List[List[int]]:
+    """Split ``shards`` shard IDs into ``clusters`` contiguous, even slices."""
+    size, extra = divmod(shards, clusters)
+    slices, start = [], 0
+    for cluster_id in range(clusters):
+        end = start + size + (cluster_id < extra)
+        slices.append(list(range(start, end)))
+        start = end
+    return slices
+
+
+class ClusterBus:
+    """A cluster's connection to every other cluster of a :class:`ClusterManager`.
+
+    Available as ``manager.cluster`` on the :class:`ShardManager` of each
+    cluster process.
+
+    Attributes
+    ----------
+    cluster_id : int
+        The ID of this cluster.
+    cluster_count : int
+        How many clusters the bot is running.
+    manager : Optional[ShardManager]
+        The shard manager running this cluster's shards.
+    """
+
+    def __init__(self, cluster_id: int, cluster_count: int, connection: Connection):
+        self.cluster_id: int = cluster_id
+        self.cluster_count: int = cluster_count
+        self.manager: Optional[ShardManager] = None
+        self._connection: Connection = connection
+        self._handlers: Dict[str, QueryHandler] = {"stats": self._stats}
+        self._results: Dict[int, asyncio.Future] = {}
+        self._nonces = count()
+
+    def handler(self, name: Optional[str] = None):
+        """Register a coroutine other clusters can call with :meth:`query`."""
+
+        def register_handler(func: QueryHandler):
+            self._handlers[name or func.__name__] = func
+            return func
+
+        return register_handler
+
+    async def broadcast(self, event_name: str, *args: Any):
+        """Dispatch ``event_name`` to the listeners of every other cluster.
+        The arguments must be picklable."""
+        self._connection.send((_DISPATCH, event_name, args))
+
+    async def query(
+        self,
+        name: str,
+        *args: Any,
+        cluster_id: Optional[int] = None,
+        timeout: float = 10.0,
+        **kwargs: Any,
+    ) -> Dict[int, Any]:
+        """Call the handler registered as ``name`` on one cluster,
+        or every cluster (this one included) if ``cluster_id`` is ``None``.
+
+        Returns
+        -------
+        Dict[int, Any]
+            What each cluster's handler returned, keyed by cluster ID.
+            Clusters whose handler raised map to the exception instead.
+        """
+        nonce = next(self._nonces)
+        future = self._results[nonce] = asyncio.get_running_loop().create_future()
+        self._connection.send((_QUERY, nonce, cluster_id, name, args, kwargs))
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._results.pop(nonce, None)
+
+    async def wait_to_identify(self, shard_id: int):
+        """Wait for the parent process to let ``shard_id`` identify."""
+        nonce = next(self._nonces)
+        future = self._results[nonce] = asyncio.get_running_loop().create_future()
+        self._connection.send((_IDENTIFY, nonce, shard_id))
+
+        try:
+            await future
+        finally:
+            self._results.pop(nonce, None)
+
+    async def _stats(self) -> Dict[str, Any]:
+        shards = self.manager.shards if self.manager else []
+        return {
+            "shards": [shard.shard_id[0] for shard in shards],
+            "guilds": sum(len(shard.guilds.cache) for shard in shards),
+            "latency": [shard.latency for shard in shards],
+        }
+
+    async def _answer(self, origin: Tuple[int, int], name: str, args, kwargs):
+        try:
+            handler = self._handlers[name]
+            result: Any = await handler(*args, **kwargs)
+        except Exception as e:
+            result = e
+
+        try:
+            self._connection.send((_REPLY, origin, self.cluster_id, result))
+        except (PicklingError, AttributeError, TypeError) as e:
+            self._connection.send(
+                (_REPLY, origin, self.cluster_id, RuntimeError(repr(e)))
+            )
+
+    async def listen(self):
+        messages = _read_in_background(self._connection)
+
+        while (message := await messages.get()) is not None:
+            kind = message[0]
+            if kind == _DISPATCH and self.manager:
+                await self.manager.dispatch(message[1], *message[2])
+            elif kind == _QUERY:
+                asyncio.create_task(self._answer(*message[1:]))
+            elif kind == _RESULT:
+                future = self._results.get(message[1])
+                if future and not future.done():
+                    future.set_result(message[2])
+
+
+class ClusterIdentifyScheduler(IdentifyScheduler):
+    """Leaves identify scheduling to the :class:`ClusterManager`,
+    which sees the shards of every cluster."""
+
+    def __init__(self, bus: ClusterBus):
+        super().__init__()
+        self.bus: ClusterBus = bus
+
+    async def acquire(self, shard_id: int):
+        await self.bus.wait_to_identify(shard_id)
+
+
+def _run_cluster(
+    cluster_id: int,
+    cluster_count: int,
+    shard_ids: List[int],
+    shard_count: int,
+    connection: Connection,
+    token: str,
+    intents: Union[Intents, int],
+    setup: Optional[Callable[[ShardManager], Any]],
+    options: Dict[str, Any],
+):
+    async def main():
+        bus = ClusterBus(cluster_id, cluster_count, connection)
+        manager = ShardManager(
+            token,
+            intents,
+            shards=shard_count,
+            shard_ids=shard_ids,
+            identify_scheduler=ClusterIdentifyScheduler(bus),
+            **options,
+        )
+        manager.cluster = bus
+        bus.manager = manager
+
+        if setup and isawaitable(result := setup(manager)):
+            await result
+
+        listener = asyncio.create_task(manager.cluster.listen())
+        try:
+            await manager.start()
+        finally:
+            listener.cancel()
+            await manager.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+class ClusterManager:
+    """Runs a bot's shards across several processes, so they can use every core.
+
+    Every process runs a :class:`ShardManager` for its own slice of shards,
+    with its own caches. Since listeners can't be sent to another process,
+    they're registered by ``setup``, which runs in each cluster process.
+    ``setup`` must be importable (defined at the top level of a module),
+    and may be a coroutine function.
+
+    Clusters talk to each other through ``manager.cluster``,
+    see :class:`ClusterBus`.
+
+    Parameters
+    ----------
+    token : str
+        The bot's token.
+    intents : Union[Intents, int]
+        The intents every shard identifies with.
+    clusters : Optional[int]
+        How many processes to run, defaults to the number of cores.
+    shards : Optional[int]
+        How many shards to run in total, defaults to Discord's recommendation.
+    setup : Optional[Callable[[ShardManager], Any]]
+        Called with each cluster's :class:`ShardManager` before it starts.
+    **options
+        Passed through to every :class:`ShardManager`.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        intents: Union[Intents, int],
+        *,
+        clusters: Optional[int] = None,
+        shards: Optional[int] = None,
+        setup: Optional[Callable[[ShardManager], Any]] = None,
+        **options: Any,
+    ):
+        self.token: str = token
+        self.intents: Union[Intents, int] = intents
+        self.desired_clusters: int = clusters or cpu_count() or 1
+        self.desired_shards: Optional[int] = shards
+        self.setup: Optional[Callable[[ShardManager], Any]] = setup
+        self.options: Dict[str, Any] = options
+
+        self.processes: List[BaseProcess] = []
+        self._connections: List[Connection] = []
+        # Outstanding queries, keyed by (cluster that asked, its nonce), to
+        # the clusters yet to answer and the answers so far.
+        self._pending: Dict[Tuple[int, int], Tuple[set, Dict[int, Any]]] = {}
+        self._alive: set = set()
+        self.identify_scheduler: Optional[IdentifyScheduler] = None
+
+    def _send(self, cluster_id: int, message: tuple):
+        try:
+            self._connections[cluster_id].send(message)
+        except (BrokenPipeError, OSError):
+            self._cluster_exited(cluster_id)
+
+    def _reply(self, origin: Tuple[int, int], cluster_id: int, result: Any):
+        pending = self._pending.get(origin)
+        if not pending:
+            return
+
+        waiting, results = pending
+        results[cluster_id] = result
+        waiting.discard(cluster_id)
+        if not waiting:
+            del self._pending[origin]
+            self._send(origin[0], (_RESULT, origin[1], results))
+
+    def _cluster_exited(self, cluster_id: int):
+        if cluster_id not in self._alive:
+            return
+
+        self._alive.discard(cluster_id)
+        logger.warning(f"Cluster {cluster_id} has exited.")
+        for origin, (waiting, _) in list(self._pending.items()):
+            if cluster_id in waiting:
+                self._reply(origin, cluster_id, ConnectionError("Cluster exited."))
+
+    def _route(self, source: int, message: tuple):
+        kind = message[0]
+
+        if kind == _DISPATCH:
+            for cluster_id in self._alive - {source}:
+                self._send(cluster_id, message)
+
+        elif kind == _QUERY:
+            _, nonce, target, name, args, kwargs = message
+            targets = self._alive if target is None else {target} & self._alive
+            origin = (source, nonce)
+
+            if not targets:
+                self._send(source, (_RESULT, nonce, {}))
+                return
+
+            self._pending[origin] = (set(targets), {})
+            for cluster_id in targets:
+                self._send(cluster_id, (_QUERY, origin, name, args, kwargs))
+
+        elif kind == _IDENTIFY:
+            asyncio.create_task(self._identify(source, *message[1:]))
+
+        elif kind == _REPLY:
+            _, origin, cluster_id, result = message
+            self._reply(origin, cluster_id, result)
+
+    async def _identify(self, source: int, nonce: int, shard_id: int):
+        await self.identify_scheduler.acquire(shard_id)  # type: ignore
+        self._send(source, (_RESULT, nonce, None))
+
+    async def _read(self, cluster_id: int):
+        messages = _read_in_background(self._connections[cluster_id])
+
+        while (message := await messages.get()) is not None:
+            self._route(cluster_id, message)
+
+        self._cluster_exited(cluster_id)
+
+    async def start(self):
+        http = HTTPClient(
+            self.token,
+            discord_endpoint=self.options.get(
+                "discord_endpoint", "https://discord.com/api/v10"
+            ),
+        )
+        try:
+            gateway = await http.get_gateway_bot()
+        finally:
+            await http.session.close()
+
+        # One scheduler for every cluster, as the identify limit is per bot.
+        self.identify_scheduler = IdentifyScheduler.from_gateway(gateway)
+        shards = self.desired_shards or gateway["shards"]
+        slices = split_shards(shards, min(self.desired_clusters, shards))
+        context = multiprocessing.get_context("spawn")
+
+        for cluster_id, shard_ids in enumerate(slices):
+            options = self.options
+            if cluster_id and options.get("overwrite_commands_on_ready"):
+                # Commands belong to the application, once is enough.
+                options = {**options, "overwrite_commands_on_ready": False}
+
+            connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_run_cluster,
+                args=(
+                    cluster_id,
+                    len(slices),
+                    shard_ids,
+                    shards,
+                    child_connection,
+                    self.token,
+                    self.intents,
+                    self.setup,
+                    options,
+                ),
+                name=f"EpikCord-cluster-{cluster_id}",
+            )
+            process.start()
+            child_connection.close()
+
+            self.processes.append(process)
+            self._connections.append(connection)
+            self._alive.add(cluster_id)
+            logger.info(f"Started cluster {cluster_id} with shards {shard_ids}.")
+
+        await asyncio.gather(*(self._read(cluster_id) for cluster_id in self._alive))
+
+    def close(self):
+        for process in self.processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+
+        for connection in self._connections:
+            connection.close()
+
+    def run(self):
+        loop = asyncio.get_event_loop()
+        try:
+            loop.run_until_complete(self.start())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+
+__all__ = (
+    "ClusterBus",
+    "ClusterIdentifyScheduler",
+    "ClusterManager",
+    "split_shards",
+)
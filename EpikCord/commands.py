@@ -1,8 +1,9 @@
 from logging import getLogger
-from typing import Any, Callable, Coroutine, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 from .abstract import BaseCommand
-from .exceptions import FailedCheck
+from .converters import OptionBinder
+from .exceptions import FailedCheck, InvalidOption
 from .localizations import Localization
 from .options import AnyOption
 
@@ -15,29 +16,29 @@ Callback = Callable[..., Coroutine[Any, Any, Any]]
 class Check:
     def __init__(self, callback: Callback):
         self.callback: Callback = callback
-        self.success_callback: Callback = self._default_success
-        self.failure_callback: Callback = self._default_failure
+        self.success_callback: Callback = self.default_success
+        self.failure_callback: Callback = self.default_failure
 
     def success(self, callback: Optional[Callable] = None):
-        self.success_callback = callback or self._default_success
+        self.success_callback = callback or self.default_success
 
     def failure(self, callback: Optional[Callable] = None):
-        self.failure_callback = callback or self._default_failure
+        self.failure_callback = callback or self.default_failure
 
     async def default_success(self, interaction):
         logger.info(
             f"{interaction.author.username} ({interaction.author.id}) passed "
-            f"the check {self.command_callback.__name__}. "
+            f"the check {self.callback.__name__}. "
         )
 
     async def default_failure(self, interaction):
         logger.critical(
             f"{interaction.author.username} ({interaction.author.id}) failed "
-            f"the check {self.command_callback.__name__}. "
+            f"the check {self.callback.__name__}. "
         )
         raise FailedCheck(
             f"{interaction.author.username} ({interaction.author.id}) failed "
-            f"the check {self.command_callback.__name__}. "
+            f"the check {self.callback.__name__}. "
         )
 
 
@@ -71,7 +72,7 @@ class ClientUserCommand(BaseCommand):
         return 2
 
     def to_dict(self):
-        return {"name": self.name}
+        return {"name": self.name, "type": self.type}
 
 
 class ClientSlashCommand(BaseCommand):
@@ -109,6 +110,30 @@ class ClientSlashCommand(BaseCommand):
 
         return wrapper
 
+    def subcommand(self, name: str, *, group: Optional[str] = None):
+        """Set the callback for one of this command's subcommands, ``group``
+        being the subcommand group it's in, if any. Subcommands without one
+        are handled by the command's own callback."""
+
+        def wrapper(func):
+            options = self.options
+            if group is not None:
+                options = next(
+                    (o.options for o in options if o.type == 2 and o.name == group),
+                    [],
+                )
+
+            for option in options:
+                if option.type == 1 and option.name == name:
+                    option.binder = OptionBinder(func, option.options)
+                    option.callback = func
+                    return func
+
+            path = f"{group} {name}" if group else name
+            raise InvalidOption(f"Command {self.name} has no subcommand {path}.")
+
+        return wrapper
+
     def to_dict(self):
         payload = {
             "name": self.name,
@@ -118,13 +143,13 @@ class ClientSlashCommand(BaseCommand):
         }
 
         if self.name_localizations:
-            payload["name_localizations"] = [
-                loc.to_dict() for loc in self.name_localizations
-            ]
+            payload["name_localizations"] = {
+                loc.locale: loc.value for loc in self.name_localizations
+            }
         if self.description_localizations:
-            payload["description_localizations"] = [
-                loc.to_dict() for loc in self.description_localizations
-            ]
+            payload["description_localizations"] = {
+                loc.locale: loc.value for loc in self.description_localizations
+            }
         return payload
 
 
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from inspect import Parameter, signature
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .interactions import ResolvedDataHandler
+    from .options import AnyOption, ReceivedOption
+
+Converter = Callable[["ResolvedDataHandler", Any], Any]
+
+
+def _user(resolved: ResolvedDataHandler, value: str):
+    return resolved.member(value) or resolved.user(value) or value
+
+
+def _channel(resolved: ResolvedDataHandler, value: str):
+    return resolved.channel(value) or value
+
+
+def _role(resolved: ResolvedDataHandler, value: str):
+    return resolved.role(value) or value
+
+
+def _mentionable(resolved: ResolvedDataHandler, value: str):
+    return (
+        resolved.member(value) or resolved.user(value) or resolved.role(value) or value
+    )
+
+
+def _attachment(resolved: ResolvedDataHandler, value: str):
+    return resolved.attachment(value) or value
+
+
+def _message(resolved: ResolvedDataHandler, value: str):
+    return resolved.message(value) or value
+
+
+# Option type -> converter. Strings, numbers and booleans arrive as they are.
+CONVERTERS: Dict[int, Converter] = {
+    6: _user,
+    7: _channel,
+    8: _role,
+    9: _mentionable,
+    11: _attachment,
+}
+
+# Command type -> converter for the target of user and message commands.
+TARGET_CONVERTERS: Dict[int, Converter] = {2: _user, 3: _message}
+
+# Option name, converter, and what to pass when the option isn't given.
+_Slot = Tuple[Optional[str], Optional[Converter], Any]
+
+
+class OptionBinder:
+    """How to call a command callback with an interaction's options, worked
+    out once from the callback's signature.
+
+    Options go to the parameter with the same name. Positional parameters
+    without one take the remaining options in the order they're declared,
+    and anything left over goes to ``*args``, or ``**kwargs`` by name.
+    User, role, channel, mentionable and attachment options are passed as
+    objects from the interaction's resolved data, and options that weren't
+    given as the parameter's default, or ``None``.
+
+    Parameters
+    ----------
+    callback : Callable
+        The callback, which takes the interaction first.
+    options : List[AnyOption]
+        The options declared for the command or subcommand.
+    target : Optional[int]
+        The command type, for user and message commands, whose callback
+        takes the target user or message after the interaction.
+    """
+
+    __slots__ = ("positional", "keyword", "rest", "rest_by_name", "target")
+
+    def __init__(
+        self,
+        callback: Callable,
+        options: List[AnyOption],
+        *,
+        target: Optional[int] = None,
+    ):
+        parameters = list(signature(callback).parameters.values())[1:]
+        self.target: Optional[Converter] = (
+            TARGET_CONVERTERS.get(target) if target else None
+        )
+        if self.target:
+            parameters = parameters[1:]
+
+        declared = {option.name: option for option in options}
+        unclaimed = [
+            option.name
+            for option in options
+            if all(parameter.name != option.name for parameter in parameters)
+        ]
+
+        self.positional: List[_Slot] = []
+        self.keyword: List[Tuple[str, _Slot]] = []
+        self.rest: List[_Slot] = []
+        self.rest_by_name: bool = False
+
+        for parameter in parameters:
+            if parameter.kind is Parameter.VAR_POSITIONAL:
+                self.rest = [self._slot(declared[name], None) for name in unclaimed]
+                unclaimed = []
+                continue
+            if parameter.kind is Parameter.VAR_KEYWORD:
+                if unclaimed:
+                    self.rest = [self._slot(declared[name], None) for name in unclaimed]
+                    self.rest_by_name = True
+                    unclaimed = []
+                continue
+
+            option = declared.get(parameter.name)
+            if option is None and parameter.kind is not Parameter.KEYWORD_ONLY:
+                option = declared[unclaimed.pop(0)] if unclaimed else None
+
+            if option is None:
+                if parameter.default is Parameter.empty:
+                    raise TypeError(
+                        f"Parameter {parameter.name} of {callback.__name__} "
+                        "has no option to take its value from."
+                    )
+                if parameter.kind is not Parameter.KEYWORD_ONLY:
+                    # Keeps the place of the positional parameters after it.
+                    self.positional.append((None, None, parameter.default))
+                continue
+
+            if parameter.kind is Parameter.KEYWORD_ONLY:
+                self.keyword.append(
+                    (parameter.name, self._slot(option, parameter.default))
+                )
+            else:
+                self.positional.append(self._slot(option, parameter.default))
+
+        if unclaimed:
+            raise TypeError(
+                f"{callback.__name__} has no parameter for the options "
+                f"{', '.join(unclaimed)}."
+            )
+
+    @staticmethod
+    def _slot(option: AnyOption, default: Any) -> _Slot:
+        if default is Parameter.empty:
+            default = None
+        return option.name, CONVERTERS.get(option.type), default
+
+    def bind(
+        self, interaction, options: List[ReceivedOption]
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """The arguments and keyword arguments to call the callback with,
+        after the interaction."""
+        received = {option.name: option for option in options}
+        resolved = interaction.resolved
+        args = []
+        kwargs = {}
+
+        if self.target:
+            target = interaction.target_id
+            args.append(self.target(resolved, target) if resolved else target)
+
+        for name, converter, default in self.positional:
+            option = received.get(name)
+            if option is None:
+                args.append(default)
+            elif converter and resolved:
+                args.append(converter(resolved, option.value))
+            else:
+                args.append(option.value)
+
+        for parameter, (name, converter, default) in self.keyword:
+            option = received.get(name)
+            if option is None:
+                kwargs[parameter] = default
+            elif converter and resolved:
+                kwargs[parameter] = converter(resolved, option.value)
+            else:
+                kwargs[parameter] = option.value
+
+        for name, converter, _ in self.rest:
+            option = received.get(name)
+            if option is None:
+                continue
+            value = (
+                converter(resolved, option.value)
+                if converter and resolved
+                else option.value
+            )
+            if self.rest_by_name:
+                kwargs[name] = value
+            else:
+                args.append(value)
+
+        return args, kwargs
+
+
+__all__ = ("OptionBinder",)
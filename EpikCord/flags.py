@@ -1,52 +1,170 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, Iterator, List, Union
+
+
+class _FlagBit:
+    """Generated for each flag of a :class:`Flag` subclass. On an instance,
+    reading it tests the bit and assigning to it sets or clears the bit.
+    On the class, it's the bit itself."""
+
+    __slots__ = ("name", "bit")
+
+    def __init__(self, name: str, bit: int):
+        self.name: str = name
+        self.bit: int = bit
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self.bit
+        return obj.value & self.bit == self.bit
+
+    def __set__(self, obj: Flag, on: bool):
+        if obj._frozen:
+            raise AttributeError(
+                f"This {type(obj).__name__} is shared, change a copy of it instead."
+            )
+        obj.value = obj.value | self.bit if on else obj.value & ~self.bit
 
 
 class Flag:
-    class_flags: Dict[str, int]
+    """A set of flags, stored as the integer Discord uses.
+
+    Each flag reads as a bool and can be assigned to. Flags combine like
+    sets, with ``|``, ``&``, ``-`` and ``^``, and ``in`` checks that every
+    bit of a flag, an int or a flag's name is set.
+
+    Instances from :meth:`from_value` are cached and shared,
+    so they can't be changed.
+    """
+
+    __slots__ = ("value", "_frozen")
+
+    class_flags: ClassVar[Dict[str, int]] = {}
+    # Every flag of the class, ORed together.
+    all_value: ClassVar[int] = 0
+    _cache: ClassVar[Dict[int, Flag]]
+    _cache_size: ClassVar[int] = 4096
 
     def __init_subclass__(cls) -> None:
-        cls.class_flags = {k: v for k, v in cls.__dict__.items() if isinstance(v, int)}
-
-    def __init__(self, value: int = 0, **kwargs):
-        self.value = value
-        self.turned_on: List[str] = [k for k, a in kwargs.items() if a]
-
-        for k, v in self.class_flags.items():
-            if v & value and k not in self.turned_on:
-                self.turned_on.append(k)
-
-        self.calculate_from_turned()
-
-    def calculate_from_turned(self):
-        value = 0
-        for key, flag in self.class_flags.items():
-            if key in self.class_flags:
-                value |= flag
-        self.value = value
-
-    def __getattribute__(self, __name: str) -> Any:
-        original = super().__getattribute__
-        if __name in original("class_flags"):
-            return __name in original("turned_on")
-        return original(__name)
-
-    def __setattr__(self, __name: str, __value: Any) -> None:
-        if __name not in self.class_flags:
-            return super().__setattr__(__name, __value)
-        if __value and __name not in self.turned_on:
-            self.turned_on.append(__name)
-        elif not __value and __name in self.turned_on:
-            self.turned_on.remove(__name)
-        self.calculate_from_turned()
+        cls.class_flags = dict(cls.class_flags)
+        for name, bit in list(cls.__dict__.items()):
+            if isinstance(bit, int) and not name.startswith("_"):
+                cls.class_flags[name] = bit
+                setattr(cls, name, _FlagBit(name, bit))
+
+        cls.all_value = 0
+        for bit in cls.class_flags.values():
+            cls.all_value |= bit
+        cls._cache = {}
+
+    def __init__(self, value: Union[int, Flag] = 0, **kwargs: bool):
+        self.value: int = int(value)
+        self._frozen: bool = False
+        for name, on in kwargs.items():
+            if name not in self.class_flags:
+                raise TypeError(f"{name!r} is not a flag of {type(self).__name__}.")
+            setattr(self, name, on)
+
+    @classmethod
+    def from_value(cls, value: int):
+        """A shared, unchangeable instance for ``value``.
+        Models use this, most of them have the same few values."""
+        try:
+            return cls._cache[value]
+        except KeyError:
+            pass
+
+        flag = cls(value)
+        flag._frozen = True
+        if len(cls._cache) < cls._cache_size:
+            cls._cache[value] = flag
+        return flag
 
     @classmethod
     def all(cls):
-        return cls(**{k: True for k in cls.class_flags})
+        return cls(cls.all_value)
+
+    @property
+    def turned_on(self) -> List[str]:
+        return list(self)
+
+    def _value_of(self, other: Any) -> int:
+        if isinstance(other, Flag):
+            if not isinstance(other, type(self)):
+                return NotImplemented  # type: ignore
+            return other.value
+        if isinstance(other, int):
+            return other
+        if isinstance(other, str) and other in self.class_flags:
+            return self.class_flags[other]
+        return NotImplemented  # type: ignore
+
+    def __or__(self, other: Any):
+        if (value := self._value_of(other)) is NotImplemented:
+            return NotImplemented
+        return type(self)(self.value | value)
+
+    def __and__(self, other: Any):
+        if (value := self._value_of(other)) is NotImplemented:
+            return NotImplemented
+        return type(self)(self.value & value)
+
+    def __sub__(self, other: Any):
+        if (value := self._value_of(other)) is NotImplemented:
+            return NotImplemented
+        return type(self)(self.value & ~value)
+
+    def __xor__(self, other: Any):
+        if (value := self._value_of(other)) is NotImplemented:
+            return NotImplemented
+        return type(self)(self.value ^ value)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __invert__(self):
+        return type(self)(self.all_value & ~self.value)
+
+    def __contains__(self, other: Any) -> bool:
+        # Checking a bit from the class, like ``Permissions.kick_members``,
+        # is the common case.
+        if type(other) is int:
+            return self.value & other == other
+        if (value := self._value_of(other)) is NotImplemented:
+            raise TypeError(f"Can't check {other!r} in a {type(self).__name__}.")
+        return self.value & value == value
+
+    def __iter__(self) -> Iterator[str]:
+        value = self.value
+        for name, bit in self.class_flags.items():
+            if value & bit == bit:
+                yield name
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Flag):
+            return type(self) is type(other) and self.value == other.value
+        if isinstance(other, int):
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.value))
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} value={self.value}>"
 
 
 class Intents(Flag):
+    __slots__ = ()
+
     guilds = 1 << 0
     members = 1 << 1
     bans = 1 << 2
@@ -73,6 +191,7 @@ class Intents(Flag):
 
 
 class SystemChannelFlags(Flag):
+    __slots__ = ()
 
     suppress_join_notifications = 1 << 0
     suppress_premium_subscriptions = 1 << 1
@@ -81,6 +200,8 @@ class SystemChannelFlags(Flag):
 
 
 class Permissions(Flag):
+    __slots__ = ()
+
     create_instant_invite = 1 << 0
     kick_members = 1 << 1
     ban_members = 1 << 2
@@ -124,6 +245,8 @@ class Permissions(Flag):
 
 
 class ChannelFlags(Flag):
+    __slots__ = ()
+
     pinned = 1 << 1
     require_tag = 1 << 4
 
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING, List, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union
 
 from typing_extensions import NotRequired
 
+from .abstract import LazyFields, Messageable, lazy_field, raw_payload
 from .application import Application, IntegrationApplication
 from .channels import AnyChannel, GuildStageChannel, Overwrite
 from .flags import Permissions, SystemChannelFlags
+from .managers import (
+    EmojiManager,
+    MemberManager,
+    RoleManager,
+    StickerManager,
+    VoiceStateManager,
+)
 from .partials import PartialGuild
 from .presence import Activity, Presence, Status
 from .sticker import Sticker
@@ -84,11 +92,54 @@ class Invite:
         )
 
 
-class GuildMember(User):
+def _from_user(name: str) -> property:
+    return property(
+        lambda member: getattr(member.user, name),
+        doc=f"The :attr:`GuildMember.user`'s ``{name}``.",
+    )
+
+
+class GuildMember(Messageable):
+    # Not a User subclass, which would give every member slots for the user
+    # fields that are read from :attr:`user` instead.
+    __slots__ = (
+        "id",
+        "client",
+        "data",
+        "user",
+        "nick",
+        "avatar",
+        "role_ids",
+        "joined_at",
+        "premium_since",
+        "deaf",
+        "mute",
+        "pending",
+        "permissions",
+        "communication_disabled_until",
+    )
+
+    # Shared with every other member and message of the same user,
+    # see :class:`UserManager`. Only the guild avatar is the member's own.
+    username = _from_user("username")
+    discriminator = _from_user("discriminator")
+    bot = _from_user("bot")
+    system = _from_user("system")
+    mfa_enabled = _from_user("mfa_enabled")
+    banner = _from_user("banner")
+    accent_color = _from_user("accent_color")
+    locale = _from_user("locale")
+    verified = _from_user("verified")
+    email = _from_user("email")
+    flags = _from_user("flags")
+    premium_type = _from_user("premium_type")
+    public_flags = _from_user("public_flags")
+
     def __init__(self, client, data: discord_typings.GuildMemberData):
-        super().__init__(client, data["user"])
-        self.data: discord_typings.GuildMemberData = data  # type: ignore
         self.client = client
+        self.user: User = client.users.store(data["user"])
+        self.id: int = self.user.id
+        self.data: Optional[discord_typings.GuildMemberData] = raw_payload(client, data)
         self.nick: Optional[str] = data.get("nick")
         self.avatar: Optional[str] = data.get("avatar")
         self.role_ids: List[int] = [int(role) for role in data["roles"]]
@@ -96,11 +147,14 @@ class GuildMember(User):
             data["joined_at"]
         )
         self.premium_since: Optional[datetime.datetime] = datetime.datetime.fromisoformat(data["premium_since"]) if data.get("premium_since") else None  # type: ignore
-        self.deaf: bool = data["deaf"]
-        self.mute: bool = data["mute"]
+        # Left out of GUILD_MEMBER_UPDATE.
+        self.deaf: bool = data.get("deaf", False)  # type: ignore
+        self.mute: bool = data.get("mute", False)  # type: ignore
         self.pending: Optional[bool] = data.get("pending")
         self.permissions: Optional[Permissions] = (
-            Permissions(int(data["permissions"])) if data.get("permissions") else None
+            Permissions.from_value(int(data["permissions"]))
+            if data.get("permissions")
+            else None
         )
         self.communication_disabled_until: Optional[datetime.datetime] = (
             datetime.datetime.fromisoformat(data["communication_disabled_until"])
@@ -108,6 +162,71 @@ class GuildMember(User):
             else None
         )
 
+    def __copy__(self) -> GuildMember:
+        # Quicker than the default, which goes through __reduce_ex__.
+        member = GuildMember.__new__(GuildMember)
+        for key in GuildMember.__slots__:
+            setattr(member, key, getattr(self, key))
+        return member
+
+    def _update(self, data: discord_typings.GuildMemberUpdateData):
+        """Update this member in place from a partial payload,
+        like a GUILD_MEMBER_UPDATE. Missing fields keep their value."""
+        if "user" in data:
+            self.user = self.client.users.store(data["user"])
+        if "nick" in data:
+            self.nick = data["nick"]
+        if "avatar" in data:
+            self.avatar = data["avatar"]
+        if "roles" in data:
+            self.role_ids = [int(role) for role in data["roles"]]
+        if data.get("joined_at"):
+            self.joined_at = datetime.datetime.fromisoformat(
+                data["joined_at"]  # type: ignore
+            )
+        if "premium_since" in data:
+            self.premium_since = (
+                datetime.datetime.fromisoformat(data["premium_since"])  # type: ignore
+                if data["premium_since"]
+                else None
+            )
+        for key in ("deaf", "mute", "pending"):
+            if key in data:
+                setattr(self, key, data[key])
+        if "permissions" in data:
+            permissions = data["permissions"]  # type: ignore
+            self.permissions = (
+                Permissions.from_value(int(permissions)) if permissions else None
+            )
+        if "communication_disabled_until" in data:
+            until = data["communication_disabled_until"]  # type: ignore
+            self.communication_disabled_until = (
+                datetime.datetime.fromisoformat(until) if until else None
+            )
+
+        if self.data is not None:
+            self.data = {**self.data, **data}  # type: ignore
+
+    def to_dict(self) -> discord_typings.GuildMemberData:
+        if self.data is not None:
+            # The user may have been updated since, by another member or message.
+            return {**self.data, "user": self.user.to_dict()}  # type: ignore
+
+        payload = {
+            "user": self.user.to_dict(),
+            "nick": self.nick,
+            "avatar": self.avatar,
+            "roles": [str(role_id) for role_id in self.role_ids],
+            "joined_at": self.joined_at.isoformat(),
+            "deaf": self.deaf,
+            "mute": self.mute,
+            "pending": self.pending,
+        }
+        for key in ("premium_since", "communication_disabled_until"):
+            timestamp = getattr(self, key)
+            payload[key] = timestamp.isoformat() if timestamp else None
+        return payload  # type: ignore
+
 
 class GuildPreview:
     def __init__(self, client, data: discord_typings.GuildPreviewData):
@@ -126,21 +245,195 @@ class GuildPreview:
         ]
 
 
-class Guild:
-    def __init__(self, client, data: discord_typings.GuildCreateData):
-        from .flags import SystemChannelFlags
+class Guild(LazyFields):
+    __slots__ = (
+        "client",
+        "data",
+        "id",
+        "name",
+        "icon",
+        "icon_hash",
+        "splash",
+        "_channels",
+        "discovery_splash",
+        "owner_id",
+        "permissions",
+        "afk_channel_id",
+        "afk_timeout",
+        "verification_level",
+        "default_message_notifications",
+        "explicit_content_filter",
+        "_roles",
+        "_emojis",
+        "features",
+        "mfa_level",
+        "application_id",
+        "system_channel_id",
+        "system_channel_flags",
+        "rules_channel_id",
+        "max_presences",
+        "max_members",
+        "vanity_url_code",
+        "description",
+        "banner",
+        "premium_tier",
+        "premium_subscription_count",
+        "preferred_locale",
+        "public_updates_channel_id",
+        "max_video_channel_users",
+        "approximate_member_count",
+        "approximate_presence_count",
+        "welcome_screen",
+        "nsfw_level",
+        "_stickers",
+        "joined_at",
+        "large",
+        "unavailable",
+        "member_count",
+        "_voice_states",
+        "_members",
+        "_presences",
+        "_stage_instances",
+        "_guild_scheduled_events",
+        "_pending",
+    )
 
+    def __init__(self, client, data: discord_typings.GuildCreateData):
         self.client = client
-        self.data = data
+        self.data: Optional[discord_typings.GuildCreateData] = None
         self.id: int = int(data["id"])
+        self._pending: Dict[str, Any] = {}
+        self._update(data)
+        self.data = raw_payload(client, data)
+
+        # Below are the extra attributes sent over the gateway
+
+        self.joined_at: Optional[datetime.datetime] = (
+            datetime.datetime.fromisoformat(data["joined_at"])  # type: ignore
+            if data.get("joined_at")
+            else None
+        )
+        self.large: Optional[bool] = data.get("large")
+        self.unavailable: Optional[bool] = data.get("unavailable")
+        self.member_count: Optional[int] = data.get("member_count")
+        # Large guilds have thousands of these, they're built when first read.
+        for key in (
+            "voice_states",
+            "members",
+            "presences",
+            "stage_instances",
+            "guild_scheduled_events",
+        ):
+            if data.get(key):
+                self._pending[key] = data[key]  # type: ignore
+        if data.get("channels") or data.get("threads"):
+            self._pending["channels"] = (data.get("channels"), data.get("threads"))
+
+        if self.data is None:
+            # Without keep_payloads, the raw parts waiting to be read would
+            # be most of the payload kept anyway. Presences aren't cached
+            # anywhere else, so they're only kept for someone listening.
+            if not client.has_listeners("presence_update"):
+                self._pending.pop("presences", None)
+            for name in list(self._pending):
+                getattr(self, name)
+
+    @lazy_field
+    def roles(self, raw: Optional[List[discord_typings.RoleData]]) -> RoleManager:
+        # TODO: Change this to a better method
+        return self._fill(RoleManager(self.client, self.id), Role, raw, guild=self)
+
+    @lazy_field
+    def emojis(self, raw: Optional[List[discord_typings.EmojiData]]) -> EmojiManager:
+        return self._fill(
+            EmojiManager(self.client, self.id), Emoji, raw, guild_id=self.id
+        )
+
+    @lazy_field
+    def stickers(
+        self, raw: Optional[List[discord_typings.StickerData]]
+    ) -> StickerManager:
+        return self._fill(StickerManager(self.client, self.id), Sticker, raw)
+
+    @lazy_field
+    def voice_states(
+        self, raw: Optional[List[discord_typings.VoiceStateData]]
+    ) -> VoiceStateManager:
+        voice_states = VoiceStateManager(self.client, self.id)
+        for voice_state_data in raw or ():
+            voice_state = VoiceState(self.client, voice_state_data)  # type: ignore
+            voice_states.add_to_cache(voice_state.user_id, voice_state)
+        return voice_states
+
+    @lazy_field
+    def members(
+        self, raw: Optional[List[discord_typings.GuildMemberData]]
+    ) -> MemberManager:
+        members = MemberManager(self.client, self.id)
+        for member_data in raw or ():
+            member = GuildMember(self.client, member_data)
+            members.add_to_cache(member.id, member)
+        return members
+
+    @lazy_field
+    def channels(self, raw) -> List[Union[AnyChannel, Thread]]:
+        channels_data, threads_data = raw or (None, None)
+        channels: List[Union[AnyChannel, Thread]] = []
+        # Channels and threads in a GUILD_CREATE leave out the guild ID.
+        for channel in channels_data or ():
+            channel.setdefault("guild_id", str(self.id))
+            channels.append(self.client.utils.channel_from_type(channel))
+
+        for thread in threads_data or ():
+            thread.setdefault("guild_id", str(self.id))
+            channels.append(Thread(self.client, thread))
+        return channels
+
+    @lazy_field
+    def presences(
+        self, raw: Optional[List[discord_typings.PresenceUpdateData]]
+    ) -> Optional[List[Presence]]:
+        if not raw:
+            return None
+        return [
+            Presence(
+                activity=p["activities"], status=Status(p["status"])  # type: ignore
+            )
+            for p in raw
+        ]
+
+    @lazy_field
+    def stage_instances(
+        self, raw: Optional[List[discord_typings.StageInstanceData]]
+    ) -> List[GuildStageChannel]:
+        return [
+            GuildStageChannel(self.client, channel)  # type: ignore
+            for channel in raw or ()
+        ]
+
+    @lazy_field
+    def guild_scheduled_events(
+        self, raw: Optional[List[discord_typings.GuildScheduledEventData]]
+    ) -> List[GuildScheduledEvent]:
+        return [GuildScheduledEvent(self.client, event) for event in raw or ()]
+
+    def _update(self, data: discord_typings.GuildData):
+        """Update this guild in place from a guild object, like a GUILD_UPDATE.
+
+        Roles, emojis and stickers that are still there are updated in
+        place, and aren't read at all when they're the same as last time.
+        The gateway-only parts of a GUILD_CREATE, like members and
+        channels, are kept as they are.
+        """
+        from .flags import SystemChannelFlags
+
         self.name: str = data["name"]
         self.icon: Optional[str] = data.get("icon")
         self.icon_hash: Optional[str] = data.get("icon_hash")
         self.splash: Optional[str] = data.get("splash")
-        self.channels: List[AnyChannel] = []
         self.discovery_splash: Optional[str] = data.get("discovery_splash")
         self.owner_id: int = int(data["owner_id"])
-        self.permissions = Permissions(int(data.get("permissions", 0)))
+        self.permissions = Permissions.from_value(int(data.get("permissions", 0)))
         self.afk_channel_id: Optional[int] = int(data["afk_channel_id"]) if data.get("afk_channel_id") else None  # type: ignore
         self.afk_timeout: int = data["afk_timeout"]
 
@@ -158,16 +451,17 @@ class Guild:
             if data.get("explicit_content_filter") == 1
             else "ALL_MEMBERS"
         )
-        self.roles: List[Role] = [
-            Role(client, {**role_data, "guild": self})  # type: ignore # TODO: Change this to a better method
-            for role_data in data["roles"]
-        ]
-        self.emojis: List[Emoji] = [Emoji(client, emoji) for emoji in data["emojis"]]
+        if self._changed(data, "roles"):
+            self._sync("roles", Role, data["roles"], guild=self)
+
+        if self._changed(data, "emojis"):
+            self._sync("emojis", Emoji, data["emojis"], guild_id=self.id)
+
         self.features: List[discord_typings.GuildFeaturesData] = data["features"]
         self.mfa_level: str = "NONE" if data.get("mfa_level") == 0 else "ELEVATED"
         self.application_id: Optional[str] = data.get("application_id")
         self.system_channel_id: Optional[int] = int(data["system_channel_id"]) if data.get("system_channel_id") else None  # type: ignore
-        self.system_channel_flags: SystemChannelFlags = SystemChannelFlags(
+        self.system_channel_flags: SystemChannelFlags = SystemChannelFlags.from_value(
             data["system_channel_flags"]
         )
         self.rules_channel_id: Optional[int] = (
@@ -201,61 +495,70 @@ class Guild:
             else None
         )
         self.nsfw_level: NSFWLevel = NSFWLevel(data["nsfw_level"])
-        self.stickers: Optional[List[Sticker]] = (
-            [Sticker(self.client, sticker) for sticker in data["stickers"]]
-            if data.get("stickers")
-            else None
-        )
-
-        # Below are the extra attributes sent over the gateway
-
-        self.joined_at: Optional[datetime.datetime] = (
-            datetime.datetime.fromisoformat(data["joined_at"])  # type: ignore
-            if data.get("joined_at")
-            else None
-        )
-        self.large: Optional[bool] = data.get("large")
-        self.unavailable: Optional[bool] = data.get("unavailable")
-        self.member_count: Optional[int] = data.get("member_count")
-        self.voice_states: Optional[List[VoiceState]] = (
-            [VoiceState(client, voice_state) for voice_state in data["voice_states"]]  # type: ignore
-            if data.get("voice_states")
-            else None
-        )
-        self.members: Optional[List[GuildMember]] = (
-            [GuildMember(client, member) for member in data["members"]]  # type: ignore
-            if data.get("members")
-            else None
-        )
-
-        if data.get("channels"):
-            self.channels.extend(
-                [
-                    client.utils.channel_from_type(channel)
-                    for channel in data["channels"]
+        if "stickers" in data and self._changed(data, "stickers"):
+            self._sync("stickers", Sticker, data["stickers"])  # type: ignore
+
+        if self.data is not None:
+            self.data = {**self.data, **data}  # type: ignore
+
+    def _changed(self, data: discord_typings.GuildData, key: str) -> bool:
+        # Without the last payload, we can't tell.
+        return self.data is None or self.data.get(key) != data.get(key)
+
+    def _sync(self, name: str, cls: type, payloads: List[Any], **extra: Any):
+        """Give the roles, emojis or stickers new payloads. Until they've been
+        read that only swaps the payload, after, see :meth:`_fill`."""
+        field: lazy_field = getattr(Guild, name)
+        try:
+            manager = getattr(self, field.slot)
+        except AttributeError:
+            field.defer(self, payloads)
+        else:
+            self._fill(manager, cls, payloads, **extra)
+
+    def to_dict(self) -> discord_typings.GuildCreateData:
+        """The guild's payload as it is now. Roles, members and channels come
+        from the caches that events keep up to date, rather than from the
+        GUILD_CREATE they were first read from."""
+        payload: Dict[str, Any] = {**(self.data or {}), "id": str(self.id)}
+
+        for name in ("roles", "members"):
+            try:
+                manager = getattr(self, getattr(Guild, name).slot)
+            except AttributeError:
+                # Not read yet, so no event has changed it either.
+                if name in self._pending:
+                    payload[name] = self._pending[name]
+                continue
+            payload[name] = [obj.to_dict() for obj in manager.values()]
+
+        if (channels := self.client.channels).enabled:
+            for key, cached in (
+                ("channels", channels.guild_channels(self.id)),
+                ("threads", channels.guild_threads(self.id)),
+            ):
+                payload[key] = [
+                    channel.data for channel in cached if channel.data is not None
                 ]
-            )
-
-        if data.get("threads"):
-            self.channels.extend(
-                [Thread(self.client, thread) for thread in data["threads"]]
-            )
-
-        self.presences: Optional[List[Presence]] = (
-            [
-                Presence(activity=p["activities"], status=Status(p["status"])) for p in data["presences"]  # type: ignore
-            ]
-            if data.get("presences")
-            else None
-        )
-        self.stage_instances: List[GuildStageChannel] = [
-            GuildStageChannel(client, channel)
-            for channel in data.get("stage_instances", [])
-        ]
-        self.guild_scheduled_events: List[GuildScheduledEvent] = [
-            GuildScheduledEvent(client, event)
-            for event in data.get("guild_scheduled_events", [])
-        ]
+        return payload  # type: ignore
+
+    def _fill(self, manager, cls: type, payloads: Optional[List[Any]], **extra: Any):
+        """Make ``manager`` hold exactly the objects in ``payloads``, updating
+        the ones it already has in place. ``extra`` is added to each payload."""
+        stale = set(manager.cache)
+        for payload in payloads or ():
+            if extra:
+                payload = {**payload, **extra}
+            key = int(payload["id"])
+            stale.discard(key)
+            if (existing := manager.cache.get(key)) is not None:
+                existing._update(payload)
+            else:
+                manager.add_to_cache(key, cls(self.client, payload))
+
+        for key in stale:
+            manager.remove_from_cache(key)
+        return manager
 
     async def edit(
         self,
@@ -338,7 +641,7 @@ class Guild:
         response = await self.client.http.patch(
             f"/guilds/{self.id}", json=data, reason=reason, guild_id=self.id
         )
-        guild_data = await response.json()
+        guild_data = response.data
 
         return Guild(self.client, guild_data)
 
@@ -352,7 +655,7 @@ class Guild:
         """
         res = await self.client.http.get(f"/guilds/{self.id}/preview", guild_id=self.id)
 
-        data = await res.json()
+        data = res.data
         return GuildPreview(self.client, data)
 
     async def delete(self):
@@ -366,10 +669,12 @@ class Guild:
         List[GuildChannel]
             The guild channels.
         """
-        channels_ = await self.client.http.get(
+        response = await self.client.http.get(
             f"/guilds/{self.id}/channels", guild_id=self.id
         )
-        return [self.client.utils.channel_from_type(channel) for channel in channels_]
+        return [
+            self.client.utils.channel_from_type(channel) for channel in response.data
+        ]
 
     async def create_channel(
         self,
@@ -428,19 +733,15 @@ class Guild:
             }
         )
 
-        return self.client.utils.channel_from_type(
-            await (
-                await self.client.http.post(
-                    f"/guilds/{self.id}/channels",
-                    json=data,
-                    reason=reason,
-                    guild_id=self.id,
-                )
-            ).json()
+        response = await self.client.http.post(
+            f"/guilds/{self.id}/channels", json=data, reason=reason, guild_id=self.id
         )
+        return self.client.utils.channel_from_type(response.data)
 
 
 class RoleTags:
+    __slots__ = ("bot_id", "integration_id", "premium_subscriber")
+
     def __init__(self, data: discord_typings.RoleTagsData):
         self.bot_id: Optional[int] = int(data["bot_id"]) if data.get("bot_id") else None
         self.integration_id: Optional[int] = (
@@ -450,19 +751,38 @@ class RoleTags:
 
 
 class Role:
+    __slots__ = (
+        "data",
+        "client",
+        "id",
+        "name",
+        "color",
+        "hoist",
+        "icon",
+        "unicode_emoji",
+        "position",
+        "permissions",
+        "managed",
+        "mentionable",
+        "tags",
+        "guild",
+    )
+
     def __init__(self, client, data: discord_typings.RoleData):
-        self.data = data
         self.client = client
         self.id: int = int(data["id"])
+        self._update(data)
+
+    def _update(self, data: discord_typings.RoleData):
+        """Update this role in place from a newer role object."""
+        self.data: Optional[discord_typings.RoleData] = raw_payload(self.client, data)
         self.name: str = data["name"]
         self.color: int = data["color"]
         self.hoist: bool = data["hoist"]
         self.icon: Optional[str] = data.get("icon")
         self.unicode_emoji: Optional[str] = data.get("unicode_emoji")
         self.position: int = data["position"]
-        self.permissions: Permissions = Permissions(
-            int(data["permissions"])
-        )  # TODO: Permissions
+        self.permissions: Permissions = Permissions.from_value(int(data["permissions"]))
         self.managed: bool = data["managed"]
         self.mentionable: bool = data["mentionable"]
         self.tags: Optional[RoleTags] = (
@@ -470,6 +790,39 @@ class Role:
         )
         self.guild: Guild = data["guild"] if data.get("guild") else None  # type: ignore
 
+    def to_dict(self) -> discord_typings.RoleData:
+        if self.data is not None:
+            # Without the guild it was given, which isn't part of the payload.
+            return {
+                key: value for key, value in self.data.items() if key != "guild"
+            }  # type: ignore
+
+        payload = {
+            "id": str(self.id),
+            "name": self.name,
+            "color": self.color,
+            "hoist": self.hoist,
+            "icon": self.icon,
+            "unicode_emoji": self.unicode_emoji,
+            "position": self.position,
+            "permissions": str(self.permissions.value),
+            "managed": self.managed,
+            "mentionable": self.mentionable,
+        }
+        if tags := self.tags:
+            payload["tags"] = {
+                key: str(value)
+                for key, value in (
+                    ("bot_id", tags.bot_id),
+                    ("integration_id", tags.integration_id),
+                )
+                if value
+            }
+            if tags.premium_subscriber:
+                # Discord sends it as null when it's set.
+                payload["tags"]["premium_subscriber"] = None
+        return payload  # type: ignore
+
 
 class EditEmojiData(TypedDict):
     name: NotRequired[str]
@@ -478,13 +831,31 @@ class EditEmojiData(TypedDict):
 
 
 class Emoji:
+    __slots__ = (
+        "client",
+        "id",
+        "name",
+        "roles",
+        "user",
+        "requires_colons",
+        "guild_id",
+        "managed",
+        "animated",
+        "available",
+    )
+
     def __init__(self, client, data: discord_typings.EmojiData):
         self.client = client
         self.id: Optional[int] = int(data["id"])  # type: ignore
+        self._update(data)
+
+    def _update(self, data: discord_typings.EmojiData):
+        """Update this emoji in place from a newer emoji object."""
         self.name: Optional[str] = data.get("name")
         self.roles: List[Role] = (
             [
-                Role(client, role_data)  # type: ignore # TODO: Attach Guild to this or it won't work.
+                # TODO: Attach Guild to this or it won't work.
+                Role(self.client, role_data)  # type: ignore
                 for role_data in data["roles"]
             ]
             if data.get("roles")
@@ -513,10 +884,10 @@ class Emoji:
         if roles:
             payload["roles"] = [int(role.id) for role in roles]
 
-        emoji = await self.client.http.patch(
+        response = await self.client.http.patch(
             f"/guilds/{self.guild_id}/emojis/{self.id}", json=payload, reason=reason
         )
-        return Emoji(self.client, emoji)
+        return Emoji(self.client, response.data)
 
     async def delete(self, *, reason: Optional[str] = None):
         await self.client.http.delete(
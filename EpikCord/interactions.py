@@ -11,7 +11,11 @@ from .options import *
 if TYPE_CHECKING:
     import discord_typings
 
-    from .message import Attachment, Embed, MessagePayload
+    from .channels import AnyChannel
+    from .guild import GuildMember, Role
+    from .message import Attachment, Embed, Message, MessagePayload
+    from .partials import PartialChannel
+    from .user import User
 
 
 class Modal:
@@ -29,10 +33,69 @@ class Modal:
 
 
 class ResolvedDataHandler:
+    """The users, members, roles, channels, messages and attachments an
+    interaction refers to, built when they're asked for. Roles, channels
+    and messages come from the client's caches when they're there, as those
+    are kept up to date, and users are shared through :class:`UserManager`.
+    """
+
     def __init__(
-        self, client, resolved_data: discord_typings.ResolvedInteractionDataData
+        self,
+        client,
+        resolved_data: discord_typings.ResolvedInteractionDataData,
+        guild_id: Optional[int] = None,
     ):
+        self.client = client
         self.data: discord_typings.ResolvedInteractionDataData = resolved_data
+        self.guild_id: Optional[int] = guild_id
+
+    def user(self, user_id: str) -> Optional[User]:
+        data = self.data.get("users", {}).get(str(user_id))
+        return self.client.users.store(data) if data else None
+
+    def member(self, user_id: str) -> Optional[GuildMember]:
+        from EpikCord import GuildMember
+
+        user_id = str(user_id)
+        data = self.data.get("members", {}).get(user_id)
+        user = self.data.get("users", {}).get(user_id)
+        if not data or not user:
+            return None
+        return GuildMember(self.client, {**data, "user": user})  # type: ignore
+
+    def role(self, role_id: str) -> Optional[Role]:
+        from EpikCord import Role
+
+        roles = getattr(self.client.guilds.get(self.guild_id), "roles", None)
+        if roles is not None and (role := roles.get(int(role_id))):
+            return role
+
+        data = self.data.get("roles", {}).get(str(role_id))
+        return Role(self.client, data) if data else None
+
+    def channel(self, channel_id: str) -> Optional[Union[AnyChannel, PartialChannel]]:
+        from .partials import PartialChannel
+
+        if channel := self.client.channels.get(int(channel_id)):
+            return channel
+
+        data = self.data.get("channels", {}).get(str(channel_id))
+        return PartialChannel(data) if data else None
+
+    def message(self, message_id: str) -> Optional[Message]:
+        from EpikCord import Message
+
+        if message := self.client.messages.get_message(int(message_id)):
+            return message
+
+        data = self.data.get("messages", {}).get(str(message_id))
+        return Message(self.client, data) if data else None
+
+    def attachment(self, attachment_id: str) -> Optional[Attachment]:
+        from EpikCord import Attachment
+
+        data = self.data.get("attachments", {}).get(str(attachment_id))
+        return Attachment(data) if data else None
 
 
 class DeferredInteractionResponse(TypedDict):
@@ -157,22 +220,12 @@ class AutoCompleteInteractionResponse(TypedDict):
 class AutoCompleteInteraction(BaseInteraction):
     def __init__(self, client, data: dict):
         super().__init__(client, data)
-        conversion_type = {
-            1: Subcommand,
-            2: SubCommandGroup,
-            3: StringOption,
-            4: IntegerOption,
-            5: BooleanOption,
-            6: UserOption,
-            7: ChannelOption,
-            8: RoleOption,
-            9: MentionableOption,
-            10: NumberOption,
-            11: AttachmentOption,
-        }
-        self.options: List[AnyOption] = [
-            conversion_type[option["type"]](**option)
-            for option in data.get("options", [])
+        self.command_id: int = int(data["data"]["id"])
+        self.command_name: str = data["data"]["name"]
+        self.command_type: int = data["data"].get("type", 1)
+        # Options as received, one of them (maybe in a subcommand) is focused.
+        self.options: List[ReceivedOption] = [
+            ReceivedOption(option) for option in data["data"].get("options", [])
         ]
 
     async def reply(self, choices: List[SlashCommandOptionChoice]) -> None:  # type: ignore
@@ -195,9 +248,13 @@ class ApplicationCommandInteraction(BaseInteraction):
         self.command_id: int = int(data["data"]["id"])
         self.command_name: str = data["data"]["name"]
         self.command_type: int = data["data"]["type"]
-        self.resolved = (
-            ResolvedDataHandler(client, data["data"]["resolved"])
-            if data.get("resolved")
+        self.resolved: Optional[ResolvedDataHandler] = (
+            ResolvedDataHandler(
+                client,
+                data["data"]["resolved"],
+                int(data["guild_id"]) if data.get("guild_id") else None,
+            )
+            if data["data"].get("resolved")
             else None
         )
         self.options: Optional[List[ReceivedOption]] = (
@@ -210,7 +267,7 @@ class ApplicationCommandInteraction(BaseInteraction):
 class UserCommandInteraction(ApplicationCommandInteraction):
     def __init__(self, client, data):
         super().__init__(client, data)
-        self.target_id: str = data.get("target_id")
+        self.target_id: str = data["data"].get("target_id")
 
 
 class MessageCommandInteraction(UserCommandInteraction):
@@ -19,6 +19,13 @@ SOFTWARE.
 """
 
 from .cache_manager import *
+from .cache_policy import *
 from .channel_manager import *
+from .emoji_manager import *
 from .guilds_manager import *
+from .member_manager import *
+from .message_manager import *
 from .roles_manager import *
+from .sticker_manager import *
+from .user_manager import *
+from .voice_state_manager import *
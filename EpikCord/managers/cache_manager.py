@@ -1,26 +1,198 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterator, Optional, Union
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..exceptions import NotFound404
+from .cache_policy import CachePolicy
+
+if TYPE_CHECKING:
+    from ..client.client import WebsocketClient
+
+_MISSING: Any = object()
+
+
+def cache_policy_for(client: WebsocketClient, name: str) -> Optional[CachePolicy]:
+    """Get a fresh copy of the cache policy the client was built with for ``name``."""
+    template = getattr(client, "cache_policies", {}).get(name)
+    return template.copy() if template else None
+
+
+class CacheIndex:
+    """A secondary index over a :class:`CacheManager`, filing the key of
+    every cached object under the keys ``keys_of`` gives for it,
+    like a channel's key under its guild's ID.
+
+    The manager keeps it up to date on every insert and removal, so
+    looking up everything under a key doesn't need a scan of the cache.
+    """
+
+    __slots__ = ("keys_of", "buckets", "filed")
+
+    def __init__(self, keys_of: Callable[[Any], Iterable[Any]]):
+        self.keys_of: Callable[[Any], Iterable[Any]] = keys_of
+        # Dicts rather than sets, to keep insertion order.
+        self.buckets: Dict[Any, Dict[Any, None]] = {}
+        self.filed: Dict[Any, Tuple[Any, ...]] = {}
+
+    def add(self, key: Any, value: Any):
+        self.remove(key)
+        if not (index_keys := tuple(self.keys_of(value))):
+            return
+
+        self.filed[key] = index_keys
+        for index_key in index_keys:
+            self.buckets.setdefault(index_key, {})[key] = None
+
+    def remove(self, key: Any):
+        for index_key in self.filed.pop(key, ()):
+            bucket = self.buckets[index_key]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[index_key]
+
+    def get(self, index_key: Any) -> List[Any]:
+        return list(self.buckets.get(index_key, ()))
+
+    def clear(self):
+        self.buckets.clear()
+        self.filed.clear()
 
 
 class CacheManager:
-    def __init__(self):
+    negative_ttl: float = 60.0
+    """How long, in seconds, to remember that a key doesn't exist on Discord.
+    Set to ``0`` to disable negative caching."""
+
+    def __init__(self, policy: Optional[CachePolicy] = None):
         self.cache: Dict[Any, Any] = {}
+        self.policy: Optional[CachePolicy] = policy
+        self._not_found: Dict[Any, float] = {}
+        self.indexes: Dict[str, CacheIndex] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether this manager keeps anything at all.
+        A policy with ``max_entries=0`` turns caching off."""
+        return self.policy is None or self.policy.max_entries != 0
+
+    def add_index(
+        self, name: str, keys_of: Callable[[Any], Iterable[Any]]
+    ) -> CacheIndex:
+        """Start keeping a :class:`CacheIndex` called ``name``, see :meth:`lookup`."""
+        self.indexes[name] = index = CacheIndex(keys_of)
+        for key, value in self.cache.items():
+            index.add(key, value)
+        return index
+
+    def lookup(self, name: str, index_key: Any) -> List[Any]:
+        """Every cached object the index called ``name`` files under ``index_key``."""
+        return [
+            value
+            for key in self.indexes[name].get(index_key)
+            if (value := self.get(key)) is not None
+        ]
 
     def add_to_cache(self, key: Union[int, str], value: Any):
         self.cache[key] = value
+        self._not_found.pop(key, None)
+        for index in self.indexes.values():
+            index.add(key, value)
 
-    def remove_from_cache(self, key):
-        self.cache.pop(key, None)
+        if policy := self.policy:
+            policy.inserted(key, value)
+            while self.cache and policy.over_capacity(len(self.cache)):
+                self.remove_from_cache(policy.victim())
+
+    async def fetch(self, key: int, *args, **kwargs) -> Any:
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support fetching."
+        )
+
+    async def get_or_fetch(self, key: Union[int, str], *args, **kwargs) -> Any:
+        """Get an object from the cache, fetching and caching it if it's missing.
+
+        Objects that Discord said don't exist are remembered for
+        ``negative_ttl`` seconds, and ``None`` is returned for them
+        without making a request.
+
+        Parameters
+        ----------
+        key : Union[int, str]
+            The ID of the object.
+        *args, **kwargs
+            Passed through to ``fetch`` on a cache miss.
+        """
+        key = int(key)
+
+        if (value := self.get(key)) is not None:
+            return value
+
+        if expires_at := self._not_found.get(key):
+            if expires_at > monotonic():
+                return None
+            del self._not_found[key]
+
+        try:
+            value = await self.fetch(key, *args, **kwargs)
+        except NotFound404:
+            if self.negative_ttl:
+                self._not_found[key] = monotonic() + self.negative_ttl
+            return None
+
+        if value is not None:
+            self.add_to_cache(key, value)
+
+        return value
+
+    def remove_from_cache(self, key) -> Any:
+        if self.policy:
+            self.policy.removed(key)
+        for index in self.indexes.values():
+            index.remove(key)
+        return self.cache.pop(key, None)
 
     def get(self, key, default: Optional[Any] = None) -> Any:
-        return self.cache.get(key, default)
+        if not self.policy:
+            return self.cache.get(key, default)
+
+        if key not in self.cache:
+            return default
+
+        if self.policy.expired(key):
+            self.remove_from_cache(key)
+            return default
+
+        self.policy.accessed(key)
+        return self.cache[key]
 
     def is_in_cache(self, key: str):
-        return key in self.cache
+        return key in self
 
     def clear_cache(self):
         self.cache = {}
+        self._not_found = {}
+        for index in self.indexes.values():
+            index.clear()
+        if self.policy:
+            self.policy.clear()
+
+    def values(self):
+        return self.cache.values()
+
+    def items(self):
+        return self.cache.items()
 
     def __dict__(self) -> Dict:  # type: ignore
         return self.cache
@@ -38,15 +210,19 @@ class CacheManager:
         return self.__str__()
 
     def __getitem__(self, key: str) -> Any:
-        return self.cache[key]
+        if (value := self.get(key, _MISSING)) is _MISSING:
+            raise KeyError(key)
+        return value
 
     def __setitem__(self, key: str, value: Any) -> Any:
-        self.cache[key] = value
+        self.add_to_cache(key, value)
 
     def __delitem__(self, key: str) -> None:
-        self.cache.pop(key, None)
+        self.remove_from_cache(key)
 
     def __contains__(self, key: str) -> bool:
+        if self.policy and key in self.cache and self.policy.expired(key):
+            self.remove_from_cache(key)
         return key in self.cache
 
     def __iter__(self) -> Iterator:
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Callable, DefaultDict, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    names: Dict[str, None] = {}
+    for klass in reversed(cls.__mro__):
+        slots = getattr(klass, "__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__"):
+                names[name] = None
+    return tuple(names)
+
+
+def estimate_size(value: Any) -> int:
+    """A cheap estimate of how many bytes an object takes up. The object and
+    the values of its attributes, in ``__slots__`` or ``__dict__``, are
+    counted, but not what those values point to in turn."""
+    size = sys.getsizeof(value)
+    for name in _slot_names(type(value)):
+        try:
+            size += sys.getsizeof(getattr(value, name))
+        except AttributeError:
+            pass  # Not set, or a lazy field that isn't decoded yet.
+    if (attributes := getattr(value, "__dict__", None)) is not None:
+        size += sys.getsizeof(attributes)
+        size += sum(sys.getsizeof(attribute) for attribute in attributes.values())
+    return size
+
+
+class CachePolicy:
+    """Decides what a :class:`CacheManager` evicts, and when.
+
+    A policy is told about every insert, access and removal its manager does,
+    and is asked for a victim whenever the manager is over capacity.
+    Every method is O(1).
+
+    Policies hold state for a single manager, pass one in as a template
+    when building the client and each manager will get its own copy.
+
+    This base class never evicts anything, so it only takes
+    ``max_entries=0``, which turns caching off. Use a subclass, like
+    :class:`LRUPolicy`, for any other limit.
+
+    Parameters
+    ----------
+    max_entries : Optional[int]
+        The most objects the manager may hold.
+    max_bytes : Optional[int]
+        The most bytes the manager may hold, as measured by ``sizeof``.
+    sizeof : Optional[Callable[[Any], int]]
+        How to measure an object. Defaults to :func:`estimate_size`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        if type(self).victim is CachePolicy.victim and (max_entries or max_bytes):
+            raise ValueError(
+                f"{type(self).__name__} can't evict anything, "
+                "use a policy like LRUPolicy to set a limit."
+            )
+
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.sizeof: Callable[[Any], int] = sizeof or estimate_size
+        self.size: int = 0
+        self._sizes: Dict[Any, int] = {}
+
+    def copy(self) -> CachePolicy:
+        return self.__class__(
+            max_entries=self.max_entries, max_bytes=self.max_bytes, sizeof=self.sizeof
+        )
+
+    def inserted(self, key: Any, value: Any):
+        if self.max_bytes is None:
+            return
+
+        self.size -= self._sizes.get(key, 0)
+        self._sizes[key] = size = self.sizeof(value)
+        self.size += size
+
+    def accessed(self, key: Any):
+        ...
+
+    def removed(self, key: Any):
+        if self.max_bytes is not None:
+            self.size -= self._sizes.pop(key, 0)
+
+    def expired(self, key: Any) -> bool:
+        return False
+
+    def over_capacity(self, entries: int) -> bool:
+        return (self.max_entries is not None and entries > self.max_entries) or (
+            self.max_bytes is not None and self.size > self.max_bytes
+        )
+
+    def victim(self) -> Any:
+        raise NotImplementedError
+
+    def clear(self):
+        self.size = 0
+        self._sizes.clear()
+
+
+class LRUPolicy(CachePolicy):
+    """Evicts the least recently used object first."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._order: OrderedDict[Any, None] = OrderedDict()
+
+    def inserted(self, key: Any, value: Any):
+        super().inserted(key, value)
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def accessed(self, key: Any):
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def removed(self, key: Any):
+        super().removed(key)
+        self._order.pop(key, None)
+
+    def victim(self) -> Any:
+        return next(iter(self._order))
+
+    def clear(self):
+        super().clear()
+        self._order.clear()
+
+
+class LFUPolicy(CachePolicy):
+    """Evicts the least frequently used object first,
+    the least recently used one when there's a tie."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._frequencies: Dict[Any, int] = {}
+        self._by_frequency: DefaultDict[int, OrderedDict[Any, None]] = defaultdict(
+            OrderedDict
+        )
+        self._min_frequency: int = 0
+
+    def _forget(self, key: Any) -> Optional[int]:
+        frequency = self._frequencies.pop(key, None)
+        if frequency is None:
+            return None
+
+        keys = self._by_frequency[frequency]
+        del keys[key]
+        if not keys:
+            del self._by_frequency[frequency]
+        return frequency
+
+    def inserted(self, key: Any, value: Any):
+        super().inserted(key, value)
+        if key in self._frequencies:
+            self.accessed(key)
+            return
+
+        self._frequencies[key] = 1
+        self._by_frequency[1][key] = None
+        self._min_frequency = 1
+
+    def accessed(self, key: Any):
+        frequency = self._forget(key)
+        if frequency is None:
+            return
+
+        if frequency == self._min_frequency and frequency not in self._by_frequency:
+            self._min_frequency += 1
+
+        self._frequencies[key] = frequency + 1
+        self._by_frequency[frequency + 1][key] = None
+
+    def removed(self, key: Any):
+        super().removed(key)
+        self._forget(key)
+
+    def victim(self) -> Any:
+        if self._min_frequency not in self._by_frequency:
+            # Only happens after explicit removals, which is rare.
+            self._min_frequency = min(self._by_frequency)
+        return next(iter(self._by_frequency[self._min_frequency]))
+
+    def clear(self):
+        super().clear()
+        self._frequencies.clear()
+        self._by_frequency.clear()
+        self._min_frequency = 0
+
+
+class TTLPolicy(CachePolicy):
+    """Evicts objects ``ttl`` seconds after they were last inserted.
+    If the manager is over capacity before then, the oldest objects go first.
+
+    Parameters
+    ----------
+    ttl : float
+        How long, in seconds, an object may stay cached.
+    """
+
+    def __init__(self, ttl: float, **kwargs):
+        super().__init__(**kwargs)
+        self.ttl: float = ttl
+        self._expires_at: OrderedDict[Any, float] = OrderedDict()
+
+    def copy(self) -> TTLPolicy:
+        return self.__class__(
+            self.ttl,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            sizeof=self.sizeof,
+        )
+
+    def inserted(self, key: Any, value: Any):
+        super().inserted(key, value)
+        self._expires_at[key] = monotonic() + self.ttl
+        self._expires_at.move_to_end(key)
+
+    def removed(self, key: Any):
+        super().removed(key)
+        self._expires_at.pop(key, None)
+
+    def expired(self, key: Any) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and expires_at <= monotonic()
+
+    def over_capacity(self, entries: int) -> bool:
+        if super().over_capacity(entries):
+            return True
+        # Every object has the same ttl, so the oldest is always first.
+        return bool(self._expires_at) and self.expired(self.victim())
+
+    def victim(self) -> Any:
+        return next(iter(self._expires_at))
+
+    def clear(self):
+        super().clear()
+        self._expires_at.clear()
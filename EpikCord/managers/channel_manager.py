@@ -1,23 +1,57 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
-from .cache_manager import CacheManager
+from ..thread import Thread
+from .cache_manager import CacheManager, cache_policy_for
 
 if TYPE_CHECKING:
     from ..channels import AnyChannel
     from ..client.client import Client, WebsocketClient
 
 
+def _guild_of_channel(channel: AnyChannel) -> Iterable[int]:
+    if isinstance(channel, Thread) or not getattr(channel, "guild_id", None):
+        return ()
+    return (channel.guild_id,)
+
+
+def _guild_of_thread(channel: AnyChannel) -> Iterable[int]:
+    if isinstance(channel, Thread) and channel.guild_id:
+        return (channel.guild_id,)
+    return ()
+
+
+def _parent_of_thread(channel: AnyChannel) -> Iterable[int]:
+    if isinstance(channel, Thread) and channel.parent_id:
+        return (channel.parent_id,)
+    return ()
+
+
 class ChannelManager(CacheManager):
     def __init__(self, client: Union[Client, WebsocketClient]):
-        super().__init__()
+        super().__init__(cache_policy_for(client, "channels"))
         self.client = client
+        self.add_index("guild", _guild_of_channel)
+        self.add_index("guild_threads", _guild_of_thread)
+        self.add_index("parent", _parent_of_thread)
+
+    def guild_channels(self, guild_id: int) -> List[AnyChannel]:
+        """The cached channels of a guild, not counting threads."""
+        return self.lookup("guild", int(guild_id))
+
+    def guild_threads(self, guild_id: int) -> List[Thread]:
+        """The cached threads of a guild."""
+        return self.lookup("guild_threads", int(guild_id))
+
+    def threads_of(self, parent_id: int) -> List[Thread]:
+        """The cached threads in a text or forum channel."""
+        return self.lookup("parent", int(parent_id))
 
     async def fetch(self, channel_id: int) -> Optional[AnyChannel]:
         channel = await self.client.http.get(
             f"channels/{channel_id}", channel_id=channel_id
         )
-        if data := await channel.json():
+        if data := channel.data:
             return self.client.utils.channel_from_type(data)
         return None
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+from .cache_manager import CacheManager, cache_policy_for
+
+if TYPE_CHECKING:
+    from ..client.client import Client, WebsocketClient
+    from ..guild import Emoji
+
+
+class EmojiManager(CacheManager):
+    def __init__(self, client: Union[Client, WebsocketClient], guild_id: int):
+        super().__init__(cache_policy_for(client, "emojis"))
+        self.client = client
+        self.guild_id: int = guild_id
+
+    async def fetch(self, emoji_id: int) -> Emoji:
+        from EpikCord import Emoji
+
+        response = await self.client.http.get(
+            f"/guilds/{self.guild_id}/emojis/{emoji_id}", guild_id=self.guild_id
+        )
+        return Emoji(self.client, {**response.data, "guild_id": self.guild_id})
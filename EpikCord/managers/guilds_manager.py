@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, Union
 
-from .cache_manager import CacheManager
+from .cache_manager import CacheManager, cache_policy_for
 
 if TYPE_CHECKING:
     from ..client.client import Client, WebsocketClient
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
 
 class GuildManager(CacheManager):
     def __init__(self, client: Union[Client, WebsocketClient]):
-        super().__init__()
+        super().__init__(cache_policy_for(client, "guilds"))
         self.client = client
 
     async def fetch(
@@ -22,9 +22,10 @@ class GuildManager(CacheManager):
         from EpikCord import Guild
 
         if with_counts:
-            return Guild(
-                self.client,
-                await self.client.http.get(f"/guilds/{guild_id}?with_counts=true"),
+            response = await self.client.http.get(
+                f"/guilds/{guild_id}?with_counts=true"
             )
+        else:
+            response = await self.client.http.get(f"/guilds/{guild_id}")
 
-        return Guild(self.client, await self.client.http.get(f"/guilds/{guild_id}"))
+        return Guild(self.client, response.data)
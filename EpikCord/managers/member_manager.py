@@ -1,15 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, List, Union
 
 if TYPE_CHECKING:
     from ..client.client import Client, WebsocketClient
+    from ..guild import GuildMember
 
-from .cache_manager import CacheManager
+from .cache_manager import CacheManager, cache_policy_for
 
 
 class MemberManager(CacheManager):
     def __init__(self, client: Union[Client, WebsocketClient], guild_id: int):
-        super().__init__()
+        super().__init__(cache_policy_for(client, "members"))
         self.client = client
         self.guild_id: int = guild_id
+        self.add_index("role", lambda member: member.role_ids)
+
+    def with_role(self, role_id: int) -> List[GuildMember]:
+        """The cached members that have a role."""
+        return self.lookup("role", int(role_id))
+
+    async def fetch(self, member_id: int) -> GuildMember:
+        from EpikCord import GuildMember
+
+        response = await self.client.http.get(
+            f"/guilds/{self.guild_id}/members/{member_id}", guild_id=self.guild_id
+        )
+        return GuildMember(self.client, response.data)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from .cache_manager import CacheManager, cache_policy_for
+from .cache_policy import estimate_size
+
+if TYPE_CHECKING:
+    from ..client.client import Client, WebsocketClient
+    from ..message import Message
+
+
+def estimate_message_size(message: Message) -> int:
+    """:func:`estimate_size` plus the raw embeds, components and the like
+    that haven't been decoded yet, which can be most of a message."""
+    return estimate_size(message) + sum(
+        sys.getsizeof(raw) for raw in message._pending.values()
+    )
+
+
+class MessageManager(CacheManager):
+    """The most recent messages of every channel.
+
+    Each channel keeps its last ``max_per_channel`` messages, adding one
+    to a full channel evicts that channel's oldest. For a budget across all
+    channels, give the client a ``"messages"`` cache policy, like
+    ``LRUPolicy(max_bytes=64 * 2**20, sizeof=estimate_message_size)``.
+    Every insert, eviction and lookup by ID is O(1).
+
+    Parameters
+    ----------
+    client : Union[Client, WebsocketClient]
+        The client the messages belong to.
+    max_per_channel : int
+        How many messages to keep per channel. ``0`` disables the cache.
+    """
+
+    def __init__(
+        self, client: Union[Client, WebsocketClient], max_per_channel: int = 100
+    ):
+        super().__init__(cache_policy_for(client, "messages"))
+        self.client = client
+        self.max_per_channel: int = max_per_channel
+        # Message IDs by channel, oldest first.
+        self._channels: Dict[int, OrderedDict[int, None]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_per_channel > 0 and super().enabled
+
+    def add_to_cache(self, key: Union[int, str], value: Any):
+        channel = self._channels.setdefault(value.channel_id, OrderedDict())
+        channel[key] = None
+        super().add_to_cache(key, value)
+
+        while len(channel) > self.max_per_channel:
+            self.remove_from_cache(next(iter(channel)))
+
+    def remove_from_cache(self, key) -> Any:
+        message = super().remove_from_cache(key)
+        if message is not None and (channel := self._channels.get(message.channel_id)):
+            channel.pop(key, None)
+            if not channel:
+                del self._channels[message.channel_id]
+        return message
+
+    def clear_cache(self):
+        super().clear_cache()
+        self._channels.clear()
+
+    def forget_channel(self, channel_id: int):
+        """Drop every cached message of a channel, for when it's deleted."""
+        for message_id in list(self._channels.get(int(channel_id), ())):
+            self.remove_from_cache(message_id)
+
+    def get_message(self, message_id: int) -> Optional[Message]:
+        return self.get(int(message_id))
+
+    def _channel(self, channel_id: int) -> List[int]:
+        # A copy, as getting an expired message removes it from the channel.
+        return list(self._channels.get(int(channel_id), ()))
+
+    def channel_messages(self, channel_id: int) -> List[Message]:
+        """The cached messages of a channel, oldest first."""
+        return [
+            message
+            for message_id in self._channel(channel_id)
+            if (message := self.get(message_id)) is not None
+        ]
+
+    def before(
+        self, channel_id: int, message_id: int, *, limit: Optional[int] = None
+    ) -> List[Message]:
+        """The cached messages sent in a channel before ``message_id``,
+        newest first, like the ``before`` parameter of the API."""
+        message_id = int(message_id)
+        found = []
+        for key in reversed(self._channel(channel_id)):
+            if limit is not None and len(found) >= limit:
+                break
+            if key < message_id and (message := self.get(key)) is not None:
+                found.append(message)
+        return found
+
+    def after(
+        self, channel_id: int, message_id: int, *, limit: Optional[int] = None
+    ) -> List[Message]:
+        """The cached messages sent in a channel after ``message_id``, oldest first."""
+        message_id = int(message_id)
+        found = []
+        for key in self._channel(channel_id):
+            if limit is not None and len(found) >= limit:
+                break
+            if key > message_id and (message := self.get(key)) is not None:
+                found.append(message)
+        return found
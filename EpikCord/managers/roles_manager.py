@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+from ..exceptions import NotFound404
+from .cache_manager import CacheManager, cache_policy_for
+
+if TYPE_CHECKING:
+    from ..client.client import Client, WebsocketClient
+    from ..guild import Role
+
+
+class RoleManager(CacheManager):
+    def __init__(self, client: Union[Client, WebsocketClient], guild_id: int):
+        super().__init__(cache_policy_for(client, "roles"))
+        self.client = client
+        self.guild_id: int = guild_id
+
+    async def fetch(self, role_id: int) -> Role:
+        from EpikCord import Role
+
+        # Discord has no route for a single role, so we cache all of them
+        # while we're at it.
+        response = await self.client.http.get(
+            f"/guilds/{self.guild_id}/roles", guild_id=self.guild_id
+        )
+        guild = self.client.guilds.get(self.guild_id)
+        found = None
+
+        for role_data in response.data:
+            role = Role(self.client, {**role_data, "guild": guild})  # type: ignore
+            self.add_to_cache(role.id, role)
+
+            if role.id == role_id:
+                found = role
+
+        if not found:
+            raise NotFound404({"code": 10011, "message": "Unknown Role"})
+
+        return found
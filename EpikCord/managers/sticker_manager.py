@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+
+from .cache_manager import CacheManager, cache_policy_for
+
+if TYPE_CHECKING:
+    from ..client.client import Client, WebsocketClient
+    from ..sticker import Sticker
+
+
+class StickerManager(CacheManager):
+    def __init__(
+        self, client: Union[Client, WebsocketClient], guild_id: Optional[int] = None
+    ):
+        super().__init__(cache_policy_for(client, "stickers"))
+        self.client = client
+        self.guild_id: Optional[int] = guild_id
+
+    async def fetch(self, sticker_id: int) -> Sticker:
+        from EpikCord import Sticker
+
+        if self.guild_id:
+            response = await self.client.http.get(
+                f"/guilds/{self.guild_id}/stickers/{sticker_id}",
+                guild_id=self.guild_id,
+            )
+        else:
+            response = await self.client.http.get(f"/stickers/{sticker_id}")
+
+        return Sticker(self.client, response.data)
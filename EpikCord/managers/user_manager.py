@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
+
+from .cache_manager import CacheManager, cache_policy_for
+
+if TYPE_CHECKING:
+    import discord_typings
+
+    from ..client.client import Client, WebsocketClient
+    from ..user import User
+
+
+class UserManager(CacheManager):
+    """Every user the client has seen, one :class:`User` per ID.
+
+    Members, message authors, mentions and interaction authors all share
+    the instance kept here, so a user in many guilds is only stored once
+    and updating it updates it everywhere.
+    """
+
+    def __init__(self, client: Union[Client, WebsocketClient]):
+        super().__init__(cache_policy_for(client, "users"))
+        self.client = client
+
+    def store(self, data: discord_typings.UserData) -> User:
+        """Get the shared :class:`User` for ``data``, updating it in place
+        if it's cached and creating and caching it if it isn't."""
+        from EpikCord import User
+
+        user_id = int(data["id"])
+        if (user := self.get(user_id)) is not None:
+            user._update(data)
+            return user
+
+        user = User(self.client, data)
+        if self.enabled:
+            self.add_to_cache(user_id, user)
+        return user
+
+    async def fetch(self, user_id: int) -> User:
+        response = await self.client.http.get(f"/users/{user_id}")
+        return self.store(response.data)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Union
+
+from .cache_manager import CacheManager, cache_policy_for
+
+if TYPE_CHECKING:
+    from ..client.client import Client, WebsocketClient
+    from ..voice import VoiceState
+
+
+class VoiceStateManager(CacheManager):
+    """A guild's voice states, keyed by user ID."""
+
+    def __init__(self, client: Union[Client, WebsocketClient], guild_id: int):
+        super().__init__(cache_policy_for(client, "voice_states"))
+        self.client = client
+        self.guild_id: int = guild_id
+        self.add_index(
+            "channel", lambda state: (state.channel_id,) if state.channel_id else ()
+        )
+
+    def in_channel(self, channel_id: int) -> List[VoiceState]:
+        """The voice states of everyone connected to a channel."""
+        return self.lookup("channel", int(channel_id))
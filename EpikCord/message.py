@@ -9,6 +9,7 @@ from urllib.parse import quote as _quote
 import discord_typings
 from typing_extensions import NotRequired
 
+from .abstract import LazyFields, lazy_field
 from .application import Application
 from .colour import Colour
 from .components import *
@@ -53,12 +54,27 @@ class AllowedMention:
 
 
 class MessageActivity:
+    __slots__ = ("type", "party_id")
+
     def __init__(self, data: discord_typings.MessageActivityData):
         self.type: int = data["type"]
         self.party_id: Optional[str] = data.get("party_id")
 
 
 class Attachment:
+    __slots__ = (
+        "id",
+        "file_name",
+        "description",
+        "content_type",
+        "size",
+        "url",
+        "proxy_url",
+        "width",
+        "height",
+        "ephemeral",
+    )
+
     def __init__(self, data: discord_typings.AttachmentData):
         self.id: int = int(data["id"])
         self.file_name: str = data["filename"]
@@ -104,13 +120,30 @@ class Reaction:
         The partial emoji of this Reaction.
     """
 
+    __slots__ = ("count", "me", "emoji")
+
     def __init__(self, data: discord_typings.MessageReactionData):
         self.count: int = data["count"]
-        self.me: bool = data.get["me"]  # type: ignore
+        self.me: bool = data["me"]
         self.emoji: PartialEmoji = PartialEmoji(data["emoji"])
 
 
 class Embed:
+    __slots__ = (
+        "title",
+        "description",
+        "url",
+        "video",
+        "timestamp",
+        "color",
+        "footer",
+        "image",
+        "thumbnail",
+        "provider",
+        "author",
+        "fields",
+    )
+
     def __init__(
         self,
         *,
@@ -265,8 +298,8 @@ class Embed:
     def to_dict(self):
         return {
             key: value
-            for key, value in self.__dict__.items()
-            if value is not None or key.startswith("_")
+            for key in self.__slots__
+            if (value := getattr(self, key)) is not None
         }
 
     @classmethod
@@ -329,6 +362,8 @@ class File:
 
 
 class MessageReference:
+    __slots__ = ("message_id", "channel_id", "guild_id", "fail_if_not_exists")
+
     def __init__(self, data: discord_typings.MessageReferenceData) -> None:
         self.message_id: Optional[int] = (
             int(data["message_id"]) if data.get("message_id") else None
@@ -342,7 +377,7 @@ class MessageReference:
         self.fail_if_not_exists: Optional[bool] = data.get("fail_if_not_exists")
 
 
-class Message:
+class Message(LazyFields):
     """Represents a Discord message.
 
     Attributes
@@ -360,13 +395,63 @@ class Message:
 
     """
 
+    __slots__ = (
+        "client",
+        "id",
+        "channel_id",
+        "guild_id",
+        "webhook_id",
+        "author",
+        "content",
+        "_timestamp",
+        "_edited_timestamp",
+        "tts",
+        "mention_everyone",
+        "_mentions",
+        "mention_roles",
+        "_mention_channels",
+        "_embeds",
+        "_reactions",
+        "nonce",
+        "pinned",
+        "type",
+        "activity",
+        "application",
+        "flags",
+        "_referenced_message",
+        "message_reference",
+        "_interaction",
+        "_thread",
+        "_components",
+        "_sticker_items",
+        "channel",
+        "_pending",
+    )
+
+    # Decoded on first read, most handlers only look at a field or two.
+    _LAZY_FIELDS = (
+        "timestamp",
+        "edited_timestamp",
+        "mentions",
+        "mention_channels",
+        "embeds",
+        "reactions",
+        "referenced_message",
+        "interaction",
+        "thread",
+        "components",
+        "sticker_items",
+    )
+
     def __init__(self, client, data: discord_typings.MessageData):
-        from EpikCord import GuildMember, Reaction
+        from EpikCord import GuildMember
 
         self.client = client
         self.id: int = int(data["id"])
         self.channel_id: int = int(data["channel_id"])
-        self.guild_id: Optional[int] = int(data["guild_id"]) if data.get("guild_id") else None  # type: ignore
+        self.guild_id: Optional[int] = (
+            int(data["guild_id"]) if data.get("guild_id") else None  # type: ignore
+        )
         self.webhook_id: Optional[int] = (
             int(data["webhook_id"]) if data.get("webhook_id") else None
         )
@@ -379,38 +464,23 @@ class Message:
             member_data = data["member"]  # type: ignore
             if data.get("author"):
                 member_data["user"] = data["author"]
-            self.author = GuildMember(self, member_data)
+            self.author = GuildMember(client, member_data)
         else:
-            self.author = User(self, data["author"]) if data.get("author") else None
+            self.author = (
+                client.users.store(data["author"]) if data.get("author") else None
+            )
 
         self.content: Optional[str] = data.get("content")
-        self.timestamp: datetime.datetime = datetime.datetime.fromisoformat(
-            data["timestamp"]
-        )
-        self.edited_timestamp: Optional[str] = (
-            datetime.datetime.fromisoformat(data["edited_timestamp"])  # type: ignore
-            if data.get("edited_timestamp")
-            else None
-        )
+        self._pending: Dict[str, Any] = {
+            key: data[key] for key in self._LAZY_FIELDS if data.get(key)  # type: ignore
+        }
         self.tts: bool = data["tts"]
         self.mention_everyone: bool = data["mention_everyone"]
-        self.mentions: Optional[List[User]] = [
-            User(client, user) for user in data.get("mentions", [])
-        ]
         self.mention_roles: Optional[List[int]] = (
             [int(r) for r in data["mention_roles"]]
             if data.get("mention_roles")
             else None
         )
-        self.mention_channels: Optional[List[MentionedChannel]] = [
-            MentionedChannel(channel) for channel in data.get("mention_channels", [])
-        ]
-        self.embeds: Optional[List[Embed]] = [
-            Embed.from_dict(embed) for embed in data.get("embeds", [])
-        ]
-        self.reactions: Optional[List[Reaction]] = [
-            Reaction(reaction) for reaction in data.get("reactions", [])
-        ]
         self.nonce: Optional[Union[int, str]] = data.get("nonce")
         self.pinned: bool = data["pinned"]
         self.type: int = data["type"]
@@ -423,46 +493,94 @@ class Message:
             Application(data["application"]) if data.get("application") else None
         )
         self.flags: Optional[int] = data.get("flags")
-        self.referenced_message: Optional[Message] = (
-            Message(client, data["referenced_message"])  # type: ignore # MyPy being dumb
-            if data.get("referenced_message")
-            else None
-        )
         self.message_reference: Optional[MessageReference] = (
             MessageReference(data["message_reference"])
             if data.get("message_reference")
             else None
         )
-        from .interactions import MessageInteraction
 
-        self.interaction: Optional[MessageInteraction] = (
-            MessageInteraction(client, data["interaction"])
-            if data.get("interaction")
-            else None
-        )
-        self.thread: Optional[Thread] = (
-            Thread(self.client, data["thread"]) if data.get("thread") else None
-        )
-        self.components: Optional[List[Union[TextInput, SelectMenu, Button]]] = (
-            [ActionRow.from_dict(component) for component in data["components"]]
-            if data.get("components")
-            else None
-        )
+        self.channel = client.channels.get(self.channel_id)
 
-        self.sticker_items: Optional[List[StickerItem]] = (
-            [StickerItem(sticker) for sticker in data["sticker_items"]]
-            if data.get("sticker_items")
-            else None
-        )
+    @lazy_field
+    def timestamp(self, raw: str) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(raw)
+
+    @lazy_field
+    def edited_timestamp(self, raw: Optional[str]) -> Optional[datetime.datetime]:
+        return datetime.datetime.fromisoformat(raw) if raw else None
+
+    @lazy_field
+    def mentions(self, raw: Optional[List[discord_typings.UserData]]) -> List[User]:
+        return [self.client.users.store(user) for user in raw or ()]
+
+    @lazy_field
+    def mention_channels(
+        self, raw: Optional[List[discord_typings.ChannelMentionData]]
+    ) -> List[MentionedChannel]:
+        return [MentionedChannel(channel) for channel in raw or ()]  # type: ignore
+
+    @lazy_field
+    def embeds(self, raw: Optional[List[discord_typings.EmbedData]]) -> List[Embed]:
+        return [Embed.from_dict(embed) for embed in raw or ()]
+
+    @lazy_field
+    def reactions(
+        self, raw: Optional[List[discord_typings.MessageReactionData]]
+    ) -> List[Reaction]:
+        return [Reaction(reaction) for reaction in raw or ()]
+
+    @lazy_field
+    def referenced_message(
+        self, raw: Optional[discord_typings.MessageData]
+    ) -> Optional["Message"]:
+        return Message(self.client, raw) if raw else None
+
+    @lazy_field
+    def interaction(self, raw: Optional[discord_typings.MessageInteractionData]):
+        from .interactions import MessageInteraction
 
-        self.channel = client.channels.get(self.channel_id)
+        return MessageInteraction(self.client, raw) if raw else None  # type: ignore
+
+    @lazy_field
+    def thread(
+        self, raw: Optional[discord_typings.ThreadChannelData]
+    ) -> Optional[Thread]:
+        return Thread(self.client, raw) if raw else None
+
+    @lazy_field
+    def components(
+        self, raw: Optional[List[discord_typings.ComponentData]]
+    ) -> Optional[List[ActionRow]]:
+        if not raw:
+            return None
+        return [ActionRow.from_dict(component) for component in raw]  # type: ignore
+
+    @lazy_field
+    def sticker_items(
+        self, raw: Optional[List[discord_typings.StickerItemData]]
+    ) -> Optional[List[StickerItem]]:
+        return [StickerItem(sticker) for sticker in raw] if raw else None
+
+    def _update(self, data: discord_typings.MessageUpdateData):
+        """Update this message in place from a MESSAGE_UPDATE, which
+        only has the fields that changed. Other fields keep their value."""
+        if "content" in data:
+            self.content = data["content"]
+        for key in ("tts", "mention_everyone", "pinned", "flags"):
+            if key in data:
+                setattr(self, key, data[key])
+        if "mention_roles" in data:
+            self.mention_roles = [int(r) for r in data["mention_roles"]] or None
+        for key in self._LAZY_FIELDS:
+            if key in data:
+                getattr(Message, key).defer(self, data[key])
 
     async def add_reaction(self, emoji: str):
         emoji = _quote(emoji)
         response = await self.client.http.put(
             f"channels/{self.channel_id}/messages/{self.id}/reactions/{emoji}/@me"
         )
-        return await response.json()
+        return response.data
 
     async def remove_reaction(self, emoji: str, user=None):
         emoji = _quote(emoji)
@@ -476,50 +594,50 @@ class Message:
             )
         )
 
-        return await response.json()
+        return response.data
 
     async def fetch_reactions(self, *, after, limit) -> List[Reaction]:
         response = await self.client.http.get(
             f"channels/{self.channel_id}/messages/{self.id}/reactions?after={after}&limit={limit}"
         )
-        return await response.json()
+        return response.data
 
     async def delete_all_reactions(self):
         response = await self.client.http.delete(
             f"channels/{self.channel_id}/messages/{self.id}/reactions"
         )
-        return await response.json()
+        return response.data
 
     async def delete_reaction_for_emoji(self, emoji: str):
         emoji = _quote(emoji)
         response = await self.client.http.delete(
             f"channels/{self.channel_id}/messages/{self.id}/reactions/{emoji}"
         )
-        return await response.json()
+        return response.data
 
     async def edit(self, message_data: dict):
         response = await self.client.http.patch(
             f"channels/{self.channel_id}/messages/{self.id}", data=message_data
         )
-        return await response.json()
+        return response.data
 
     async def delete(self, reason: Optional[str] = None):
         response = await self.client.http.delete(
             f"channels/{self.channel_id}/messages/{self.id}", reason=reason
         )
-        return await response.json()
+        return response.data
 
     async def pin(self, *, reason: Optional[str] = None):
         response = await self.client.http.put(
             f"channels/{self.channel_id}/pins/{self.id}", reason=reason
         )
-        return await response.json()
+        return response.data
 
     async def unpin(self, *, reason: Optional[str] = None):
         response = await self.client.http.delete(
             f"channels/{self.channel_id}/pins/{self.id}", reason=reason
         )
-        return await response.json()
+        return response.data
 
     async def start_thread(
         self,
@@ -540,7 +658,7 @@ class Message:
             json=payload,
         )
         # * Cache it
-        thread = Thread(self.client, await response.json())
+        thread = Thread(self.client, response.data)
         self.client.guilds[self.guild_id].channels[thread.id] = thread
         return thread
 
@@ -548,7 +666,7 @@ class Message:
         response = await self.client.http.post(
             f"channels/{self.channel_id}/messages/{self.id}/crosspost"
         )
-        return await response.json()
+        return response.data
 
 
 class MessagePayload(TypedDict):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from EpikCord.exceptions import InvalidData
 
@@ -8,6 +8,10 @@ from .abstract import BaseSlashCommandOption
 from .localizations import Localization
 from .type_enums import ChannelType
 
+if TYPE_CHECKING:
+    from .commands import Callback
+    from .converters import OptionBinder
+
 
 class StringOption(BaseSlashCommandOption):
     def __init__(
@@ -164,6 +168,9 @@ class Subcommand(BaseSlashCommandOption):
         super().__init__(name=name, description=description)
         self.type = 1
         self.options = options or []
+        # Set with ClientSlashCommand.subcommand.
+        self.callback: Optional[Callback] = None
+        self.binder: Optional[OptionBinder] = None
         for option in self.options:
             if option.type == 1:
                 raise InvalidData("You cannot have a subcommand in a subcommand group.")
@@ -206,6 +213,7 @@ class SubCommandGroup(BaseSlashCommandOption):
 class ReceivedOption:
     def __init__(self, data):
         self.data = data
+        self.name: str = data["name"]
         self.type = data["type"]
         self.value: Optional[str] = data.get("value")
         self.focused: Optional[bool] = data.get("focused")
@@ -33,7 +33,9 @@ class PartialChannel:
         self.id: int = int(data["id"])
         self.type: int = data["type"]
         self.permissions: Optional[Permissions] = (
-            Permissions(int(data["permissions"])) if data.get("permissions") else None
+            Permissions.from_value(int(data["permissions"]))
+            if data.get("permissions")
+            else None
         )
 
 
@@ -56,7 +58,9 @@ class PartialGuild:
         self.id: int = int(data["id"])
         self.name: str = data["name"]
         self.permissions: Optional[Permissions] = (
-            Permissions(int(data["permissions"])) if data.get("permissions") else None
+            Permissions.from_value(int(data["permissions"]))
+            if data.get("permissions")
+            else None
         )
         self.features: Optional[List[discord_typings.GuildFeaturesData]] = data.get(
             "features"
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import datetime
+from logging import getLogger
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from .flags import Permissions
+from .guild import Guild
+from .thread import Thread
+
+if TYPE_CHECKING:
+    from .channels import AnyChannel
+    from .client import WebsocketClient
+    from .guild import GuildMember
+
+logger = getLogger(__name__)
+
+_ADMINISTRATOR = Permissions.administrator
+_VIEW_CHANNEL = Permissions.read_messages
+_SEND_MESSAGES = Permissions.send_messages
+# What a member can still do in a channel while timed out.
+_TIMED_OUT = Permissions.read_messages | Permissions.read_message_history
+# Denied along with SEND_MESSAGES.
+_NEEDS_SEND_MESSAGES = (
+    Permissions.send_tts_messages
+    | Permissions.mention_everyone
+    | Permissions.embed_links
+    | Permissions.attach_files
+)
+
+# The member's role IDs when the result was worked out, and the result.
+_Entry = Tuple[List[int], int]
+
+
+class PermissionResolver:
+    """Works out what a member can do in a channel, from the guild's roles,
+    the channel's overwrites, the guild owner, administrators and timeouts.
+
+    Results are cached per guild, channel and member, and the client drops
+    them on role, member, channel and guild updates. A cached result is only
+    used while the member still has the roles it was worked out with,
+    so it stays right even without the members intent. Threads use their
+    parent channel's overwrites and share its results.
+
+    Parameters
+    ----------
+    client : WebsocketClient
+        The client whose guild, role and channel caches to read.
+    max_entries : int
+        How many results to keep. Once it's full, the cache starts over.
+    """
+
+    def __init__(self, client: WebsocketClient, *, max_entries: int = 100000):
+        self.client = client
+        self.max_entries: int = max_entries
+        self._entries: int = 0
+        # guild ID -> channel ID -> member ID -> entry.
+        self._cache: Dict[int, Dict[int, Dict[int, _Entry]]] = {}
+
+    def resolve(
+        self,
+        member: Union[GuildMember, int],
+        channel: Union[AnyChannel, Thread],
+    ) -> Optional[Permissions]:
+        """The permissions ``member`` has in ``channel``.
+
+        ``None`` if the channel's guild, the member or a thread's parent
+        channel aren't cached, as there's nothing to work them out from.
+        """
+        guild = self.client.guilds.get(getattr(channel, "guild_id", None))
+        if not isinstance(guild, Guild):
+            return None
+
+        if isinstance(channel, Thread):
+            parent = self.client.channels.get(channel.parent_id)
+            if parent is None:
+                logger.debug(f"Parent of thread {channel.id} is not cached.")
+                return None
+            channel = parent
+
+        if isinstance(member, int):
+            member = guild.members.get(member)
+            if member is None:
+                return None
+
+        members = self._cache.setdefault(guild.id, {}).setdefault(channel.id, {})
+        entry = members.get(member.id)
+        if entry is None or entry[0] != member.role_ids:
+            if entry is None:
+                if self._entries >= self.max_entries:
+                    self.clear()
+                    members = self._cache.setdefault(guild.id, {}).setdefault(
+                        channel.id, {}
+                    )
+                self._entries += 1
+            entry = (list(member.role_ids), self._compute(guild, member, channel))
+            members[member.id] = entry
+
+        value = entry[1]
+        if (
+            value != Permissions.all_value
+            and member.communication_disabled_until
+            and member.communication_disabled_until
+            > datetime.datetime.now(datetime.timezone.utc)
+        ):
+            value &= _TIMED_OUT
+        return Permissions.from_value(value)
+
+    def base_permissions(self, guild: Guild, member: GuildMember) -> Permissions:
+        """The permissions ``member`` has from their roles, before overwrites."""
+        return Permissions.from_value(self._base(guild, member))
+
+    def _base(self, guild: Guild, member: GuildMember) -> int:
+        if member.id == guild.owner_id:
+            return Permissions.all_value
+
+        roles = guild.roles
+        everyone = roles.get(guild.id)
+        value = everyone.permissions.value if everyone else 0
+        for role_id in member.role_ids:
+            if (role := roles.get(role_id)) is not None:
+                value |= role.permissions.value
+
+        if value & _ADMINISTRATOR:
+            return Permissions.all_value
+        return value
+
+    def _compute(self, guild: Guild, member: GuildMember, channel) -> int:
+        value = self._base(guild, member)
+        if value == Permissions.all_value:
+            return value
+
+        allow = deny = 0
+        member_overwrite = None
+        for overwrite in getattr(channel, "permission_overwrites", ()):
+            if overwrite.id == guild.id:
+                # @everyone applies first, before any other overwrite.
+                value &= ~int(overwrite.deny)
+                value |= int(overwrite.allow)
+            elif overwrite.type == 0:
+                if overwrite.id in member.role_ids:
+                    allow |= int(overwrite.allow)
+                    deny |= int(overwrite.deny)
+            elif overwrite.id == member.id:
+                member_overwrite = overwrite
+
+        value &= ~deny
+        value |= allow
+        if member_overwrite is not None:
+            value &= ~int(member_overwrite.deny)
+            value |= int(member_overwrite.allow)
+
+        # Discord denies everything in channels the member can't see, and
+        # what goes with sending messages when they can't send messages.
+        if not value & _VIEW_CHANNEL:
+            return 0
+        if not value & _SEND_MESSAGES:
+            value &= ~_NEEDS_SEND_MESSAGES
+        return value
+
+    def invalidate_guild(self, guild_id: int):
+        """Forget every result in a guild, for when its roles or owner change."""
+        if channels := self._cache.pop(int(guild_id), None):
+            self._entries -= sum(len(members) for members in channels.values())
+
+    def invalidate_channel(self, guild_id: int, channel_id: int):
+        """Forget the results in a channel, for when its overwrites change."""
+        channels = self._cache.get(int(guild_id))
+        if channels and (members := channels.pop(int(channel_id), None)):
+            self._entries -= len(members)
+
+    def invalidate_member(self, guild_id: int, member_id: int):
+        """Forget a member's results in a guild."""
+        member_id = int(member_id)
+        for members in self._cache.get(int(guild_id), {}).values():
+            if members.pop(member_id, None) is not None:
+                self._entries -= 1
+
+    def clear(self):
+        self._cache.clear()
+        self._entries = 0
+
+
+__all__ = ("PermissionResolver",)
@@ -1,18 +1,120 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
+from contextlib import suppress
+from logging import getLogger
 from sys import platform
-from typing import TYPE_CHECKING, List, Optional
+from time import monotonic
+from typing import TYPE_CHECKING, Any, DefaultDict, Dict, List, Optional
 
-from .client import HTTPClient, WebsocketClient
+from .client import (
+    CacheSnapshot,
+    CommandHandler,
+    CommandSync,
+    Event,
+    EventDispatcher,
+    HTTPClient,
+    SessionStore,
+    WebsocketClient,
+)
+from .client.websocket_client import Callback
 from .flags import Intents
+from .managers import CachePolicy
 from .opcodes import GatewayOpcode
 from .presence import Presence
-from .utils import Utils
 
 if TYPE_CHECKING:
     import discord_typings
 
+    from .cluster import ClusterBus
+
+logger = getLogger(__name__)
+
+
+class IdentifyScheduler:
+    """Spaces out shard identifies the way Discord requires.
+
+    Shards are grouped into ``shard_id % max_concurrency`` buckets. Each bucket
+    may identify once every :attr:`interval` seconds, and all buckets identify
+    in parallel. Starting every shard therefore takes about
+    ``shards / max_concurrency * interval`` seconds.
+
+    Every identify also uses up one of the bot's daily session starts. Once none
+    are left, identifying waits until they reset.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        How many buckets there are, as given by ``GET /gateway/bot``.
+    remaining : Optional[int]
+        How many session starts are left, ``None`` to not keep track.
+    reset_after : float
+        How many seconds until the session starts reset.
+    total : Optional[int]
+        How many session starts there are after a reset.
+    """
+
+    interval: float = 5.0
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        *,
+        remaining: Optional[int] = None,
+        reset_after: float = 0,
+        total: Optional[int] = None,
+    ):
+        self.max_concurrency: int = max_concurrency
+        self.remaining: Optional[int] = remaining
+        self.total: Optional[int] = remaining if total is None else total
+        self.resets_at: float = monotonic() + reset_after
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._last_identify: Dict[int, float] = {}
+
+    @classmethod
+    def from_gateway(cls, data: discord_typings.GetGatewayBotData):
+        limit = data["session_start_limit"]
+        return cls(
+            limit["max_concurrency"],
+            remaining=limit["remaining"],
+            reset_after=limit["reset_after"] / 1000,
+            total=limit["total"],
+        )
+
+    async def _take_session_start(self):
+        if self.remaining is None:
+            return
+
+        while self.remaining <= 0:
+            if (delay := self.resets_at - monotonic()) > 0:
+                logger.warning(
+                    f"Out of session starts, waiting {delay:.1f}s for them to reset."
+                )
+                await asyncio.sleep(delay)
+
+            # Another bucket may have already reset them while we slept.
+            if self.remaining <= 0:
+                self.remaining = self.total
+                self.resets_at = monotonic() + 24 * 60 * 60
+
+        self.remaining -= 1  # type: ignore
+
+    async def acquire(self, shard_id: int):
+        """Wait until ``shard_id`` may identify."""
+        key = shard_id % self.max_concurrency
+        lock = self._locks.get(key)
+        if not lock:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            last = self._last_identify.get(key)
+            if last is not None and (delay := last + self.interval - monotonic()) > 0:
+                await asyncio.sleep(delay)
+
+            await self._take_session_start()
+            self._last_identify[key] = monotonic()
+
 
 class Shard(WebsocketClient):
     def __init__(
@@ -23,14 +125,43 @@ class Shard(WebsocketClient):
         number_of_shards,
         presence: Optional[Presence] = None,
         discord_endpoint: str = "https://discord.com/api/v10",
+        cache_policies: Optional[Dict[str, CachePolicy]] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        encoding: str = "json",
+        compression: Optional[str] = "zlib-stream",
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: Optional[CacheSnapshot] = None,
+        keep_payloads: bool = True,
+        messages_per_channel: int = 100,
     ):
-        super().__init__(token, intents, presence, discord_endpoint)
+        super().__init__(
+            token,
+            intents,
+            presence,
+            discord_endpoint,
+            cache_policies,
+            dispatcher,
+            encoding,
+            compression,
+            session_store,
+            cache_snapshot,
+            keep_payloads,
+            messages_per_channel,
+        )
         self.shard_id = [shard_id, number_of_shards]
+        self.identify_scheduler: Optional[IdentifyScheduler] = None
 
     async def ready(self, data: dict):
         self.session_id: str = data["session_id"]
 
+    async def _close_dispatcher(self):
+        # Shared with the other shards, the manager closes it.
+        pass
+
     async def identify(self):
+        if self.identify_scheduler:
+            await self.identify_scheduler.acquire(self.shard_id[0])
+
         payload = {
             "op": GatewayOpcode.IDENTIFY,
             "d": {
@@ -41,7 +172,7 @@ class Shard(WebsocketClient):
                     "browser": "EpikCord.py",
                     "device": "EpikCord.py",
                 },
-                "shard": str(self.shard_id),
+                "shard": self.shard_id,
             },
         }
 
@@ -50,84 +181,175 @@ class Shard(WebsocketClient):
 
         await self.send_json(payload)
 
-    async def reconnect(self):
-        await self.close()
-        await self.connect()
-        await self.identify()
-        await self.resume()
+    @property
+    def session_key(self) -> str:
+        return f"{self.shard_id[0]}-{self.shard_id[1]}"
 
 
-class ShardManager:
+class ShardManager(CommandHandler):
     def __init__(
         self,
         token: str,
         intents: Intents,
         *,
         shards: Optional[int] = None,
+        shard_ids: Optional[List[int]] = None,
         overwrite_commands_on_ready: bool = False,
-        discord_endpoint: Optional[str] = None,
+        discord_endpoint: str = "https://discord.com/api/v10",
         presence: Optional[Presence] = None,
+        cache_policies: Optional[Dict[str, CachePolicy]] = None,
+        dispatcher: Optional[EventDispatcher] = None,
+        encoding: str = "json",
+        compression: Optional[str] = "zlib-stream",
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: Optional[CacheSnapshot] = None,
+        keep_payloads: bool = True,
+        messages_per_channel: int = 100,
+        command_sync: Optional[CommandSync] = None,
     ):
         super().__init__()
         self.token: str = token
         self.overwrite_commands_on_ready: bool = overwrite_commands_on_ready
-        from EpikCord import __version__
-
-        self.http: HTTPClient = HTTPClient(
-            token,
-            headers={
-                "Authorization": f"Bot {token}",
-                "User-Agent": f"DiscordBot (https://github.com/EpikCord/EpikCord.py {__version__})",
-            },
-        )
+        self.command_sync: CommandSync = command_sync or CommandSync()
+        self._components: Dict[str, Callback] = {}
+        self.http: HTTPClient = HTTPClient(token, discord_endpoint=discord_endpoint)
         self.intents: Intents = (
             intents if isinstance(intents, Intents) else Intents(intents)  # type: ignore
         )
         self.desired_shards: Optional[int] = shards
+        # Only run these shards out of all of them, for spreading a bot over
+        # several processes or machines.
+        self.shard_ids: Optional[List[int]] = shard_ids
         self.shards: List[Shard] = []
+        self.events: DefaultDict[str, List[Callback]] = defaultdict(list)
         self.presence: Optional[Presence] = presence
-        self.discord_endpoint: Optional[str] = discord_endpoint
+        self.discord_endpoint: str = discord_endpoint
+        self.cache_policies: Optional[Dict[str, CachePolicy]] = cache_policies
+        # One pool for every shard, so the listener concurrency limit is global.
+        self.dispatcher: EventDispatcher = dispatcher or EventDispatcher()
+        self.encoding: str = encoding
+        self.compression: Optional[str] = compression
+        self.session_store: Optional[SessionStore] = session_store
+        self.cache_snapshot: Optional[CacheSnapshot] = cache_snapshot
+        self.keep_payloads: bool = keep_payloads
+        self.messages_per_channel: int = messages_per_channel
+        # Made from GET /gateway/bot on start if not given.
+        self.identify_scheduler: Optional[IdentifyScheduler] = identify_scheduler
+        # Set when this manager runs one cluster of a ClusterManager.
+        self.cluster: Optional[ClusterBus] = None
 
-    def run(self):
-        async def wrapper():
-            endpoint_data = await self.http.get("/gateway/bot")  # ClientResponse
-            endpoint_data = await endpoint_data.json()  # Dict
-
-            max_concurrency = endpoint_data["session_start_limit"]["max_concurrency"]
-
-            shards = self.desired_shards or endpoint_data["shards"]
-
-            for shard_id in range(shards):
-                self.shards.append(
-                    Shard(
-                        self.token,
-                        self.intents,
-                        shard_id,
-                        shards,
-                        self.presence,
-                        self.discord_endpoint,
-                    )
-                )
+    def event(self, event_name: Optional[str] = None):
+        def register_event(func):
+            func_name = event_name or func.__name__.lower()
+
+            if func_name.startswith("on_"):
+                func_name = func_name[3:]
 
-            current_iteration = 0  # The current shard_id we've run
+            self.events[func_name].append(func)
 
-            for shard in self.shards:
-                shard.events = self.events
-                await shard.login()
-                await shard.wait_for("ready")
+            return Event(func, event_name=func_name)
 
-                current_iteration += 1
+        return register_event
 
-                if current_iteration == max_concurrency:
-                    await asyncio.sleep(5)
-                    current_iteration = 0  # Reset it
+    async def dispatch(self, event_name: str, *args: Any, **kwargs: Any):
+        key = self.dispatcher.key_for(args)
+        for callback in self.events.get(event_name, ()):
+            await self.dispatcher.submit(callback, *args, key=key, **kwargs)
 
-            if self.overwrite_commands_on_ready:
-                for shard in self.shards:
-                    await Utils(shard).override_commands()
+    async def sync_commands(self) -> int:
+        """Sync the commands registered on this manager with Discord, see
+        :class:`CommandSync`. Commands belong to the application, so this is
+        done once for every shard."""
+        response = await self.http.get("/oauth2/applications/@me")
+        return await self.command_sync.sync(
+            self.http, response.data["id"], self.all_commands
+        )
+
+    async def start(self):
+        # Runs while the shards connect, it doesn't need any of them.
+        sync = (
+            asyncio.create_task(self.sync_commands())
+            if self.overwrite_commands_on_ready
+            else None
+        )
+        if self.commands:
+            self.events["interaction_create"].append(self.handle_interaction)
 
+        endpoint_data = await self.http.get("/gateway/bot")  # HTTPResponse
+        endpoint_data = endpoint_data.data  # Dict
+
+        if not self.identify_scheduler:
+            self.identify_scheduler = IdentifyScheduler.from_gateway(endpoint_data)
+
+        shards = self.desired_shards or endpoint_data["shards"]
+        shard_ids = range(shards) if self.shard_ids is None else self.shard_ids
+
+        for shard_id in shard_ids:
+            shard = Shard(
+                self.token,
+                self.intents,
+                shard_id,
+                shards,
+                self.presence,
+                self.discord_endpoint,
+                self.cache_policies,
+                self.dispatcher,
+                self.encoding,
+                self.compression,
+                self.session_store,
+                self.cache_snapshot,
+                self.keep_payloads,
+                self.messages_per_channel,
+            )
+            shard.events = self.events
+            shard.identify_scheduler = self.identify_scheduler
+            self.shards.append(shard)
+
+        # Every shard connects at once, the scheduler decides when each identifies.
+        ready = asyncio.ensure_future(
+            asyncio.gather(*(self._wait_until_ready(shard) for shard in self.shards))
+        )
+        connections = [asyncio.create_task(shard.connect()) for shard in self.shards]
+
+        # A shard failing to connect would otherwise leave this waiting forever.
+        await asyncio.wait([ready, *connections], return_when=asyncio.FIRST_COMPLETED)
+        if not ready.done():
+            ready.cancel()
+            with suppress(asyncio.CancelledError):
+                await ready
+            await asyncio.gather(*connections)
+            return
+        logger.info(f"All {len(self.shards)} shards are ready.")
+
+        if sync:
+            await sync
+
+        await asyncio.gather(*connections)
+
+    @staticmethod
+    async def _wait_until_ready(shard: Shard):
+        """Wait for ``shard``'s READY, or RESUMED if it resumed a saved session."""
+        waiters = [
+            asyncio.ensure_future(shard.wait_for(event))
+            for event in ("ready", "resumed")
+        ]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def close(self):
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+        await self.dispatcher.close()
+
+    def run(self):
         loop = asyncio.get_event_loop()
-        loop.run_until_complete(wrapper())
+        try:
+            loop.run_until_complete(self.start())
+        finally:
+            loop.run_until_complete(self.close())
 
 
-__all__ = ("Shard", "ShardManager")
+__all__ = ("IdentifyScheduler", "Shard", "ShardManager")
@@ -20,6 +20,10 @@ class Sticker:
     def __init__(self, client, data: discord_typings.StickerData):
         self.client = client
         self.id: int = int(data["id"])
+        self._update(data)
+
+    def _update(self, data: discord_typings.StickerData):
+        """Update this sticker in place from a newer sticker object."""
         self.pack_id: Optional[int] = (
             int(data["pack_id"]) if data.get("pack_id") else None
         )
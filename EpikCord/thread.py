@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from .abstract import Messageable
+from .abstract import Messageable, raw_payload
 from .exceptions import NotFound404, ThreadArchived
 from .type_enums import VideoQualityMode
 
@@ -24,6 +24,15 @@ class ThreadMember:
 
 
 class ThreadMetaData:
+    __slots__ = (
+        "archived",
+        "auto_archive_duration",
+        "archive_timestamp",
+        "locked",
+        "invitable",
+        "create_timestamp",
+    )
+
     def __init__(self, data: discord_typings.ThreadMetadataData):
         self.archived: bool = data["archived"]
         self.auto_archive_duration: int = data["auto_archive_duration"]
@@ -40,14 +49,42 @@ class ThreadMetaData:
 
 
 class Thread(Messageable):
+    __slots__ = (
+        "id",
+        "client",
+        "data",
+        "type",
+        "guild_id",
+        "parent_id",
+        "owner_id",
+        "message_count",
+        "member_count",
+        "metadata",
+    )
+
     def __init__(self, client, data: discord_typings.ThreadChannelData):
         super().__init__(client, int(data["id"]))
 
+        self.data: Optional[discord_typings.ThreadChannelData] = raw_payload(
+            client, data
+        )
+        self.type: int = data["type"]
+        self.guild_id: Optional[int] = (
+            int(data["guild_id"]) if data.get("guild_id") else None
+        )
+        self.parent_id: Optional[int] = (
+            int(data["parent_id"]) if data.get("parent_id") else None
+        )
         self.owner_id: int = int(data["owner_id"])
         self.message_count: Optional[int] = data.get("message_count")
         self.member_count: Optional[int] = data.get("member_count")
         self.metadata: ThreadMetaData = ThreadMetaData(data["thread_metadata"])
 
+    def _update(self, data: discord_typings.ThreadChannelData):
+        """Update this thread in place from a THREAD_UPDATE, which has
+        the whole thread."""
+        self.__init__(self.client, data)  # type: ignore
+
     async def join(self):
         if self.archived:
             raise ThreadArchived(
@@ -66,7 +103,7 @@ class Thread(Messageable):
         response = await self.client.http.put(
             f"/channels/{self.id}/thread-members/{member_id}", channel_id=self.id
         )
-        return await response.json()
+        return response.data
 
     async def leave(self):
         if self.archived:
@@ -76,7 +113,7 @@ class Thread(Messageable):
         response = await self.client.http.delete(
             f"/channels/{self.id}/thread-members/@me", channel_id=self.id
         )
-        return await response.json()
+        return response.data
 
     async def remove_member(self, member_id: str):
         if self.metadata.archived:
@@ -87,7 +124,7 @@ class Thread(Messageable):
         response = await self.client.http.delete(
             f"/channels/{self.id}/thread-members/{member_id}", channel_id=self.id
         )
-        return await response.json()
+        return response.data
 
     async def fetch_member(self, member_id: str) -> ThreadMember:
         from EpikCord import ThreadMember
@@ -97,7 +134,7 @@ class Thread(Messageable):
         )
         if response.status == 404:
             raise NotFound404("The member you are trying to fetch does not exist")
-        return ThreadMember(await response.json())
+        return ThreadMember(response.data)
 
     async def list_members(self) -> List[ThreadMember]:
         from EpikCord import ThreadMember
@@ -105,7 +142,7 @@ class Thread(Messageable):
         response = await self.client.http.get(
             f"/channels/{self.id}/thread-members", channel_id=self.id
         )
-        return [ThreadMember(member) for member in await response.json()]
+        return [ThreadMember(member) for member in response.data]
 
     async def bulk_delete(
         self, message_ids: List[int], reason: Optional[str] = None
@@ -117,7 +154,7 @@ class Thread(Messageable):
             reason=reason,
             channel_id=self.id,
         )
-        return await response.json()
+        return response.data
 
 
 __all__ = ("Thread", "ThreadMember")
@@ -2,16 +2,36 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from .abstract import Messageable
+from .abstract import Messageable, raw_payload
 
 if TYPE_CHECKING:
     import discord_typings
 
 
 class User(Messageable):
+    __slots__ = (
+        "id",
+        "client",
+        "data",
+        "username",
+        "discriminator",
+        "avatar",
+        "bot",
+        "system",
+        "mfa_enabled",
+        "banner",
+        "accent_color",
+        "locale",
+        "verified",
+        "email",
+        "flags",
+        "premium_type",
+        "public_flags",
+    )
+
     def __init__(self, client, data: discord_typings.UserData):
         super().__init__(client, int(data["id"]))
-        self.data = data
+        self.data: Optional[discord_typings.UserData] = raw_payload(client, data)
         self.client = client
         self.id: int = int(data["id"])
         self.username: str = data["username"]
@@ -31,8 +51,25 @@ class User(Messageable):
         self.premium_type: Optional[int] = data.get("premium_type")
         self.public_flags: Optional[int] = data.get("public_flags")
 
+    def _update(self, data: discord_typings.UserData):
+        """Update this user in place from a newer payload. Payloads that
+        leave fields out, like message authors, keep what we already know."""
+        for key in User.__slots__[3:]:
+            if key in data:
+                setattr(self, key, data[key])
+
+        if self.data is not None:
+            self.data = {**self.data, **data}
+
     def to_dict(self) -> discord_typings.UserData:
-        return self.data
+        if self.data is not None:
+            return self.data
+
+        payload = {"id": str(self.id)}
+        for key in User.__slots__[3:]:
+            if (value := getattr(self, key)) is not None:
+                payload[key] = value
+        return payload  # type: ignore
 
 
 __all__ = ("User",)
@@ -4,7 +4,6 @@ import asyncio
 import datetime
 import re
 from base64 import b64encode
-from collections import defaultdict
 from logging import getLogger
 from typing import TYPE_CHECKING, Callable, Optional, TypeVar, Union
 
@@ -15,15 +14,17 @@ from ..interactions import (
     ApplicationCommandInteraction,
     AutoCompleteInteraction,
     ButtonInteraction,
+    MessageCommandInteraction,
     ModalSubmitInteraction,
     SelectMenuInteraction,
+    UserCommandInteraction,
 )
 from ..thread import Thread
 
 if TYPE_CHECKING:
     import discord_typings
 
-    from ..client import WebsocketClient
+    from ..client import CommandSync, WebsocketClient
 
 logger = getLogger(__name__)
 T = TypeVar("T")
@@ -78,52 +79,14 @@ class Utils:
     def filter_values(dictionary: dict):
         return {k: v for k, v in dictionary.items() if v is not None}
 
-    async def override_commands(self):
-        command_sorter = defaultdict(list)
-
-        for command in self.client.commands.values():
-            command_payload = {"name": command.name, "type": command.type}
-
-            if command_payload["type"] == 1:
-                command_payload["description"] = command.description
-                command_payload["options"] = [
-                    option.to_dict() for option in command.options
-                ]
-
-                if command.name_localizations:
-                    command_payload["name_localizations"] = {}
-                    for name_localization in command.name_localizations:
-                        if not name_localization:
-                            return
-                        command_payload["name_localizations"][
-                            name_localization
-                        ] = name_localization.to_dict()
-
-                if command.description_localizations:
-                    command_payload["description_localizations"] = {}
-                    for description_localization in command.description_localizations:
-                        if not description_localization:
-                            return
-                        command_payload["description_localizations"][
-                            description_localization
-                        ] = description_localization.to_dict()
-
-            if command.guild_ids:
-                for guild_id in command.guild_ids:
-                    command_sorter[guild_id].append(command_payload)
-            else:
-                command_sorter["global"].append(command_payload)
-
-        for guild_id, commands in command_sorter.items():
-            if guild_id == "global":
-                await self.client.application.bulk_overwrite_global_application_commands(
-                    commands
-                )
-                continue
-
-            await self.client.application.bulk_overwrite_guild_application_commands(
-                guild_id, commands
-            )
+    async def override_commands(self, command_sync: Optional[CommandSync] = None):
+        """Sync the client's commands with Discord, sending only what changed
+        since they were last registered. See :class:`CommandSync`."""
+        from ..client import CommandSync
+
+        await (command_sync or CommandSync()).sync(
+            self.client.http, self.client.application.id, self.client.all_commands
+        )
 
     @staticmethod
     def get_mime_type_for_image(data: bytes) -> str:
@@ -171,8 +134,8 @@ class Utils:
         """Matches and returns a single output from two"""
         return variant_one or variant_two
 
-    @staticmethod
     def interaction_from_type(
+        self,
         data: discord_typings.InteractionData,
     ) -> Optional[
         Union[
@@ -184,7 +147,13 @@ class Utils:
         ]
     ]:
         interaction_types = {
-            2: ApplicationCommandInteraction,
+            2: lambda client, data: (
+                UserCommandInteraction
+                if data["data"]["type"] == 2
+                else MessageCommandInteraction
+                if data["data"]["type"] == 3
+                else ApplicationCommandInteraction
+            )(client, data),
             3: lambda client, data: SelectMenuInteraction(client, data)
             if data["data"].get("values")
             else ButtonInteraction(client, data),
@@ -24,7 +24,10 @@ class VoiceState:
         self.guild_id: Optional[int] = (
             int(data["guild_id"]) if data.get("guild_id") else None
         )
-        self.channel_id: int = int(data["channel_id"])  # type: ignore
+        # None when the user just left a channel.
+        self.channel_id: Optional[int] = (
+            int(data["channel_id"]) if data.get("channel_id") else None
+        )
         self.user_id: int = int(data["user_id"])
         self.member: Optional[GuildMember] = (
             GuildMember(client, data["member"]) if data.get("member") else None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import random
 from functools import partial
 from typing import TYPE_CHECKING, Callable, Dict
 
@@ -22,25 +24,31 @@ class WSEHandler:
     @staticmethod
     async def reconnect(ws_client, _event_data):
         await ws_client.reconnect()
-        await ws_client.resume()
 
     @staticmethod
     async def invalid_session(ws_client, event_data):
-        if event_data["d"]:
-            await ws_client.reconnect()
-            await ws_client.resume()
-            return
+        if not event_data["d"]:
+            await ws_client.invalidate_session()
+            # Discord asks for a random 1 to 5 second wait before identifying.
+            await asyncio.sleep(random.uniform(1, 5))
 
         await ws_client.reconnect()
 
     @staticmethod
     async def hello(ws_client, event_data):
         ws_client.heartbeat_interval = event_data["d"]["heartbeat_interval"] / 1000
-        await ws_client.identify()
+        # Before identifying, which may have to wait its turn for a while.
+        ws_client.start_heartbeat()
+
+        if ws_client.can_resume:
+            await ws_client.resume()
+        else:
+            await ws_client.identify()
 
     @staticmethod
-    def heartbeat_ack(ws_client, event_data):
+    async def heartbeat_ack(ws_client, event_data):
         ws_client.heartbeats.append(event_data)
+        ws_client.heartbeat_ack()
 
 
 # TODO: replace Dict with discord typing
@@ -0,0 +1,122 @@
+"""Cost of routing an application command interaction to its callback, for
+bots with more and more commands, each with subcommand groups.
+
+Interactions are built up front, so this measures :meth:`handle_interaction`
+alone: finding the route, binding the options to the subcommand callback's
+parameters and calling it.
+
+Run from the repository root with EpikCord installed (``pip install -e .``)::
+
+    python benchmarks/command_dispatch.py
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+from time import perf_counter
+
+from EpikCord import (
+    Client,
+    IntegerOption,
+    StringOption,
+    Subcommand,
+    SubCommandGroup,
+)
+
+GROUPS = 2
+SUBCOMMANDS = 3
+CALLS = 50000
+
+
+async def callback(interaction):
+    pass
+
+
+async def subcommand_callback(interaction, text, count):
+    pass
+
+
+def register(client, count):
+    for i in range(count):
+        command = client.command(
+            name=f"command{i}",
+            description="A command",
+            options=[
+                SubCommandGroup(
+                    name=f"group{g}",
+                    description="A group",
+                    options=[
+                        Subcommand(
+                            name=f"sub{s}",
+                            description="A subcommand",
+                            options=[
+                                StringOption(name="text", description="Text"),
+                                IntegerOption(name="count", description="Count"),
+                            ],
+                        )
+                        for s in range(SUBCOMMANDS)
+                    ],
+                )
+                for g in range(GROUPS)
+            ],
+        )(callback)
+        for g in range(GROUPS):
+            for s in range(SUBCOMMANDS):
+                command.subcommand(f"sub{s}", group=f"group{g}")(subcommand_callback)
+
+
+def interaction(client, count):
+    options = [
+        {"name": "text", "type": 3, "value": "hello"},
+        {"name": "count", "type": 4, "value": 3},
+    ]
+    return client.utils.interaction_from_type(
+        {
+            "id": "1",
+            "type": 2,
+            "application_id": "1",
+            "token": "token",
+            "version": 1,
+            "user": {"id": "1", "username": "user", "discriminator": "0"},
+            "data": {
+                "id": "1",
+                "type": 1,
+                "name": f"command{random.randrange(count)}",
+                "options": [
+                    {
+                        "name": f"group{random.randrange(GROUPS)}",
+                        "type": 2,
+                        "options": [
+                            {
+                                "name": f"sub{random.randrange(SUBCOMMANDS)}",
+                                "type": 1,
+                                "options": options,
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+    )
+
+
+async def main():
+    for count in (10, 100, 1000):
+        client = Client("token")
+        register(client, count)
+        interactions = [interaction(client, count) for _ in range(CALLS)]
+
+        start = perf_counter()
+        for i in interactions:
+            await client.handle_interaction(i)
+        elapsed = (perf_counter() - start) / CALLS
+
+        print(
+            f"{count:>5} commands ({len(client._routes):>5} routes):"
+            f" {elapsed * 1e6:5.2f} us per interaction"
+        )
+        await client.http.session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
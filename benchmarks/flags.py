@@ -0,0 +1,88 @@
+"""Per-operation cost of :class:`Permissions`: building one, checking a flag
+and setting a flag. Compared with the previous :class:`Flag`, which kept a
+list of the names that are on and looked every attribute up in it.
+
+Run from the repository root with EpikCord installed (``pip install -e .``)::
+
+    python benchmarks/flags.py
+"""
+from __future__ import annotations
+
+from timeit import repeat
+from typing import Any, Dict, List
+
+from EpikCord import Permissions
+
+
+class PreviousFlag:
+    class_flags: Dict[str, int]
+
+    def __init_subclass__(cls) -> None:
+        cls.class_flags = {k: v for k, v in cls.__dict__.items() if isinstance(v, int)}
+
+    def __init__(self, value: int = 0, **kwargs):
+        self.value = value
+        self.turned_on: List[str] = [k for k, a in kwargs.items() if a]
+
+        for k, v in self.class_flags.items():
+            if v & value and k not in self.turned_on:
+                self.turned_on.append(k)
+
+        self.calculate_from_turned()
+
+    def calculate_from_turned(self):
+        value = 0
+        for key, flag in self.class_flags.items():
+            if key in self.class_flags:
+                value |= flag
+        self.value = value
+
+    def __getattribute__(self, __name: str) -> Any:
+        original = super().__getattribute__
+        if __name in original("class_flags"):
+            return __name in original("turned_on")
+        return original(__name)
+
+    def __setattr__(self, __name: str, __value: Any) -> None:
+        if __name not in self.class_flags:
+            return super().__setattr__(__name, __value)
+        if __value and __name not in self.turned_on:
+            self.turned_on.append(__name)
+        elif not __value and __name in self.turned_on:
+            self.turned_on.remove(__name)
+        self.calculate_from_turned()
+
+
+PreviousPermissions = type(
+    "PreviousPermissions", (PreviousFlag,), dict(Permissions.class_flags)
+)
+
+# What @everyone has by default in a new guild.
+VALUE = 1071698660929
+
+
+def bench(statement, namespace, number=200000):
+    best = min(repeat(statement, globals=namespace, number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main():
+    before = {"Flag": PreviousPermissions, "perms": PreviousPermissions(VALUE)}
+    after = {"Flag": Permissions, "perms": Permissions(VALUE)}
+
+    for name, before_statement, after_statement in (
+        ("build", "Flag(VALUE)", "Flag(VALUE)"),
+        ("build (cached)", "Flag(VALUE)", "Flag.from_value(VALUE)"),
+        ("check", "perms.send_messages", "perms.send_messages"),
+        ("check (in)", "perms.send_messages", "Flag.send_messages in perms"),
+        ("set", "perms.send_messages = True", "perms.send_messages = True"),
+    ):
+        for namespace in (before, after):
+            namespace["VALUE"] = VALUE
+        old = bench(before_statement, before)
+        new = bench(after_statement, after)
+        print(f"{name:>15}: {old:8.1f} ns -> {new:6.1f} ns ({old / new:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
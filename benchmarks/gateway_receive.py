@@ -0,0 +1,82 @@
+"""Throughput of the gateway receive path: inflate, then parse JSON.
+
+Compares the current :class:`ZlibStreamInflator` + bytes parsing with
+the previous path, which copied every message into a new buffer and
+decoded it to ``str`` before parsing. If ``zstandard`` is installed,
+``zstd-stream`` is measured as well.
+
+Run from the repository root with EpikCord installed (``pip install -e .``)::
+
+    python benchmarks/gateway_receive.py
+"""
+from __future__ import annotations
+
+import zlib
+from importlib.util import find_spec
+from time import perf_counter
+
+from payloads import event_stream, zlib_stream_frames, zstd_stream_frames
+
+from EpikCord.client.compression import (
+    ZLIB_SUFFIX,
+    ZlibStreamInflator,
+    ZstdStreamInflator,
+)
+from EpikCord.client.http_client import json
+
+
+def previous(frames):
+    decompressor = zlib.decompressobj()
+    buffer = bytearray()
+    for frame in frames:
+        buffer.extend(frame)
+        if len(frame) < 4 or frame[-4:] != ZLIB_SUFFIX:
+            continue
+        message = decompressor.decompress(buffer).decode("utf-8")
+        buffer = bytearray()
+        json.loads(message)
+
+
+def receive(inflator_class):
+    def receive(frames):
+        inflator = inflator_class()
+        for frame in frames:
+            message = inflator.feed(frame)
+            if message is not None:
+                json.loads(message)
+
+    receive.__name__ = inflator_class.name
+    return receive
+
+
+def bench(function, frames, size, rounds=15):
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        function(frames)
+        best = min(best, perf_counter() - start)
+    print(
+        f"{function.__name__:>12}: {best * 1000:8.1f} ms, "
+        f"{len(frames) / best:10.0f} msg/s, {size / best / 2**20:7.1f} MiB/s"
+    )
+    return best
+
+
+def main():
+    events = event_stream()
+    frames = zlib_stream_frames(events)
+    size = sum(len(json.dumps(event)) for event in events)
+    print(f"{len(frames)} messages, {size / 2**20:.1f} MiB of JSON")
+    print(f"parser: {json.__name__}")
+
+    before = bench(previous, frames, size)
+    after = bench(receive(ZlibStreamInflator), frames, size)
+    print(f"zlib-stream speedup: {before / after:.2f}x")
+
+    if find_spec("zstandard"):
+        zstd = bench(receive(ZstdStreamInflator), zstd_stream_frames(events), size)
+        print(f"zstd-stream vs zlib-stream: {after / zstd:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Cost of building guilds and messages whose nested fields are decoded lazily.
+
+Each model is built and then read the way most handlers read it, one or two
+top level fields, and then again with every lazy field read as well, which
+is what building it used to cost. Guilds are large GUILD_CREATEs, pass the
+path of a JSON file holding a list of captured GUILD_CREATE payloads to
+measure those instead.
+
+Run from the repository root with EpikCord installed (``pip install -e .``)::
+
+    python benchmarks/lazy_decoding.py [guild_creates.json]
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import sys
+from time import perf_counter
+
+from payloads import guild_create, message_create, user
+
+from EpikCord import Client, Guild, Message
+
+GUILD_LAZY_FIELDS = (
+    "roles",
+    "emojis",
+    "stickers",
+    "voice_states",
+    "members",
+    "channels",
+    "presences",
+    "stage_instances",
+    "guild_scheduled_events",
+)
+
+
+def guild_payloads():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            return json.load(f)
+    return [guild_create(members=5000, channels=500, roles=250) for _ in range(4)]
+
+
+def message_payload():
+    data = message_create()
+    data["mentions"] = [user() for _ in range(3)]
+    data["embeds"] = [
+        {
+            "title": "An embed",
+            "description": "with a description " * 10,
+            "fields": [
+                {"name": f"field {i}", "value": "value", "inline": True}
+                for i in range(5)
+            ],
+        }
+    ]
+    data["edited_timestamp"] = "2022-11-01T12:40:00.000000+00:00"
+    return data
+
+
+def timed(payloads, build, read):
+    # Models modify some of their payload, build each from a fresh copy.
+    payloads = [copy.deepcopy(payload) for payload in payloads]
+    start = perf_counter()
+    for payload in payloads:
+        read(build(payload))
+    return (perf_counter() - start) / len(payloads)
+
+
+def read_all(model, fields):
+    for field in fields:
+        getattr(model, field)
+
+
+async def main():
+    client = Client("token")
+    guilds = guild_payloads()
+    messages = [message_payload() for _ in range(20000)]
+
+    for name, payloads, build, read_some, fields, unit in (
+        (
+            "guild",
+            guilds,
+            lambda data: Guild(client, data),
+            lambda guild: guild.name,
+            GUILD_LAZY_FIELDS,
+            1e3,
+        ),
+        (
+            "message",
+            messages,
+            lambda data: Message(client, data),
+            lambda message: (message.content, message.author),
+            Message._LAZY_FIELDS,
+            1e6,
+        ),
+    ):
+        lazy = timed(payloads, build, read_some)
+        eager = timed(payloads, build, lambda model: read_all(model, fields))
+        label = "ms" if unit == 1e3 else "us"
+        print(
+            f"{name:>8}: {lazy * unit:8.1f} {label} reading one field,"
+            f" {eager * unit:8.1f} {label} reading all ({eager / lazy:.1f}x)"
+        )
+
+    await client.http.session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
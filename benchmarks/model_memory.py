@@ -0,0 +1,67 @@
+"""Memory each cached model takes up: members, messages, channels and guilds.
+
+Builds models from synthetic payloads, lets the payloads go and measures
+what is still allocated with :mod:`tracemalloc`, so it counts everything a
+model keeps alive. Measured with the client keeping raw payloads, the
+default, and without.
+
+Run from the repository root with EpikCord installed (``pip install -e .``)::
+
+    python benchmarks/model_memory.py
+"""
+from __future__ import annotations
+
+import asyncio
+import gc
+import tracemalloc
+
+from payloads import channel, guild_create, member, message_create, snowflake, user
+
+from EpikCord import Client, Guild, GuildMember, GuildTextChannel, Message
+
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    models = [build() for _ in range(count)]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return used / count
+
+
+def read(guild):
+    guild.members, guild.channels, guild.voice_states
+    return guild
+
+
+async def main():
+    guild_id = snowflake()
+    # A user the client has already seen, as in a member of many guilds.
+    known_user = user()
+
+    for keep_payloads in (True, False):
+        client = Client("token", keep_payloads=keep_payloads)
+        print(f"keep_payloads={keep_payloads}")
+
+        for name, build, count in (
+            ("member", lambda: GuildMember(client, member()), 20000),
+            (
+                "known member",
+                lambda: GuildMember(client, {**member(), "user": dict(known_user)}),
+                20000,
+            ),
+            ("message", lambda: Message(client, message_create()), 20000),
+            ("channel", lambda: GuildTextChannel(client, channel(guild_id, 0)), 5000),
+            ("guild", lambda: Guild(client, guild_create()), 50),
+            # As the gateway leaves it, with what feeds the caches built.
+            ("read guild", lambda: read(Guild(client, guild_create())), 50),
+        ):
+            print(f"{name:>12}: {measure(build, count):9.0f} bytes each")
+
+        await client.http.session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+"""Synthetic gateway payloads shaped like the ones Discord sends.
+
+Shared by the benchmarks in this directory. Everything is seeded,
+so every run works on the same data.
+"""
+from __future__ import annotations
+
+import json
+import random
+import zlib
+from typing import Any, Dict, List
+
+_random = random.Random(0)
+
+
+def snowflake() -> str:
+    return str(_random.randrange(10**17, 10**19))
+
+
+def user() -> Dict[str, Any]:
+    return {
+        "id": snowflake(),
+        "username": f"user{_random.randrange(10**6)}",
+        "discriminator": f"{_random.randrange(10000):04}",
+        "avatar": "%032x" % _random.getrandbits(128),
+        "bot": False,
+        "public_flags": _random.choice((0, 64, 128, 256)),
+    }
+
+
+def member() -> Dict[str, Any]:
+    return {
+        "user": user(),
+        "nick": None,
+        "roles": [snowflake() for _ in range(_random.randrange(4))],
+        "joined_at": "2021-05-01T12:34:56.789000+00:00",
+        "premium_since": None,
+        "deaf": False,
+        "mute": False,
+        "pending": False,
+        "communication_disabled_until": None,
+    }
+
+
+def role(position: int) -> Dict[str, Any]:
+    return {
+        "id": snowflake(),
+        "name": f"role {position}",
+        "color": _random.randrange(0xFFFFFF),
+        "hoist": False,
+        "icon": None,
+        "unicode_emoji": None,
+        "position": position,
+        "permissions": str(_random.getrandbits(40)),
+        "managed": False,
+        "mentionable": False,
+    }
+
+
+def channel(guild_id: str, position: int) -> Dict[str, Any]:
+    return {
+        "id": snowflake(),
+        "type": 0,
+        "guild_id": guild_id,
+        "position": position,
+        "permission_overwrites": [
+            {"id": snowflake(), "type": 0, "allow": "1024", "deny": "2048"}
+        ],
+        "name": f"channel-{position}",
+        "topic": "Talk about anything",
+        "nsfw": False,
+        "last_message_id": snowflake(),
+        "rate_limit_per_user": 0,
+        "parent_id": None,
+        "flags": 0,
+    }
+
+
+def guild_create(members: int = 250, channels: int = 50, roles: int = 30):
+    guild_id = snowflake()
+    return {
+        "id": guild_id,
+        "name": "A benchmark guild",
+        "icon": None,
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": snowflake(),
+        "afk_channel_id": None,
+        "afk_timeout": 300,
+        "verification_level": 1,
+        "default_message_notifications": 1,
+        "explicit_content_filter": 2,
+        "roles": [role(i) for i in range(roles)],
+        "emojis": [],
+        "features": ["COMMUNITY", "NEWS"],
+        "mfa_level": 0,
+        "application_id": None,
+        "system_channel_id": None,
+        "system_channel_flags": 0,
+        "rules_channel_id": None,
+        "joined_at": "2021-05-01T12:34:56.789000+00:00",
+        "large": True,
+        "unavailable": False,
+        "member_count": members,
+        "voice_states": [],
+        "members": [member() for _ in range(members)],
+        "channels": [channel(guild_id, i) for i in range(channels)],
+        "threads": [],
+        "presences": [],
+        "max_members": 500000,
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": 1,
+        "premium_subscription_count": 3,
+        "preferred_locale": "en-US",
+        "public_updates_channel_id": None,
+        "nsfw_level": 0,
+        "stickers": [],
+        "premium_progress_bar_enabled": False,
+    }
+
+
+def message_create(guild_id: str = "", channel_id: str = "") -> Dict[str, Any]:
+    author = user()
+    return {
+        "id": snowflake(),
+        "channel_id": channel_id or snowflake(),
+        "guild_id": guild_id or snowflake(),
+        "author": author,
+        "member": {k: v for k, v in member().items() if k != "user"},
+        "content": "hello " * _random.randrange(1, 30),
+        "timestamp": "2022-11-01T12:34:56.789000+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+        "components": [],
+    }
+
+
+def dispatch(event: str, data: Dict[str, Any], sequence: int) -> Dict[str, Any]:
+    return {"op": 0, "t": event, "s": sequence, "d": data}
+
+
+def event_stream(guilds: int = 5, messages: int = 2000) -> List[Dict[str, Any]]:
+    """A READY-less session: some GUILD_CREATEs, then lots of messages."""
+    events = [dispatch("GUILD_CREATE", guild_create(), i + 1) for i in range(guilds)]
+    events.extend(
+        dispatch("MESSAGE_CREATE", message_create(), guilds + i + 1)
+        for i in range(messages)
+    )
+    return events
+
+
+def zlib_stream_frames(events: List[Dict[str, Any]]) -> List[bytes]:
+    """Compresses ``events`` the way a ``zlib-stream`` gateway would,
+    one shared compressor, one sync flush per message."""
+    compressor = zlib.compressobj()
+    return [
+        compressor.compress(json.dumps(event).encode())
+        + compressor.flush(zlib.Z_SYNC_FLUSH)
+        for event in events
+    ]
+
+
+def zstd_stream_frames(events: List[Dict[str, Any]]) -> List[bytes]:
+    """Like :func:`zlib_stream_frames`, for ``zstd-stream``.
+    Requires the ``zstandard`` package."""
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor().compressobj()
+    return [
+        compressor.compress(json.dumps(event).encode())
+        + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        for event in events
+    ]
@@ -0,0 +1,44 @@
+"""Cost of working out a member's permissions in a channel with
+:class:`PermissionResolver`, the first time and once the result is cached.
+
+Run from the repository root with EpikCord installed (``pip install -e .``)::
+
+    python benchmarks/permissions.py
+"""
+from __future__ import annotations
+
+import asyncio
+from timeit import repeat
+
+from payloads import guild_create
+
+from EpikCord import Client
+
+
+def bench(statement, namespace, number=100000):
+    best = min(repeat(statement, globals=namespace, number=number, repeat=5))
+    return best / number * 1e6
+
+
+async def main():
+    client = Client("token")
+    data = guild_create(members=1000, channels=100, roles=100)
+    await client.handle_event("guild_create", data)
+    guild = client.guilds.get(int(data["id"]))
+    namespace = {
+        "resolver": client.permissions,
+        "guild": guild,
+        "member": next(iter(guild.members.values())),
+        "channel": client.channels.get(int(data["channels"][0]["id"])),
+    }
+
+    uncached = bench("resolver.clear(); resolver.resolve(member, channel)", namespace)
+    cached = bench("resolver.resolve(member, channel)", namespace)
+    print(f"uncached: {uncached:6.2f} us")
+    print(f"  cached: {cached:6.2f} us")
+
+    await client.http.session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+import pytest
+
+from EpikCord.managers.cache_manager import CacheManager
+from EpikCord.managers.cache_policy import CachePolicy, LRUPolicy, estimate_size
+
+
+def test_policy_that_cant_evict_rejects_limits():
+    with pytest.raises(ValueError):
+        CachePolicy(max_entries=1)
+    with pytest.raises(ValueError):
+        CachePolicy(max_bytes=1024)
+
+    # Turning caching off doesn't need anything evicted.
+    assert not CacheManager(CachePolicy(max_entries=0)).enabled
+
+
+def test_limit_evicts_on_insert():
+    manager = CacheManager(LRUPolicy(max_entries=1))
+    manager.add_to_cache(1, "a")
+    manager.add_to_cache(2, "b")
+    assert manager.cache == {2: "b"}
+
+
+class Slotted:
+    __slots__ = ("content", "unset")
+
+    def __init__(self, content):
+        self.content = content
+
+
+def test_estimate_size_counts_slot_values():
+    small, large = Slotted("x"), Slotted("x" * 10000)
+    assert estimate_size(large) - estimate_size(small) >= 9999
@@ -0,0 +1,94 @@
+import asyncio
+
+from EpikCord import CacheSnapshot, Client
+
+
+def role(id, name, permissions="0"):
+    return {
+        "id": id,
+        "name": name,
+        "color": 0,
+        "hoist": False,
+        "icon": None,
+        "unicode_emoji": None,
+        "position": 1,
+        "permissions": permissions,
+        "managed": False,
+        "mentionable": False,
+    }
+
+
+def member(id, roles):
+    return {
+        "user": {"id": id, "username": f"user{id}", "discriminator": "0001"},
+        "nick": None,
+        "roles": roles,
+        "joined_at": "2021-05-01T12:34:56+00:00",
+        "deaf": False,
+        "mute": False,
+    }
+
+
+GUILD = {
+    "id": "1",
+    "name": "guild",
+    "icon": None,
+    "splash": None,
+    "discovery_splash": None,
+    "owner_id": "10",
+    "afk_channel_id": None,
+    "afk_timeout": 300,
+    "verification_level": 0,
+    "default_message_notifications": 0,
+    "explicit_content_filter": 0,
+    "roles": [role("1", "@everyone"), role("2", "mod", "8")],
+    "emojis": [],
+    "features": [],
+    "mfa_level": 0,
+    "application_id": None,
+    "system_channel_id": None,
+    "system_channel_flags": 0,
+    "rules_channel_id": None,
+    "unavailable": False,
+    "members": [member("20", ["2"]), member("21", [])],
+    "channels": [],
+    "threads": [],
+    "premium_tier": 0,
+    "preferred_locale": "en-US",
+    "nsfw_level": 0,
+    "stickers": [],
+    "premium_progress_bar_enabled": False,
+}
+
+
+def test_restore_keeps_updates_made_after_guild_create(tmp_path):
+    async def main():
+        snapshot = CacheSnapshot(tmp_path)
+        client = Client("token", 0)
+        await client.handle_event("guild_create", GUILD)
+        await client.handle_event(
+            "guild_role_update", {"guild_id": "1", "role": role("2", "mod", "0")}
+        )
+        await client.handle_event(
+            "guild_role_create", {"guild_id": "1", "role": role("3", "new")}
+        )
+        await client.handle_event(
+            "guild_member_update", {"guild_id": "1", **member("21", ["3"])}
+        )
+        await client.handle_event(
+            "guild_member_remove", {"guild_id": "1", "user": {"id": "20"}}
+        )
+        await snapshot.save(client)
+
+        restored = Client("token", 0)
+        await snapshot.load(restored)
+        guild = restored.guilds.get(1)
+        assert guild.roles.get(2).permissions.value == 0
+        assert guild.roles.get(3).name == "new"
+        assert guild.members.get(20) is None
+        assert guild.members.get(21).role_ids == [3]
+
+        await client.http.session.close()
+        await restored.http.session.close()
+
+    asyncio.run(main())
@@ -0,0 +1,11 @@
+from types import SimpleNamespace
+
+from EpikCord.client.dispatcher import EventDispatcher
+
+
+def test_update_events_are_ordered_when_before_is_missing():
+    after = SimpleNamespace(guild_id=1, channel_id=2)
+
+    assert EventDispatcher(ordering="guild").key_for((None, after)) == 1
+    assert EventDispatcher(ordering="channel").key_for((None, after)) == 2
+    assert EventDispatcher(ordering="guild").key_for((None, None)) is None
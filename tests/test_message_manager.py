@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+from EpikCord.managers import cache_policy
+from EpikCord.managers.cache_policy import TTLPolicy
+from EpikCord.managers.message_manager import MessageManager
+
+
+def message(id, channel_id=1):
+    return SimpleNamespace(id=id, channel_id=channel_id)
+
+
+def test_expired_messages_are_not_returned(monkeypatch):
+    client = SimpleNamespace(cache_policies={"messages": TTLPolicy(10)})
+    messages = MessageManager(client)
+    for id in (10, 11, 12):
+        messages.add_to_cache(id, message(id))
+
+    now = cache_policy.monotonic()
+    monkeypatch.setattr(cache_policy, "monotonic", lambda: now + 60)
+
+    assert messages.channel_messages(1) == []
+    assert messages.before(1, 20) == []
+    assert messages.after(1, 0) == []
+    assert not messages.cache
+
+
+def test_max_per_channel_is_per_manager():
+    client = SimpleNamespace()
+    small, default = MessageManager(client, 2), MessageManager(client)
+    for id in (10, 11, 12):
+        small.add_to_cache(id, message(id))
+        default.add_to_cache(id, message(id))
+
+    assert [m.id for m in small.channel_messages(1)] == [11, 12]
+    assert [m.id for m in default.channel_messages(1)] == [10, 11, 12]
@@ -0,0 +1,47 @@
+import asyncio
+
+from EpikCord.client.http_client import Bucket
+
+HEADERS = {
+    "X-RateLimit-Limit": "2",
+    "X-RateLimit-Remaining": "1",
+    "X-RateLimit-Reset-After": "0.01",
+}
+
+
+def test_failed_requests_hand_their_slot_back():
+    async def main():
+        bucket = Bucket("GET channels/{major}")
+        await bucket.acquire()
+        bucket.update(HEADERS)
+        await asyncio.sleep(0.02)
+
+        # Requests that never got a response, like transport errors or a
+        # global 429, on a bucket whose limits are known.
+        for _ in range(5):
+            await asyncio.wait_for(bucket.acquire(), 1)
+            bucket.update(None)
+
+        await asyncio.wait_for(bucket.acquire(), 1)
+        assert bucket.remaining == bucket.limit - 1
+
+    asyncio.run(main())
+
+
+def test_responses_without_limits_hand_their_slot_back():
+    async def main():
+        bucket = Bucket("GET channels/{major}")
+        await bucket.acquire()
+        bucket.update(HEADERS)
+        await asyncio.sleep(0.02)
+
+        # Like an error page from Cloudflare, which has no rate limit headers.
+        for _ in range(5):
+            await asyncio.wait_for(bucket.acquire(), 1)
+            bucket.update({"Content-Type": "text/html"})
+
+        await asyncio.wait_for(bucket.acquire(), 1)
+        assert not bucket.unlimited
+        assert bucket.remaining == bucket.limit - 1
+
+    asyncio.run(main())